@@ -2,6 +2,6 @@
 SQL Database Client for BODs
 """
 
-from .client import PostgresSettings, SqlDB
+from .client import PoolStats, PostgresSettings, SqlDB
 
-__all__ = ["PostgresSettings", "SqlDB"]
+__all__ = ["PoolStats", "PostgresSettings", "SqlDB"]
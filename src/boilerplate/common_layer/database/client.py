@@ -3,16 +3,19 @@ SQL Alchemy BODs Database Client
 """
 
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Callable, Generator
+from time import perf_counter
+from typing import Any, Callable, Generator
 from urllib.parse import quote_plus
 
 import boto3
 from pydantic import BaseModel, Field
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.orm import Session, sessionmaker
 from structlog.stdlib import get_logger
 
@@ -65,6 +68,23 @@ class PostgresSettings(BaseSettings):
         description="Application name for database connections",
         validation_alias="AWS_LAMBDA_FUNCTION_NAME",
     )
+    POSTGRES_POOL_SIZE: int = Field(
+        default=5, description="Connections kept open in the pool", ge=1
+    )
+    POSTGRES_MAX_OVERFLOW: int = Field(
+        default=10, description="Extra connections allowed above the pool size", ge=0
+    )
+    POSTGRES_POOL_TIMEOUT_SECONDS: float = Field(
+        default=30, description="Seconds to wait for a pooled connection", gt=0
+    )
+    POSTGRES_POOL_RECYCLE_SECONDS: int = Field(
+        default=1800,
+        description="Replace pooled connections older than this, -1 disables",
+        ge=-1,
+    )
+    POSTGRES_POOL_PRE_PING: bool = Field(
+        default=True, description="Test pooled connections before use"
+    )
 
     @property
     def use_iam_auth(self) -> bool:
@@ -123,6 +143,27 @@ class DatabaseSettings(BaseModel):
     postgres: PostgresSettings
 
 
+@dataclass
+class PoolStats:
+    """
+    Connection pool usage for a SqlDB
+    """
+
+    checkouts: int = 0
+    checkout_wait_seconds: float = 0.0
+    max_checkout_wait_seconds: float = 0.0
+    connects: int = 0
+    token_refreshes: int = 0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        """Add the time spent waiting for a connection"""
+        self.checkouts += 1
+        self.checkout_wait_seconds += wait_seconds
+        self.max_checkout_wait_seconds = max(
+            self.max_checkout_wait_seconds, wait_seconds
+        )
+
+
 class SqlDB:
     """Manages database connections and sessions using SQLAlchemy."""
 
@@ -140,11 +181,17 @@ class SqlDB:
         self._token_expiration: datetime | None = None
         self._refresh_token_threshold = timedelta(seconds=30)
         self._token_lifetime = timedelta(minutes=15)
+        self._iam_token: str | None = None
+        self._unit_of_work_session: Session | None = None
+        self.pool_stats = PoolStats()
 
     @property
     def engine(self) -> Engine:
-        """Returns existing engine or creates new one if token expired."""
-        if self._should_refresh_token():
+        """
+        Returns the engine, creating it on first use
+        IAM tokens are refreshed per connection so the engine and pool are reused
+        """
+        if self._engine is None:
             self._initialize_engine()
         if not self._engine:
             raise RuntimeError("Database Engine initialization failed")
@@ -152,12 +199,23 @@ class SqlDB:
 
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
-        """Provides transactional scope around operations."""
+        """
+        Provides transactional scope around operations.
+        Inside a unit of work the shared session is flushed instead of committed
+        """
+        if self._unit_of_work_session is not None:
+            yield self._unit_of_work_session
+            self._unit_of_work_session.flush()
+            return
+
         if not self._session_factory:
             self._session_factory = sessionmaker(bind=self.engine)
 
         session = self._session_factory()
         try:
+            started = perf_counter()
+            session.connection()
+            self.pool_stats.record_checkout(perf_counter() - started)
             yield session
             session.commit()
         except Exception:
@@ -166,38 +224,90 @@ class SqlDB:
         finally:
             session.close()
 
+    @contextmanager
+    def unit_of_work(self) -> Generator[Session, None, None]:
+        """
+        Share one session and transaction between every session_scope inside it
+        Commits once on exit and rolls everything back on error
+        Nested units of work join the outer one
+        """
+        if self._unit_of_work_session is not None:
+            yield self._unit_of_work_session
+            return
+
+        with self.session_scope() as session:
+            self._unit_of_work_session = session
+            try:
+                yield session
+            finally:
+                self._unit_of_work_session = None
+
     def _initialize_engine(self) -> None:
         """Initializes SQLAlchemy engine with connection details."""
         try:
+            postgres = self._settings.postgres
             iam_token = None
-            if (
-                self.backend == DatabaseBackend.POSTGRESQL
-                and self._settings.postgres.use_iam_auth
-            ):
-                iam_token = self._generate_rds_iam_token()
-                if not iam_token:
-                    raise ValueError("Failed to generate IAM token")
-
-            connection_url = self._settings.postgres.get_connection_url(iam_token)
-
-            self._engine = create_engine(connection_url)
-
-            if self.backend == DatabaseBackend.POSTGRESQL:
-                self._token_expiration = datetime.now() + self._token_lifetime
-            else:
-                self._token_expiration = datetime.max
+            if self._uses_iam_auth:
+                iam_token = quote_plus(self._get_iam_token())
+
+            connection_url = postgres.get_connection_url(iam_token)
+
+            self._engine = create_engine(
+                connection_url,
+                pool_size=postgres.POSTGRES_POOL_SIZE,
+                max_overflow=postgres.POSTGRES_MAX_OVERFLOW,
+                pool_timeout=postgres.POSTGRES_POOL_TIMEOUT_SECONDS,
+                pool_recycle=postgres.POSTGRES_POOL_RECYCLE_SECONDS,
+                pool_pre_ping=postgres.POSTGRES_POOL_PRE_PING,
+            )
+            event.listen(self._engine, "do_connect", self._on_connect)
 
             logger.info(
                 "Database engine initialized successfully",
                 backend=self.backend,
+                pool_size=postgres.POSTGRES_POOL_SIZE,
+                max_overflow=postgres.POSTGRES_MAX_OVERFLOW,
+                pool_recycle=postgres.POSTGRES_POOL_RECYCLE_SECONDS,
+                pool_pre_ping=postgres.POSTGRES_POOL_PRE_PING,
             )
         except Exception:
             logger.exception("Failed to initialize SQLAlchemy engine")
             raise
 
+    @property
+    def _uses_iam_auth(self) -> bool:
+        return (
+            self.backend == DatabaseBackend.POSTGRESQL
+            and self._settings.postgres.use_iam_auth
+        )
+
+    def _on_connect(
+        self,
+        _dialect: Dialect,
+        _conn_rec: Any,
+        _cargs: tuple[Any, ...],
+        cparams: dict[str, Any],
+    ) -> None:
+        """
+        do_connect hook: every new DBAPI connection uses a current IAM token
+        """
+        self.pool_stats.connects += 1
+        if self._uses_iam_auth:
+            cparams["password"] = self._get_iam_token()
+
+    def _get_iam_token(self) -> str:
+        """Returns the cached IAM token, generating a new one when near expiry"""
+        if self._iam_token is None or self._should_refresh_token():
+            self._iam_token = self._generate_rds_iam_token()
+            if not self._iam_token:
+                raise ValueError("Failed to generate IAM token")
+            self._token_expiration = datetime.now() + self._token_lifetime
+            self.pool_stats.token_refreshes += 1
+        return self._iam_token
+
     def _should_refresh_token(self) -> bool:
         """Determines if IAM token needs refresh."""
-        if not self._engine or not self._token_expiration:
+        if not self._token_expiration:
             return True
         return datetime.now() >= (
             self._token_expiration - self._refresh_token_threshold
@@ -225,7 +335,7 @@ class SqlDB:
                 DBUsername=user,
                 Port=port,
             )
-            return quote_plus(token)
+            return token
         except Exception:
             logger.exception("Failed to generate IAM auth token")
             raise
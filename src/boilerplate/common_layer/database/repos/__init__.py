@@ -40,6 +40,9 @@ from .repo_organisation import (
 )
 from .repo_otc import OtcServiceRepo
 from .repo_transmodel import (
+    BANK_HOLIDAY_INDEX,
+    BankHolidayIndex,
+    BankHolidayIndexCache,
     TransmodelBankHolidaysRepo,
     TransmodelServicePatternDistanceRepo,
     TransmodelServicePatternRepo,
@@ -48,6 +51,7 @@ from .repo_transmodel import (
     TransmodelStopActivityRepo,
     TransmodelTrackRepo,
 )
+from .repo_transmodel_clone import TransmodelFileCloneRepo
 from .repo_transmodel_flexible import (
     TransmodelBookingArrangementsRepo,
     TransmodelFlexibleServiceOperationPeriodRepo,
@@ -103,6 +107,9 @@ __all__ = [
     # Otc
     "OtcServiceRepo",
     # Transmodel
+    "BANK_HOLIDAY_INDEX",
+    "BankHolidayIndex",
+    "BankHolidayIndexCache",
     "TransmodelBankHolidaysRepo",
     "TransmodelServicePatternRepo",
     "TransmodelServicePatternDistanceRepo",
@@ -111,6 +118,7 @@ __all__ = [
     "TransmodelStopActivityRepo",
     "TransmodelTracksVehicleJourneyRepo",
     "TransmodelTrackRepo",
+    "TransmodelFileCloneRepo",
     # Transmodel Flexible
     "TransmodelBookingArrangementsRepo",
     "TransmodelFlexibleServiceOperationPeriodRepo",
@@ -2,7 +2,12 @@
 Instead of having try/except blocks for each repo call, define a decorator to handle it
 """
 
+import csv
+from datetime import date, datetime, time
+from enum import Enum
+from io import StringIO
 from typing import (
+    Any,
     Callable,
     Generic,
     Protocol,
@@ -13,7 +18,8 @@ from typing import (
     runtime_checkable,
 )
 
-from sqlalchemy import Column, Select, Table, delete, select
+from sqlalchemy import Column, Dialect, Select, Table, delete, insert, inspect, select
+from sqlalchemy.orm import make_transient_to_detached
 from structlog.stdlib import get_logger
 
 from ..client import SqlDB
@@ -25,6 +31,93 @@ logger = get_logger()
 
 DBModelT = TypeVar("DBModelT", bound=BaseSQLModel)
 
+COPY_NULL = "\\N"
+
+
+def get_column_values(record: BaseSQLModel) -> dict[str, Any]:
+    """
+    Column attribute values set on a record, excluding unset primary keys
+    """
+    mapper = inspect(type(record))
+    state_dict = inspect(record).dict
+    return {
+        attr.key: state_dict[attr.key]
+        for attr in mapper.column_attrs
+        if attr.key in state_dict
+        and not (state_dict[attr.key] is None and attr.columns[0].primary_key)
+    }
+
+
+def get_copy_column_keys(records: Sequence[BaseSQLModel]) -> set[str]:
+    """
+    Column attributes set on the records, which must be the same for every record
+    COPY takes one column list so a primary key set on only some records would
+    be written as NULL or dropped
+    """
+    keys = get_column_values(records[0]).keys()
+    for record in records[1:]:
+        record_keys = get_column_values(record).keys()
+        if record_keys != keys:
+            raise ValueError(
+                "Records set different columns for COPY: "
+                f"{sorted(keys ^ record_keys)}"
+            )
+    return set(keys)
+
+
+def format_copy_array_element(value: Any) -> str:
+    """
+    Quote a value inside a PostgreSQL array literal
+    """
+    if value is None:
+        return "NULL"
+    escaped = format_copy_value(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def format_copy_value(value: Any) -> str:
+    """
+    Format a bound python value as PostgreSQL COPY csv text
+    """
+    match value:
+        case None:
+            return COPY_NULL
+        case bool():
+            return "t" if value else "f"
+        case Enum():
+            return format_copy_value(value.value)
+        case date() | datetime() | time():
+            return value.isoformat()
+        case list() | tuple():
+            elements = (format_copy_array_element(element) for element in value)
+            return "{" + ",".join(elements) + "}"
+    return str(value)
+
+
+def build_copy_buffer(
+    records: Sequence[BaseSQLModel], columns: list[Column[Any]], dialect: Dialect
+) -> StringIO:
+    """
+    Write records as csv for COPY FROM STDIN
+    Values go through each column type's bind processor (Enums, JSON, Geometry)
+    """
+    processors = [column.type.bind_processor(dialect) for column in columns]
+    mapper = inspect(type(records[0]))
+    keys = [mapper.get_property_by_column(column).key for column in columns]
+
+    buffer = StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for record in records:
+        row: list[str] = []
+        for key, processor in zip(keys, processors):
+            value = getattr(record, key)
+            if processor is not None and value is not None:
+                value = processor(value)
+            row.append(format_copy_value(value))
+        writer.writerow(row)
+    buffer.seek(0)
+    return buffer
+
 
 @runtime_checkable
 class HasId(Protocol):
@@ -163,18 +256,68 @@ class BaseRepository(Generic[DBModelT]):
     def bulk_insert(self, records: list[DBModelT]) -> list[DBModelT]:
         """
         Insert multiple records and return them with generated IDs
-        flush() may be needed to ensure IDs are generated
+        A single INSERT .. RETURNING is sent with the rows batched by insertmanyvalues
+        instead of flushing each object through the unit of work
         """
         self._log.debug("Bulk inserting records", record_count=len(records))
+        if not records:
+            return []
+
+        mapper = inspect(self._model)
+        primary_keys = [
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        ]
         with self._db.session_scope() as session:
-            for record in records:
-                session.add(record)
-            session.flush()
-            results = list(records)
-            for result in results:
-                session.expunge(result)
-            self._log.debug("Bulk inserting completed", inserted_count=len(results))
-            return results
+            statement = insert(self._model).returning(
+                *mapper.primary_key, sort_by_parameter_order=True
+            )
+            rows = session.execute(
+                statement, [get_column_values(record) for record in records]
+            ).all()
+            for record, row in zip(records, rows):
+                for key, value in zip(primary_keys, row):
+                    setattr(record, key, value)
+                make_transient_to_detached(record)
+            self._log.debug("Bulk inserting completed", inserted_count=len(rows))
+            return list(records)
+
+    @handle_repository_errors
+    def bulk_insert_copy(self, records: Sequence[DBModelT]) -> int:
+        """
+        Stream records into the table with PostgreSQL COPY FROM STDIN
+        Generated IDs are not returned so only use it where they aren't needed
+        Returns the number of rows copied
+        """
+        self._log.debug("Copying records", record_count=len(records))
+        if not records:
+            return 0
+
+        mapper = inspect(self._model)
+        table = cast(Table, mapper.local_table)
+        keys = get_copy_column_keys(records)
+        columns = [
+            column
+            for column in table.columns
+            if mapper.get_property_by_column(column).key in keys
+        ]
+
+        with self._db.session_scope() as session:
+            connection = session.connection()
+            preparer = connection.dialect.identifier_preparer
+            column_names = ", ".join(preparer.quote(column.name) for column in columns)
+            buffer = build_copy_buffer(records, columns, connection.dialect)
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(  # type: ignore[attr-defined]
+                    f"COPY {preparer.format_table(table)} ({column_names}) "
+                    f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                    buffer,
+                )
+                row_count: int = cursor.rowcount
+            finally:
+                cursor.close()
+        self._log.debug("Copying records completed", copied_count=row_count)
+        return row_count
 
 
 class BaseRepositoryWithId(BaseRepository[DBModelT]):
@@ -3,8 +3,11 @@ Transmodel table repos
 """
 
 import json
+import time
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import date
+from threading import Lock
 from typing import Iterator, Literal
 
 from sqlalchemy import func, select, text, tuple_
@@ -27,6 +30,10 @@ from .repo_common import BaseRepository, BaseRepositoryWithId
 
 log = get_logger()
 
+BankHolidayDivision = Literal["england-and-wales", "scotland"]
+BankHolidayLookupKey = tuple[date, date | None, tuple[BankHolidayDivision, ...]]
+BANK_HOLIDAY_INDEX_TTL_SECONDS = 3600
+
 
 class TransmodelServiceRepo(BaseRepositoryWithId[TransmodelService]):
     """
@@ -165,7 +172,7 @@ class TransmodelBankHolidaysRepo(BaseRepository[TransmodelBankHolidays]):
         self,
         start_date: date,
         end_date: date | None = None,
-        divisions: list[Literal["england-and-wales", "scotland"]] | None = None,
+        divisions: list[BankHolidayDivision] | None = None,
     ) -> list[TransmodelBankHolidays]:
         """
         Get bank holidays from a start date, with optional end date
@@ -188,7 +195,7 @@ class TransmodelBankHolidaysRepo(BaseRepository[TransmodelBankHolidays]):
         self,
         start_date: date,
         end_date: date | None = None,
-        divisions: list[Literal["england-and-wales", "scotland"]] | None = None,
+        divisions: list[BankHolidayDivision] | None = None,
     ) -> dict[str, list[date]]:
         """
         Get bank holidays organized by txc_element
@@ -206,6 +213,89 @@ class TransmodelBankHolidaysRepo(BaseRepository[TransmodelBankHolidays]):
         return dict(holiday_lookup)
 
 
+class BankHolidayIndex:
+    """
+    In memory index of the Bank Holidays table
+    Sorted by date so ranges are found by bisection
+    """
+
+    def __init__(self, holidays: list[TransmodelBankHolidays]):
+        self._holidays = sorted(holidays, key=lambda holiday: holiday.date)
+        self._dates = [holiday.date for holiday in self._holidays]
+        self._lookups: dict[BankHolidayLookupKey, dict[str, list[date]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._holidays)
+
+    def get_bank_holidays_lookup(
+        self,
+        start_date: date,
+        end_date: date | None = None,
+        divisions: list[BankHolidayDivision] | None = None,
+    ) -> dict[str, list[date]]:
+        """
+        Bank holidays in the range organized by txc_element
+        Same result as TransmodelBankHolidaysRepo.get_bank_holidays_lookup
+        Memoised per range as Services share their date ranges
+        The returned lookup is shared so must not be modified
+        """
+        key: BankHolidayLookupKey = (start_date, end_date, tuple(divisions or ()))
+        lookup = self._lookups.get(key)
+        if lookup is not None:
+            return lookup
+
+        start = bisect_left(self._dates, start_date)
+        end = (
+            len(self._dates)
+            if end_date is None
+            else bisect_right(self._dates, end_date, lo=start)
+        )
+        holiday_lookup: dict[str, list[date]] = defaultdict(list)
+        for holiday in self._holidays[start:end]:
+            if divisions and holiday.division not in divisions:
+                continue
+            holiday_lookup[holiday.txc_element].append(holiday.date)
+
+        lookup = dict(holiday_lookup)
+        self._lookups[key] = lookup
+        return lookup
+
+
+class BankHolidayIndexCache:
+    """
+    Process wide Bank Holiday index so a warm Lambda loads the table once
+    Reloaded from the DB after ttl_seconds
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._index: BankHolidayIndex | None = None
+        self._expires_at = 0.0
+        self._lock = Lock()
+
+    def get(self, db: SqlDB) -> BankHolidayIndex:
+        """
+        Get the index, loading all Bank Holidays if missing or expired
+        """
+        with self._lock:
+            if self._index is None or self._expires_at <= time.monotonic():
+                self._index = BankHolidayIndex(TransmodelBankHolidaysRepo(db).get_all())
+                self._expires_at = time.monotonic() + self.ttl_seconds
+                log.info("Loaded Bank Holiday index", bank_holidays=len(self._index))
+            return self._index
+
+    def clear(self) -> None:
+        """
+        Drop the index so the next get reloads it
+        """
+        with self._lock:
+            self._index = None
+            self._expires_at = 0.0
+
+
+BANK_HOLIDAY_INDEX = BankHolidayIndexCache(BANK_HOLIDAY_INDEX_TTL_SECONDS)
+
+
 class TransmodelTrackRepo(BaseRepositoryWithId[TransmodelTracks]):
     """Repository for managing Track entities"""
 
@@ -0,0 +1,342 @@
+"""
+Clone the Transmodel data loaded from a TXC File into another revision
+"""
+
+from typing import Any, Callable
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Select,
+    Table,
+    func,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from ..client import SqlDB
+from ..models import (
+    NaptanStopPoint,
+    TransmodelBookingArrangements,
+    TransmodelFlexibleServiceOperationPeriod,
+    TransmodelNonOperatingDatesExceptions,
+    TransmodelOperatingDatesExceptions,
+    TransmodelOperatingProfile,
+    TransmodelService,
+    TransmodelServicedOrganisationVehicleJourney,
+    TransmodelServicedOrganisationWorkingDays,
+    TransmodelServicePattern,
+    TransmodelServicePatternAdminAreas,
+    TransmodelServicePatternDistance,
+    TransmodelServicePatternLocality,
+    TransmodelServicePatternStop,
+    TransmodelServicePatternTracks,
+    TransmodelServiceServicePattern,
+    TransmodelTracksVehicleJourney,
+    TransmodelVehicleJourney,
+)
+from ..models.common import BaseSQLModel
+from .operation_decorator import handle_repository_errors
+from .repo_common import BaseRepositoryWithId
+
+# Set to the time of the clone rather than copied from the source row
+TIMESTAMP_COLUMNS = frozenset(["created", "last_updated", "modified"])
+
+
+def create_id_map(
+    session: Session, name: str, model: type[BaseSQLModel], ids: Select[Any]
+) -> Table:
+    """
+    Temporary table mapping each selected id to a new id from the model's sequence
+    Dropped when the transaction commits
+    """
+    id_map = Table(
+        name,
+        MetaData(),
+        Column("old_id", Integer, primary_key=True, autoincrement=False),
+        Column("new_id", Integer, nullable=False),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+    connection = session.connection()
+    id_map.drop(connection, checkfirst=True)
+    id_map.create(connection)
+
+    source = ids.subquery()
+    sequence = func.pg_get_serial_sequence(model.__tablename__, "id")
+    session.execute(
+        insert(id_map).from_select(
+            ["old_id", "new_id"],
+            select(source.c[0], func.nextval(sequence)),
+        )
+    )
+    return id_map
+
+
+def copy_rows(
+    session: Session,
+    model: type[BaseSQLModel],
+    parent_column: str,
+    parent_map: Table,
+    remaps: dict[str, Table] | None = None,
+    values: dict[str, Any] | None = None,
+    derived: dict[str, Callable[[Table], Any]] | None = None,
+) -> int:
+    """
+    INSERT ... SELECT the rows whose parent_column is in parent_map
+    The parent and remapped columns take the new ids, values overwrite columns
+    and derived columns are built from the source table, e.g. a lookup
+    Other ids are generated by the table's sequence, timestamps are set to now
+    """
+    remaps = remaps or {}
+    values = values or {}
+    derived = derived or {}
+    table: Table = model.__table__  # type: ignore[assignment]
+    parent = parent_map.alias("parent")
+    source = table.join(parent, table.c[parent_column] == parent.c.old_id)
+    remap_aliases: dict[str, Any] = {}
+    for column_name, id_map in remaps.items():
+        alias = id_map.alias(f"remap_{column_name}")
+        source = source.outerjoin(alias, table.c[column_name] == alias.c.old_id)
+        remap_aliases[column_name] = alias
+
+    column_names: list[str] = []
+    selected: list[Any] = []
+    for column in table.columns:
+        if column.name == parent_column:
+            selected.append(parent.c.new_id)
+        elif column.name in remap_aliases:
+            selected.append(remap_aliases[column.name].c.new_id)
+        elif column.name in values:
+            selected.append(literal(values[column.name], column.type))
+        elif column.name in derived:
+            selected.append(derived[column.name](table))
+        elif column.name in TIMESTAMP_COLUMNS:
+            selected.append(func.now())
+        elif column.primary_key:
+            continue
+        else:
+            selected.append(column)
+        column_names.append(column.name)
+
+    result = session.execute(
+        insert(table).from_select(column_names, select(*selected).select_from(source))
+    )
+    return result.rowcount  # type: ignore[attr-defined]
+
+
+def naptan_stop_id(table: Table) -> Any:
+    """
+    NaPTAN StopPoint id for the row's ATCO code in the current NaPTAN data
+    """
+    return (
+        select(NaptanStopPoint.id)
+        .where(NaptanStopPoint.atco_code == table.c.atco_code)
+        .scalar_subquery()
+    )
+
+
+def insert_pattern_naptan_links(
+    session: Session,
+    model: type[BaseSQLModel],
+    link_column: str,
+    naptan_column: Any,
+    pattern_map: Table,
+) -> int:
+    """
+    Link each new Service Pattern to the distinct NaPTAN values of its stops
+    Uses the current NaPTAN data as the ETL would, rather than copying the source
+    """
+    table: Table = model.__table__  # type: ignore[assignment]
+    pattern_stop: Table = TransmodelServicePatternStop.__table__  # type: ignore
+    naptan_stop: Table = NaptanStopPoint.__table__  # type: ignore[assignment]
+    links = (
+        select(pattern_map.c.new_id, naptan_column)
+        .distinct()
+        .select_from(
+            pattern_stop.join(
+                pattern_map, pattern_stop.c.service_pattern_id == pattern_map.c.old_id
+            ).join(naptan_stop, naptan_stop.c.atco_code == pattern_stop.c.atco_code)
+        )
+        .where(naptan_column.is_not(None))
+    )
+    result = session.execute(
+        insert(table).from_select(["servicepattern_id", link_column], links)
+    )
+    return result.rowcount  # type: ignore[attr-defined]
+
+
+class TransmodelFileCloneRepo(BaseRepositoryWithId[TransmodelService]):
+    """
+    Copies the Services, Service Patterns and Vehicle Journeys of a TXC File
+    Uses set based INSERT ... SELECT so no rows are loaded into the Lambda
+    Rows from NaPTAN (stop ids, localities and admin areas) are derived again
+    Bank holiday dates in the date exceptions are copied as they were loaded,
+    so a change to the bank holidays needs the full ETL to be picked up
+    """
+
+    def __init__(self, db: SqlDB):
+        super().__init__(db, TransmodelService)
+
+    @handle_repository_errors
+    def count_service_patterns(self, txc_file_attributes_id: int) -> int:
+        """
+        Count the Service Patterns loaded from a TXC File
+        Superseded files only have Services
+        """
+        statement = (
+            select(func.count(TransmodelServiceServicePattern.servicepattern_id))
+            .join(
+                TransmodelService,
+                TransmodelServiceServicePattern.service_id == TransmodelService.id,
+            )
+            .where(TransmodelService.txcfileattributes_id == txc_file_attributes_id)
+        )
+        with self._db.session_scope() as session:
+            return session.execute(statement).scalar_one()
+
+    @handle_repository_errors
+    def clone_file(
+        self,
+        source_file_attributes_id: int,
+        revision_id: int,
+        txc_file_attributes_id: int,
+    ) -> dict[str, int]:
+        """
+        Clone the rows loaded from a TXC File into a revision and its file attributes
+        Returns the number of rows inserted per table
+        Tracks and Serviced Organisations are shared so are linked rather than copied
+        """
+        counts: dict[str, int] = {}
+
+        def copy(model: type[BaseSQLModel], *args: Any, **kwargs: Any) -> None:
+            counts[model.__tablename__] = copy_rows(session, model, *args, **kwargs)
+
+        with self._db.session_scope() as session:
+            service_map = create_id_map(
+                session,
+                "clone_service",
+                TransmodelService,
+                select(TransmodelService.id).where(
+                    TransmodelService.txcfileattributes_id == source_file_attributes_id
+                ),
+            )
+            copy(
+                TransmodelService,
+                "id",
+                service_map,
+                values={
+                    "revision_id": revision_id,
+                    "txcfileattributes_id": txc_file_attributes_id,
+                },
+            )
+            copy(TransmodelBookingArrangements, "service_id", service_map)
+
+            pattern_map = create_id_map(
+                session,
+                "clone_servicepattern",
+                TransmodelServicePattern,
+                select(TransmodelServiceServicePattern.servicepattern_id)
+                .distinct()
+                .join(
+                    service_map,
+                    TransmodelServiceServicePattern.service_id == service_map.c.old_id,
+                ),
+            )
+            copy(
+                TransmodelServicePattern,
+                "id",
+                pattern_map,
+                values={"revision_id": revision_id},
+            )
+            copy(
+                TransmodelServiceServicePattern,
+                "service_id",
+                service_map,
+                remaps={"servicepattern_id": pattern_map},
+            )
+            counts[TransmodelServicePatternAdminAreas.__tablename__] = (
+                insert_pattern_naptan_links(
+                    session,
+                    TransmodelServicePatternAdminAreas,
+                    "adminarea_id",
+                    NaptanStopPoint.admin_area_id,
+                    pattern_map,
+                )
+            )
+            counts[TransmodelServicePatternLocality.__tablename__] = (
+                insert_pattern_naptan_links(
+                    session,
+                    TransmodelServicePatternLocality,
+                    "locality_id",
+                    NaptanStopPoint.locality_id,
+                    pattern_map,
+                )
+            )
+            copy(TransmodelServicePatternDistance, "service_pattern_id", pattern_map)
+            copy(TransmodelServicePatternTracks, "service_pattern_id", pattern_map)
+
+            journey_map = create_id_map(
+                session,
+                "clone_vehiclejourney",
+                TransmodelVehicleJourney,
+                select(TransmodelVehicleJourney.id).join(
+                    pattern_map,
+                    TransmodelVehicleJourney.service_pattern_id == pattern_map.c.old_id,
+                ),
+            )
+            copy(
+                TransmodelVehicleJourney,
+                "service_pattern_id",
+                pattern_map,
+                remaps={"id": journey_map},
+            )
+            copy(
+                TransmodelServicePatternStop,
+                "service_pattern_id",
+                pattern_map,
+                remaps={"vehicle_journey_id": journey_map},
+                derived={"naptan_stop_id": naptan_stop_id},
+            )
+            for model in (
+                TransmodelOperatingProfile,
+                TransmodelOperatingDatesExceptions,
+                TransmodelNonOperatingDatesExceptions,
+                TransmodelFlexibleServiceOperationPeriod,
+                TransmodelTracksVehicleJourney,
+            ):
+                copy(model, "vehicle_journey_id", journey_map)
+
+            serviced_org_journey_map = create_id_map(
+                session,
+                "clone_servicedorganisationvehiclejourney",
+                TransmodelServicedOrganisationVehicleJourney,
+                select(TransmodelServicedOrganisationVehicleJourney.id).join(
+                    journey_map,
+                    TransmodelServicedOrganisationVehicleJourney.vehicle_journey_id
+                    == journey_map.c.old_id,
+                ),
+            )
+            copy(
+                TransmodelServicedOrganisationVehicleJourney,
+                "vehicle_journey_id",
+                journey_map,
+                remaps={"id": serviced_org_journey_map},
+            )
+            copy(
+                TransmodelServicedOrganisationWorkingDays,
+                "serviced_organisation_vehicle_journey_id",
+                serviced_org_journey_map,
+            )
+
+        self._log.info(
+            "Cloned TXC File Transmodel data",
+            source_file_attributes_id=source_file_attributes_id,
+            revision_id=revision_id,
+            txc_file_attributes_id=txc_file_attributes_id,
+            counts=counts,
+        )
+        return counts
@@ -2,12 +2,16 @@
 Downloader functions
 """
 
+from io import BytesIO
+
 from common_layer.s3 import S3
+from common_layer.txc_artifact import TXCArtifactSettings, get_txc_data_from_artifact
 from common_layer.xml.txc.models import TXCData
 from common_layer.xml.txc.parser.parser_txc import (
     TXCParserConfig,
     load_xml_data,
     parse_txc_from_element,
+    parse_txc_streaming,
 )
 from common_layer.xml.utils.hashing import get_bytes_hash
 from lxml.etree import _Element  # type: ignore
@@ -16,16 +20,25 @@ from structlog.stdlib import get_logger
 log = get_logger()
 
 
-def get_txc_xml(s3_bucket_name: str, s3_file_key: str) -> tuple[_Element, str]:
+def get_txc_bytes(s3_bucket_name: str, s3_file_key: str) -> tuple[BytesIO, str]:
     """
-    Download XML from S3, Calculate hash, and parse as lxml _Element
-    Returns tuple of xml data and hash string
+    Download XML from S3 and Calculate hash
+    Returns tuple of file data and hash string
     """
     s3_client = S3(s3_bucket_name)
     file_data = s3_client.download_fileobj(s3_file_key)
     file_hash = get_bytes_hash(file_data)
     log.info("Downloaded S3 data", bucket=s3_bucket_name, key=s3_file_key)
-    xml = load_xml_data(file_data)
+    return file_data, file_hash
+
+
+def get_txc_xml(s3_bucket_name: str, s3_file_key: str) -> tuple[_Element, str]:
+    """
+    Download XML from S3, Calculate hash, and parse as lxml _Element
+    Returns tuple of xml data and hash string
+    """
+    file_data, file_hash = get_txc_bytes(s3_bucket_name, s3_file_key)
+    xml = load_xml_data(file_data, strip_namespaces=False)
     log.info("Parsed XML data")
     return xml, file_hash
 
@@ -35,10 +48,19 @@ def download_and_parse_txc(
 ) -> TXCData:
     """
     Download from S3 and return Pydantic model of TXC Data to process
+    With the artifact cache enabled the TXCData is loaded from an earlier stage
     """
-    xml_data, file_hash = get_txc_xml(s3_bucket, s3_key)
-
-    txc_data = parse_txc_from_element(xml_data, txc_parser_config)
+    if TXCArtifactSettings().TXC_ARTIFACT_CACHE_ENABLED:
+        file_data, file_hash = get_txc_bytes(s3_bucket, s3_key)
+        return get_txc_data_from_artifact(
+            S3(s3_bucket), s3_key, file_data, file_hash, txc_parser_config
+        )
+    if txc_parser_config and txc_parser_config.streaming:
+        file_data, file_hash = get_txc_bytes(s3_bucket, s3_key)
+        txc_data = parse_txc_streaming(file_data, txc_parser_config)
+    else:
+        xml_data, file_hash = get_txc_xml(s3_bucket, s3_key)
+        txc_data = parse_txc_from_element(xml_data, txc_parser_config)
     if file_hash and txc_data.Metadata:
         txc_data.Metadata.FileHash = file_hash
     log.info("Parsed TXC XML into Pydantic Models")
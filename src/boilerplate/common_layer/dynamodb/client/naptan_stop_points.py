@@ -2,8 +2,16 @@
 DynamoDB NAPTAN StopPoint Client
 """
 
-from typing import Iterator, Set
-
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, Iterator, TypeVar
+
+from botocore.exceptions import ClientError
 from common_layer.xml.txc.models import TXCStopPoint
 from pydantic import ValidationError
 from structlog.stdlib import get_logger
@@ -14,6 +22,117 @@ from .settings import DynamoDBSettings, NaptanDynamoDBSettings
 
 log = get_logger()
 
+THROTTLING_ERROR_CODES = {
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "ThrottlingException",
+}
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 2.0
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class StopPointCacheStats:
+    """
+    Hits and misses against the in memory StopPoint cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class RequestStats:
+    """
+    Throttling and retries across BatchGetItem and Query requests
+    """
+
+    requests: int = 0
+    throttled_requests: int = 0
+    retried_keys: int = 0
+    unprocessed_keys: int = 0
+
+    def add(self, other: "RequestStats") -> None:
+        """
+        Accumulate stats from another request
+        """
+        self.requests += other.requests
+        self.throttled_requests += other.throttled_requests
+        self.retried_keys += other.retried_keys
+        self.unprocessed_keys += other.unprocessed_keys
+
+
+def get_backoff_seconds(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter
+    """
+    return random.uniform(
+        0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+    )
+
+
+class StopPointLRUCache:
+    """
+    Size bounded LRU of StopPoints by AtcoCode with a TTL per entry
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[str, tuple[float, TXCStopPoint]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, atco_code: str) -> TXCStopPoint | None:
+        """
+        Get an unexpired StopPoint, marking it as recently used
+        """
+        with self._lock:
+            entry = self._items.get(atco_code)
+            if entry is None:
+                return None
+            expires_at, stop_point = entry
+            if expires_at <= time.monotonic():
+                del self._items[atco_code]
+                return None
+            self._items.move_to_end(atco_code)
+            return stop_point
+
+    def put(self, stop_point: TXCStopPoint) -> None:
+        """
+        Add a StopPoint, evicting the least recently used over max_size
+        """
+        with self._lock:
+            self._items[stop_point.AtcoCode] = (
+                time.monotonic() + self.ttl_seconds,
+                stop_point,
+            )
+            self._items.move_to_end(stop_point.AtcoCode)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all StopPoints
+        """
+        with self._lock:
+            self._items.clear()
+
+
+@lru_cache(maxsize=None)
+def get_stop_point_cache(
+    table_name: str, max_size: int, ttl_seconds: int
+) -> StopPointLRUCache:
+    """
+    Module level cache per table so it survives warm Lambda invocations
+    """
+    return StopPointLRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
 
 class NaptanStopPointDynamoDBClient(DynamoDB):
     """
@@ -30,6 +149,17 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
                 PROJECT_ENV=naptan_settings.PROJECT_ENV,
             )
         )
+        self._cache: StopPointLRUCache | None = None
+        if naptan_settings.NAPTAN_STOP_POINT_CACHE_SIZE > 0:
+            self._cache = get_stop_point_cache(
+                naptan_settings.DYNAMODB_NAPTAN_STOP_POINT_TABLE_NAME,
+                naptan_settings.NAPTAN_STOP_POINT_CACHE_SIZE,
+                naptan_settings.NAPTAN_STOP_POINT_CACHE_TTL_SECONDS,
+            )
+        self.cache_stats = StopPointCacheStats()
+        self.request_stats = RequestStats()
+        self._max_workers = naptan_settings.NAPTAN_BATCH_GET_MAX_WORKERS
+        self._max_retries = naptan_settings.NAPTAN_BATCH_GET_MAX_RETRIES
 
     def get_by_atco_codes(
         self, atco_codes: list[str]
@@ -46,28 +176,40 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
             log.warning("No AtcoCodes provided for fetching StopPoints")
             return [], []
 
-        stop_points: list[TXCStopPoint] = []
-        found_atco_codes: Set[str] = set()
+        found: dict[str, TXCStopPoint] = {}
+        uncached_atco_codes: list[str] = []
+        for atco_code in dict.fromkeys(atco_codes):
+            stop_point = self._get_cached(atco_code)
+            if stop_point:
+                found[atco_code] = stop_point
+            else:
+                uncached_atco_codes.append(atco_code)
 
         # Limit for BatchGetItem is 100
         batch_size: int = 100
-        for batch in self._batch_queries(atco_codes, batch_size=batch_size):
-            raw_items = self._batch_get_items(batch)
+        batches = list(self._batch_queries(uncached_atco_codes, batch_size=batch_size))
+        for raw_items in self._run_concurrently(self._batch_get_items, batches):
             for item in raw_items:
                 atco_code = item.get("AtcoCode", {}).get("S")
                 stop_point = self._deserialize_stop_point(item, atco_code=atco_code)
                 if stop_point:
-                    stop_points.append(stop_point)
-                    found_atco_codes.add(stop_point.AtcoCode)
+                    found[stop_point.AtcoCode] = stop_point
+                    self._put_cached(stop_point)
 
+        stop_points: list[TXCStopPoint] = [
+            found[code] for code in dict.fromkeys(atco_codes) if code in found
+        ]
         missing_atco_codes: list[str] = [
-            code for code in atco_codes if code not in found_atco_codes
+            code for code in atco_codes if code not in found
         ]
 
         log.info(
             "Completed fetching and parsing TxcStopPoints from DynamoDB",
             total_fetched=len(stop_points),
             total_missing=len(missing_atco_codes),
+            cache_hits=len(dict.fromkeys(atco_codes)) - len(uncached_atco_codes),
+            cache_misses=len(uncached_atco_codes),
+            request_stats=self.request_stats,
         )
         return stop_points, missing_atco_codes
 
@@ -75,6 +217,10 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
         """
         Get a single StopPoint from DynamoDB by AtcoCode.
         """
+        cached_stop_point = self._get_cached(atco_code)
+        if cached_stop_point:
+            return cached_stop_point
+
         log.info("Fetching single StopPoint from DynamoDB", atco_code=atco_code)
 
         try:
@@ -88,7 +234,10 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
                 log.info("No StopPoint found for AtcoCode", atco_code=atco_code)
                 return None
 
-            return self._deserialize_stop_point(item, atco_code=atco_code)
+            stop_point = self._deserialize_stop_point(item, atco_code=atco_code)
+            if stop_point:
+                self._put_cached(stop_point)
+            return stop_point
 
         except Exception:
             log.error("Failed to fetch StopPoint", atco_code=atco_code, exc_info=True)
@@ -108,18 +257,15 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
         if not naptan_codes:
             return [], []
 
-        stop_points: list[TXCStopPoint] = []
-        found_naptan_codes: Set[str] = set()
-
-        # Batch get item can't be used on a GSI so we need to query for each NaptanCode
-        for naptan_code in naptan_codes:
-            raw_items = self._client.query(
-                TableName=self._settings.DYNAMODB_TABLE_NAME,
-                IndexName="NaptanCodeIndex",
-                KeyConditionExpression="NaptanCode = :NaptanCode",
-                ExpressionAttributeValues={":NaptanCode": {"S": naptan_code}},
-            ).get("Items", [])
+        found: dict[str, TXCStopPoint] = {}
+        unique_naptan_codes = list(dict.fromkeys(naptan_codes))
 
+        # Batch get item can't be used on a GSI so the Query for each NaptanCode
+        # is sent concurrently instead
+        query_results = self._run_concurrently(
+            self._query_naptan_code, unique_naptan_codes
+        )
+        for naptan_code, raw_items in zip(unique_naptan_codes, query_results):
             if len(raw_items) == 0:
                 log.info("No StopPoint found for NaptanCode", naptan_code=naptan_code)
                 continue
@@ -135,17 +281,17 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
             naptan_code = item.get("NaptanCode", {}).get("S")
             stop_point = self._deserialize_stop_point(item, naptan_code=naptan_code)
             if stop_point and stop_point.NaptanCode:
-                stop_points.append(stop_point)
-                found_naptan_codes.add(stop_point.NaptanCode)
+                found[stop_point.NaptanCode] = stop_point
+                self._put_cached(stop_point)
 
-        missing_naptan_codes = [
-            code for code in naptan_codes if code not in found_naptan_codes
-        ]
+        stop_points = list(found.values())
+        missing_naptan_codes = [code for code in naptan_codes if code not in found]
 
         log.info(
             "Completed fetching and parsing TxcStopPoints from DynamoDB",
             total_fetched=len(stop_points),
             total_missing=len(missing_naptan_codes),
+            request_stats=self.request_stats,
         )
         return stop_points, missing_naptan_codes
 
@@ -162,6 +308,26 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
             for stop_point in stop_points
         }
 
+    def _get_cached(self, atco_code: str) -> TXCStopPoint | None:
+        """
+        Lookup a StopPoint in the in memory cache, recording the hit or miss
+        """
+        if self._cache is None:
+            return None
+        stop_point = self._cache.get(atco_code)
+        if stop_point:
+            self.cache_stats.hits += 1
+        else:
+            self.cache_stats.misses += 1
+        return stop_point
+
+    def _put_cached(self, stop_point: TXCStopPoint) -> None:
+        """
+        Store a fetched StopPoint for later invocations
+        """
+        if self._cache is not None:
+            self._cache.put(stop_point)
+
     def _deserialize_stop_point(
         self,
         raw_item: dict[str, AttributeValueTypeDef],
@@ -194,32 +360,127 @@ class NaptanStopPointDynamoDBClient(DynamoDB):
         for i in range(0, len(items), batch_size):
             yield items[i : i + batch_size]
 
+    def _run_concurrently(
+        self,
+        func: Callable[[ItemT], tuple[ResultT, RequestStats]],
+        items: list[ItemT],
+    ) -> list[ResultT]:
+        """
+        Run a DynamoDB request for each item concurrently up to the configured limit
+        Results are returned in the same order as the items
+        """
+        max_workers = min(self._max_workers, len(items))
+        if max_workers <= 1:
+            results = [func(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(func, items))
+
+        for _, stats in results:
+            self.request_stats.add(stats)
+        return [result for result, _ in results]
+
+    def _query_naptan_code(
+        self, naptan_code: str
+    ) -> tuple[list[dict[str, AttributeValueTypeDef]], RequestStats]:
+        """
+        Query the NaptanCodeIndex for a single NaptanCode
+        Throttled requests are retried with backoff
+        """
+        stats = RequestStats()
+        for attempt in range(self._max_retries + 1):
+            if attempt > 0:
+                stats.retried_keys += 1
+                time.sleep(get_backoff_seconds(attempt))
+            stats.requests += 1
+            try:
+                response = self._client.query(
+                    TableName=self._settings.DYNAMODB_TABLE_NAME,
+                    IndexName="NaptanCodeIndex",
+                    KeyConditionExpression="NaptanCode = :NaptanCode",
+                    ExpressionAttributeValues={":NaptanCode": {"S": naptan_code}},
+                )
+                return response.get("Items", []), stats
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code not in THROTTLING_ERROR_CODES:
+                    log.error(
+                        "Failed to query StopPoint by NaptanCode",
+                        naptan_code=naptan_code,
+                        exc_info=True,
+                    )
+                    raise
+                log.warning(
+                    "NaptanCode Query throttled", error_code=error_code, attempt=attempt
+                )
+                stats.throttled_requests += 1
+
+        log.error("NaptanCode Query retries exhausted", naptan_code=naptan_code)
+        stats.unprocessed_keys += 1
+        return [], stats
+
     def _batch_get_items(
         self, atco_codes: list[str]
-    ) -> list[dict[str, AttributeValueTypeDef]]:
+    ) -> tuple[list[dict[str, AttributeValueTypeDef]], RequestStats]:
         """
         Use DynamoDB BatchGetItem to fetch items for a list of AtcoCodes.
+        Throttled requests and UnprocessedKeys are retried with backoff
         """
+        table_name = self._settings.DYNAMODB_TABLE_NAME
+        request_keys: list[dict[str, AttributeValueTypeDef]] = [
+            {"AtcoCode": {"S": atco_code}} for atco_code in atco_codes
+        ]
+        raw_items: list[dict[str, AttributeValueTypeDef]] = []
+        stats = RequestStats()
+        attempt = 0
+
         try:
-            request_keys: list[dict[str, dict[str, str]]] = [
-                {"AtcoCode": {"S": atco_code}} for atco_code in atco_codes
-            ]
-            response = self._client.batch_get_item(
-                RequestItems={
-                    self._settings.DYNAMODB_TABLE_NAME: {"Keys": request_keys}
-                }
-            )
-            # Extract items for the specific table
-            raw_items: list[dict[str, AttributeValueTypeDef]] = response.get(
-                "Responses", {}
-            ).get(self._settings.DYNAMODB_TABLE_NAME, [])
+            while request_keys:
+                if attempt > self._max_retries:
+                    log.error(
+                        "BatchGetItem retries exhausted",
+                        unprocessed=len(request_keys),
+                        attempts=attempt,
+                    )
+                    stats.unprocessed_keys += len(request_keys)
+                    break
+                if attempt > 0:
+                    stats.retried_keys += len(request_keys)
+                    time.sleep(get_backoff_seconds(attempt))
+                attempt += 1
+                stats.requests += 1
+
+                try:
+                    response = self._client.batch_get_item(
+                        RequestItems={table_name: {"Keys": request_keys}}
+                    )
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "")
+                    if error_code in THROTTLING_ERROR_CODES:
+                        log.warning(
+                            "BatchGetItem throttled",
+                            error_code=error_code,
+                            attempt=attempt,
+                        )
+                        stats.throttled_requests += 1
+                        continue
+                    raise
+
+                # Extract items for the specific table
+                raw_items.extend(response.get("Responses", {}).get(table_name, []))
+                request_keys = (
+                    response.get("UnprocessedKeys", {})
+                    .get(table_name, {})
+                    .get("Keys", [])
+                )
 
             log.info(
                 "BatchGetItem completed",
                 fetched=len(raw_items),
                 requested=len(atco_codes),
+                attempts=attempt,
             )
-            return raw_items
+            return raw_items, stats
         except Exception:
             log.error(
                 "Failed to execute BatchGetItem", exc_info=True, settings=self._settings
@@ -45,3 +45,19 @@ class NaptanDynamoDBSettings(DynamoBaseSettings):
         default="",
         description="Table Name for NAPTAN StopPoint table",
     )
+    NAPTAN_STOP_POINT_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Max StopPoints held in memory between invocations, 0 disables",
+    )
+    NAPTAN_STOP_POINT_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Seconds a cached StopPoint is served before refetching",
+    )
+    NAPTAN_BATCH_GET_MAX_WORKERS: int = Field(
+        default=8,
+        description="Max concurrent BatchGetItem requests when fetching StopPoints",
+    )
+    NAPTAN_BATCH_GET_MAX_RETRIES: int = Field(
+        default=5,
+        description="Retries for throttled requests and UnprocessedKeys",
+    )
@@ -0,0 +1,22 @@
+"""
+NaPTAN Snapshot Exports
+"""
+
+from .client import (
+    DEFAULT_SNAPSHOT_KEY,
+    NaptanSnapshotSettings,
+    NaptanStopPointSnapshotClient,
+    StopPointClient,
+    create_stop_point_client,
+)
+from .snapshot import NaptanSnapshot, NaptanSnapshotWriter
+
+__all__ = [
+    "DEFAULT_SNAPSHOT_KEY",
+    "NaptanSnapshot",
+    "NaptanSnapshotSettings",
+    "NaptanSnapshotWriter",
+    "NaptanStopPointSnapshotClient",
+    "StopPointClient",
+    "create_stop_point_client",
+]
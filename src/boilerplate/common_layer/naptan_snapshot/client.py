@@ -0,0 +1,230 @@
+"""
+NAPTAN StopPoint Client backed by a local snapshot file
+"""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import TypeAlias
+
+from common_layer.dynamodb.client.naptan_stop_points import (
+    NaptanStopPointDynamoDBClient,
+)
+from common_layer.s3 import S3
+from common_layer.xml.txc.models import TXCStopPoint
+from pydantic import Field
+from pydantic_settings import BaseSettings
+from structlog.stdlib import get_logger
+
+from .snapshot import NaptanSnapshot
+
+log = get_logger()
+
+DEFAULT_SNAPSHOT_KEY = "naptan/stop_points.snapshot"
+
+
+class NaptanSnapshotSettings(BaseSettings):
+    """
+    Settings for NaptanStopPointSnapshotClient
+    """
+
+    NAPTAN_SNAPSHOT_BUCKET: str = Field(
+        default="",
+        description="Bucket holding the NaPTAN snapshot, empty uses DynamoDB",
+    )
+    NAPTAN_SNAPSHOT_KEY: str = Field(
+        default=DEFAULT_SNAPSHOT_KEY,
+        description="Object key of the NaPTAN snapshot",
+    )
+    NAPTAN_SNAPSHOT_DIR: Path = Field(
+        default=Path("/tmp"),
+        description="Local directory the snapshot is downloaded to",
+    )
+    NAPTAN_SNAPSHOT_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Seconds a loaded snapshot is used before checking for a new one",
+    )
+
+
+@dataclass
+class CachedSnapshot:
+    """
+    Loaded snapshot with the ETag it was downloaded at
+    """
+
+    snapshot: NaptanSnapshot
+    etag: str
+    checked_at: float
+
+
+def download_snapshot(s3: S3, key: str, local_path: Path, etag: str) -> None:
+    """
+    Download the snapshot unless the local copy is already at the ETag
+    The ETag is kept in a sidecar file so later processes can reuse the download
+    """
+    etag_path = local_path.with_suffix(".etag")
+    if (
+        local_path.exists()
+        and etag_path.exists()
+        and etag_path.read_text(encoding="utf-8") == etag
+    ):
+        return
+    log.info("Downloading NaPTAN snapshot", bucket=s3.bucket_name, key=key)
+    download_path = local_path.with_suffix(".download")
+    s3.download_file(key, download_path)
+    etag_path.unlink(missing_ok=True)
+    download_path.rename(local_path)
+    etag_path.write_text(etag, encoding="utf-8")
+
+
+class NaptanSnapshotCache:
+    """
+    Snapshots loaded by this process, checked against S3 once the TTL expires
+    A replaced snapshot stays mapped for clients still holding it
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[tuple[str, str, Path], CachedSnapshot] = {}
+        self._lock = Lock()
+
+    def get(
+        self, bucket: str, key: str, snapshot_dir: Path, ttl_seconds: int
+    ) -> NaptanSnapshot:
+        """
+        Get the snapshot, downloading it again if the object has changed
+        """
+        with self._lock:
+            cached = self._items.get((bucket, key, snapshot_dir))
+            now = time.monotonic()
+            if cached and now - cached.checked_at < ttl_seconds:
+                return cached.snapshot
+
+            s3 = S3(bucket)
+            etag = s3.get_etag(key)
+            if cached and cached.etag == etag:
+                cached.checked_at = now
+                return cached.snapshot
+
+            local_path = snapshot_dir / Path(key).name
+            download_snapshot(s3, key, local_path, etag)
+            snapshot = NaptanSnapshot(local_path)
+            self._items[(bucket, key, snapshot_dir)] = CachedSnapshot(
+                snapshot=snapshot, etag=etag, checked_at=now
+            )
+            return snapshot
+
+    def clear(self) -> None:
+        """
+        Forget all loaded snapshots
+        """
+        with self._lock:
+            self._items.clear()
+
+
+SNAPSHOT_CACHE = NaptanSnapshotCache()
+
+
+def load_snapshot(settings: NaptanSnapshotSettings) -> NaptanSnapshot:
+    """
+    Memory mapped snapshot shared by the clients in this process
+    """
+    return SNAPSHOT_CACHE.get(
+        settings.NAPTAN_SNAPSHOT_BUCKET,
+        settings.NAPTAN_SNAPSHOT_KEY,
+        settings.NAPTAN_SNAPSHOT_DIR,
+        settings.NAPTAN_SNAPSHOT_TTL_SECONDS,
+    )
+
+
+class NaptanStopPointSnapshotClient:
+    """
+    Lookup Naptan StopPoints from a memory mapped snapshot
+    Same interface as NaptanStopPointDynamoDBClient
+    """
+
+    def __init__(
+        self,
+        settings: NaptanSnapshotSettings | None = None,
+        snapshot: NaptanSnapshot | None = None,
+    ):
+        snapshot_settings = settings if settings else NaptanSnapshotSettings()
+        self._snapshot = snapshot or load_snapshot(snapshot_settings)
+
+    def get_by_atco_codes(
+        self, atco_codes: list[str]
+    ) -> tuple[list[TXCStopPoint], list[str]]:
+        """
+        Get all StopPoints by the given list of AtcoCodes.
+
+        Returns:
+            Tuple of (found TXCStopPoints, list of missing AtcoCodes).
+        """
+        found: dict[str, TXCStopPoint] = {}
+        for atco_code in dict.fromkeys(atco_codes):
+            if stop_point := self._snapshot.get_by_atco_code(atco_code):
+                found[atco_code] = stop_point
+        missing_atco_codes = [code for code in atco_codes if code not in found]
+
+        log.info(
+            "Completed fetching TxcStopPoints from NaPTAN snapshot",
+            total_fetched=len(found),
+            total_missing=len(missing_atco_codes),
+        )
+        return list(found.values()), missing_atco_codes
+
+    def get_by_atco_code(self, atco_code: str) -> TXCStopPoint | None:
+        """
+        Get a single StopPoint by AtcoCode.
+        """
+        return self._snapshot.get_by_atco_code(atco_code)
+
+    def get_by_naptan_codes(
+        self, naptan_codes: list[str]
+    ) -> tuple[list[TXCStopPoint], list[str]]:
+        """
+        Get all StopPoints by the given list of NaptanCodes.
+
+        Returns:
+            Tuple of (found TXCStopPoints, list of missing NaptanCodes).
+        """
+        found: dict[str, TXCStopPoint] = {}
+        for naptan_code in dict.fromkeys(naptan_codes):
+            if stop_point := self._snapshot.get_by_naptan_code(naptan_code):
+                found[naptan_code] = stop_point
+        missing_naptan_codes = [code for code in naptan_codes if code not in found]
+
+        log.info(
+            "Completed fetching TxcStopPoints from NaPTAN snapshot",
+            total_fetched=len(found),
+            total_missing=len(missing_naptan_codes),
+        )
+        return list(found.values()), missing_naptan_codes
+
+    def get_stop_area_map(self, atco_codes: list[str]) -> dict[str, list[str]]:
+        """
+        Build a stop area map from list of AtcoCodes.
+
+        Returns:
+            Dict of {AtcoCode: StopAreas}
+        """
+        stop_points, _ = self.get_by_atco_codes(atco_codes)
+        return {
+            stop_point.AtcoCode: (stop_point.StopAreas or [])
+            for stop_point in stop_points
+        }
+
+
+StopPointClient: TypeAlias = (
+    NaptanStopPointDynamoDBClient | NaptanStopPointSnapshotClient
+)
+
+
+def create_stop_point_client() -> StopPointClient:
+    """
+    Use the NaPTAN snapshot when a bucket is configured, otherwise DynamoDB
+    """
+    settings = NaptanSnapshotSettings()
+    if settings.NAPTAN_SNAPSHOT_BUCKET:
+        return NaptanStopPointSnapshotClient(settings)
+    return NaptanStopPointDynamoDBClient()
@@ -0,0 +1,264 @@
+"""
+Read only NaPTAN StopPoint snapshot file
+
+Layout:
+    Header
+    AtcoCode index: fixed width (key, record offset, record length) sorted by key
+    NaptanCode index: fixed width (key, record offset, record length) sorted by key
+    Records: JSON serialised TXCStopPoints
+"""
+
+import mmap
+import shutil
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from common_layer.xml.txc.models import TXCStopPoint
+from structlog.stdlib import get_logger
+
+log = get_logger()
+
+SNAPSHOT_MAGIC = b"NPTNSNAP"
+SNAPSHOT_VERSION = 1
+
+# magic, version, atco key width, naptan key width, atco count, naptan count,
+# atco index offset, naptan index offset, records offset
+HEADER = struct.Struct("<8sHHHIIQQQ")
+
+
+def get_index_entry_struct(key_width: int) -> struct.Struct:
+    """
+    Index entry of a null padded key, record offset and record length
+    """
+    return struct.Struct(f"<{key_width}sQI")
+
+
+class SnapshotIndex:
+    """
+    Binary search over a sorted fixed width index inside the snapshot
+    """
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        offset: int,
+        count: int,
+        key_width: int,
+        records_offset: int,
+    ):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._entry = get_index_entry_struct(key_width)
+        self._key_width = key_width
+        self._records_offset = records_offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key_at(self, position: int) -> bytes:
+        start = self._offset + position * self._entry.size
+        return self._buffer[start : start + self._key_width].rstrip(b"\0")
+
+    def find(self, key: str) -> tuple[int, int] | None:
+        """
+        Absolute offset and length of the record for a key
+        """
+        encoded_key = key.encode()
+        if len(encoded_key) > self._key_width:
+            return None
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < encoded_key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self._count or self._key_at(low) != encoded_key:
+            return None
+        _, record_offset, record_length = self._entry.unpack_from(
+            self._buffer, self._offset + low * self._entry.size
+        )
+        return self._records_offset + record_offset, record_length
+
+
+class NaptanSnapshot:
+    """
+    Memory mapped NaPTAN snapshot with lookups by AtcoCode and NaptanCode
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as snapshot_file:
+            self._buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            atco_key_width,
+            naptan_key_width,
+            atco_count,
+            naptan_count,
+            atco_index_offset,
+            naptan_index_offset,
+            records_offset,
+        ) = HEADER.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self._buffer.close()
+            raise ValueError(f"Unsupported NaPTAN snapshot file: {path}")
+
+        self.atco_index = SnapshotIndex(
+            self._buffer, atco_index_offset, atco_count, atco_key_width, records_offset
+        )
+        self.naptan_index = SnapshotIndex(
+            self._buffer,
+            naptan_index_offset,
+            naptan_count,
+            naptan_key_width,
+            records_offset,
+        )
+        log.info(
+            "Opened NaPTAN snapshot",
+            path=str(path),
+            stop_points=atco_count,
+            naptan_codes=naptan_count,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory map
+        """
+        self._buffer.close()
+
+    def _read_record(self, location: tuple[int, int] | None) -> TXCStopPoint | None:
+        if location is None:
+            return None
+        offset, length = location
+        return TXCStopPoint.model_validate_json(self._buffer[offset : offset + length])
+
+    def get_by_atco_code(self, atco_code: str) -> TXCStopPoint | None:
+        """
+        Lookup a StopPoint by AtcoCode
+        """
+        return self._read_record(self.atco_index.find(atco_code))
+
+    def get_by_naptan_code(self, naptan_code: str) -> TXCStopPoint | None:
+        """
+        Lookup a StopPoint by NaptanCode
+        """
+        return self._read_record(self.naptan_index.find(naptan_code))
+
+
+class NaptanSnapshotWriter:
+    """
+    Write StopPoints to a snapshot file
+    Records are streamed to a temporary file and the indexes are sorted on close
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._records_path = path.with_suffix(".records")
+        self._records_file = self._records_path.open("wb")
+        self._records_size = 0
+        self._atco_entries: list[tuple[bytes, int, int]] = []
+        self._naptan_entries: dict[bytes, tuple[int, int] | None] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            if not self._records_file.closed:
+                self.close()
+        else:
+            self._records_file.close()
+            self._records_path.unlink(missing_ok=True)
+
+    def add(self, stop_point: TXCStopPoint) -> None:
+        """
+        Append a StopPoint record
+        """
+        record = stop_point.model_dump_json(exclude_none=True).encode()
+        location = (self._records_size, len(record))
+        self._records_file.write(record)
+        self._records_size += len(record)
+
+        self._atco_entries.append((stop_point.AtcoCode.encode(), *location))
+        if stop_point.NaptanCode:
+            naptan_code = stop_point.NaptanCode.encode()
+            # NaptanCodes shared by several StopPoints can't be resolved
+            self._naptan_entries[naptan_code] = (
+                None if naptan_code in self._naptan_entries else location
+            )
+
+    def close(self) -> int:
+        """
+        Write the header and sorted indexes followed by the records
+        Returns the number of StopPoints written
+        """
+        self._records_file.close()
+        atco_entries = sorted(self._atco_entries)
+        naptan_entries = sorted(
+            (key, *location)
+            for key, location in self._naptan_entries.items()
+            if location is not None
+        )
+        atco_key_width = max((len(key) for key, _, _ in atco_entries), default=0)
+        naptan_key_width = max((len(key) for key, _, _ in naptan_entries), default=0)
+        atco_entry = get_index_entry_struct(atco_key_width)
+        naptan_entry = get_index_entry_struct(naptan_key_width)
+
+        atco_index_offset = HEADER.size
+        naptan_index_offset = atco_index_offset + atco_entry.size * len(atco_entries)
+        records_offset = naptan_index_offset + naptan_entry.size * len(naptan_entries)
+
+        with self.path.open("wb") as snapshot_file:
+            snapshot_file.write(
+                HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    atco_key_width,
+                    naptan_key_width,
+                    len(atco_entries),
+                    len(naptan_entries),
+                    atco_index_offset,
+                    naptan_index_offset,
+                    records_offset,
+                )
+            )
+            for entry in atco_entries:
+                snapshot_file.write(atco_entry.pack(*entry))
+            for entry in naptan_entries:
+                snapshot_file.write(naptan_entry.pack(*entry))
+            with self._records_path.open("rb") as records_file:
+                shutil.copyfileobj(records_file, snapshot_file)
+        self._records_path.unlink()
+
+        log.info(
+            "Wrote NaPTAN snapshot",
+            path=str(self.path),
+            stop_points=len(atco_entries),
+            naptan_codes=len(naptan_entries),
+            size=records_offset + self._records_size,
+        )
+        return len(atco_entries)
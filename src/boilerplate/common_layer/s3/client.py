@@ -11,10 +11,11 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator
+from typing import IO, TYPE_CHECKING, Iterator
 
 import boto3
 import botocore.config
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from botocore.response import StreamingBody
 from structlog.stdlib import get_logger
@@ -26,6 +27,9 @@ if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 logger = get_logger()
 
+# Streams up to one chunk in memory, larger streams use a multipart upload
+STREAM_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+
 
 class S3:
     """
@@ -178,6 +182,46 @@ class S3:
             )
             raise err
 
+    def download_file(self, file_path: str, local_path: Path) -> Path:
+        """
+        Download S3 Object to a local path
+        """
+        try:
+            self._client.download_file(
+                Bucket=self._bucket_name, Key=file_path, Filename=str(local_path)
+            )
+            return local_path
+        except (ClientError, BotoCoreError) as err:
+            logger.error(
+                "S3: Error downloading file to path",
+                bucket_name=self.bucket_name,
+                object_key=file_path,
+                local_path=str(local_path),
+                exc_info=True,
+            )
+            raise err
+
+    def upload_file(self, local_path: Path, file_path: str) -> None:
+        """
+        Upload a local file to S3, using multipart uploads for large files
+        """
+        try:
+            self._client.upload_file(
+                Filename=str(local_path),
+                Bucket=self._bucket_name,
+                Key=file_path,
+                ExtraArgs={"ContentType": self._get_content_type(file_path)},
+            )
+        except (ClientError, BotoCoreError) as err:
+            logger.error(
+                "S3: Error uploading file from path",
+                bucket_name=self.bucket_name,
+                object_key=file_path,
+                local_path=str(local_path),
+                exc_info=True,
+            )
+            raise err
+
     def get_object(self, file_path: str) -> StreamingBody:
         """
         Get S3 Object as StreamingBody
@@ -194,6 +238,24 @@ class S3:
             )
             raise err
 
+    def get_optional_object(self, file_path: str) -> bytes | None:
+        """
+        Get S3 Object bytes, or None if the key doesn't exist
+        """
+        try:
+            response = self._client.get_object(Bucket=self._bucket_name, Key=file_path)
+            return response["Body"].read()
+        except ClientError as err:
+            if err.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            logger.error(
+                "S3: Error downloading file object",
+                bucket_name=self.bucket_name,
+                object_key=file_path,
+                exc_info=True,
+            )
+            raise err
+
     def get_list_objects_v2(self, prefix: str) -> Iterator[ListObjectsV2OutputTypeDef]:
         """
         Return the ListObjectsV2PaginatorOutput as an Iterator
@@ -301,9 +363,84 @@ class S3:
             )
             raise err
 
+    def upload_stream(
+        self,
+        stream: IO[bytes],
+        file_path: str,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Upload a non seekable stream without writing it to disk
+        Streams up to STREAM_UPLOAD_CHUNK_BYTES are sent with a single PutObject
+        Larger ones are sent as a multipart upload one chunk at a time
+        Runs in the calling thread so it can be used from a worker pool
+        """
+        extra_args = {"ContentType": self._get_content_type(file_path)}
+        tagging_str = format_s3_tags(tags)
+        if tagging_str:
+            extra_args["Tagging"] = tagging_str
+        try:
+            self._client.upload_fileobj(
+                Fileobj=stream,
+                Bucket=self.bucket_name,
+                Key=file_path,
+                ExtraArgs=extra_args,
+                Config=TransferConfig(
+                    multipart_threshold=STREAM_UPLOAD_CHUNK_BYTES,
+                    multipart_chunksize=STREAM_UPLOAD_CHUNK_BYTES,
+                    use_threads=False,
+                ),
+            )
+        except (ClientError, BotoCoreError) as err:
+            logger.error(
+                "S3: Error during stream upload",
+                bucket_name=self.bucket_name,
+                object_key=file_path,
+                exc_info=True,
+            )
+            raise err
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every object under a prefix
+        Returns the number of objects deleted
+        """
+        deleted = 0
+        try:
+            for page in self.get_list_objects_v2(prefix):
+                keys = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+                if not keys:
+                    continue
+                self._client.delete_objects(
+                    Bucket=self.bucket_name, Delete={"Objects": keys, "Quiet": True}
+                )
+                deleted += len(keys)
+        except (ClientError, BotoCoreError) as err:
+            logger.error(
+                "S3: Error deleting objects",
+                bucket_name=self.bucket_name,
+                prefix=prefix,
+                exc_info=True,
+            )
+            raise err
+        logger.info(
+            "S3: Deleted objects",
+            bucket_name=self.bucket_name,
+            prefix=prefix,
+            deleted=deleted,
+        )
+        return deleted
+
     def get_file_size(self, file_path: str) -> int:
         """
         Gets the size of an S3 object in bytes without downloading it.
         """
         response = self._client.head_object(Bucket=self._bucket_name, Key=file_path)
         return response["ContentLength"]
+
+    def get_etag(self, file_path: str) -> str:
+        """
+        Gets the ETag of an S3 object without downloading it.
+        """
+        response = self._client.head_object(Bucket=self._bucket_name, Key=file_path)
+        return response["ETag"]
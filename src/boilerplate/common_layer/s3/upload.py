@@ -3,11 +3,13 @@ Zip Handling Utilities
 """
 
 import asyncio
+import functools
 import os
 import shutil
 import tempfile
+import threading
 from pathlib import Path
-from typing import Generator
+from typing import IO, Generator
 from zipfile import BadZipFile, ZipFile
 
 from botocore.exceptions import BotoCoreError, ClientError
@@ -32,10 +34,8 @@ class ProcessingStats(BaseModel):
 class SharedContext(BaseModel):
     """Shared context data across all file operations"""
 
-    temp_dir: str
     destination_prefix: str
     tags: dict[str, str] | None = None
-    min_free_bytes: int
     processed_files: set[str] = Field(default_factory=set)
 
 
@@ -47,25 +47,53 @@ class FileContext(BaseModel):
     shared: SharedContext
 
 
-class NotEnoughDiskSpaceError(Exception):
-    """Exception raised when there isn't enough disk space for extraction"""
+class ExtractionCancelledError(Exception):
+    """Exception raised when a member is opened after extraction was cancelled"""
 
 
-def get_available_space(path: str) -> int:
-    """Get available space in bytes for a given path"""
-    usage = shutil.disk_usage(path)
-    return usage.free
-
+class ZipMemberReader:
+    """
+    Opens zip members from a ZipFile handle per worker thread
+    Members of a shared ZipFile serialise on its file lock,
+    independent handles let members decompress concurrently
+    Setting cancel_event stops any further members being opened
+    """
 
-def get_space_info(temp_dir: str, min_free_bytes: int) -> dict[str, int]:
-    """Get information about disk space for logging"""
-    usage = shutil.disk_usage(temp_dir)
-    return {
-        "total_mb": usage.total // (1024 * 1024),
-        "used_mb": usage.used // (1024 * 1024),
-        "free_mb": usage.free // (1024 * 1024),
-        "available_mb": (usage.free - min_free_bytes) // (1024 * 1024),
-    }
+    def __init__(self, zip_path: Path, cancel_event: threading.Event | None = None):
+        self.zip_path = zip_path
+        self.cancel_event = cancel_event or threading.Event()
+        self._local = threading.local()
+        self._zip_objs: list[ZipFile] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ZipMemberReader":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def open(self, file_path: str) -> IO[bytes]:
+        """
+        Open a member for streaming using the current thread's ZipFile
+        """
+        if self.cancel_event.is_set():
+            raise ExtractionCancelledError(file_path)
+        zip_obj: ZipFile | None = getattr(self._local, "zip_obj", None)
+        if zip_obj is None:
+            zip_obj = ZipFile(self.zip_path)
+            self._local.zip_obj = zip_obj
+            with self._lock:
+                self._zip_objs.append(zip_obj)
+        return zip_obj.open(file_path)
+
+    def close(self) -> None:
+        """
+        Close every thread's ZipFile
+        """
+        with self._lock:
+            for zip_obj in self._zip_objs:
+                zip_obj.close()
+            self._zip_objs.clear()
 
 
 def create_file_list(zip_obj: ZipFile) -> tuple[list[tuple[str, int]], ProcessingStats]:
@@ -100,39 +128,35 @@ def create_file_list(zip_obj: ZipFile) -> tuple[list[tuple[str, int]], Processin
     return sorted_xml_files, stats
 
 
+def stream_member_to_s3(
+    reader: ZipMemberReader, context: FileContext, s3_client: "S3", s3_key: str
+) -> None:
+    """
+    Pipe a zip member's decompressed bytes straight into an S3 upload
+    """
+    with reader.open(context.file_path) as source:
+        s3_client.upload_stream(source, s3_key, tags=context.shared.tags)
+
+
 async def extract_and_upload_single_file(
-    context: FileContext, zip_obj: ZipFile, s3_client: "S3"
+    context: FileContext, reader: ZipMemberReader, s3_client: "S3"
 ) -> bool:
-    """Extract and upload a single file, with space management
+    """Stream a single file from the zip to S3 without writing it to disk
+    Runs in the S3 client's thread pool so files decompress and upload concurrently
     Returns True on success, False on failure
     """
     # Skip if already processed
     if context.file_path in context.shared.processed_files:
         return True  # Consider this a success since it's already done
 
-    # Wait for space to become available
-    while (
-        get_available_space(context.shared.temp_dir) - context.shared.min_free_bytes
-        < context.file_size
-    ):
-        await asyncio.sleep(0.1)
-
-    extracted_path = Path(context.shared.temp_dir) / context.file_path
-    extracted_path.parent.mkdir(parents=True, exist_ok=True)
     s3_key = f"{context.shared.destination_prefix}{context.file_path}"
 
     try:
-        # Extract the file
-        with zip_obj.open(context.file_path) as source, open(
-            extracted_path, "wb"
-        ) as target:
-            shutil.copyfileobj(source, target, length=8192)
-
-        # Upload to S3
-        with open(extracted_path, "rb") as file:
-            await s3_client.put_object_async(
-                s3_key, file.read(), tags=context.shared.tags
-            )
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            s3_client.thread_pool,
+            functools.partial(stream_member_to_s3, reader, context, s3_client, s3_key),
+        )
 
         context.shared.processed_files.add(context.file_path)
 
@@ -145,7 +169,11 @@ async def extract_and_upload_single_file(
 
         return True
 
-    except (OSError, IOError, ClientError, BotoCoreError) as err:
+    except ExtractionCancelledError:
+        await log.adebug("Extraction cancelled", file_path=context.file_path)
+        return False
+
+    except (OSError, IOError, BadZipFile, ClientError, BotoCoreError) as err:
         await log.aerror(
             "Failed to extract or upload file",
             file_path=context.file_path,
@@ -155,22 +183,10 @@ async def extract_and_upload_single_file(
         )
         return False
 
-    finally:
-        # Remove file to save disk space
-        if extracted_path.exists():
-            try:
-                os.unlink(extracted_path)
-            except OSError:
-                await log.aerror(
-                    "Failed to cleanup extracted file",
-                    path=str(extracted_path),
-                    exc_info=True,
-                )
-
 
 async def process_file_with_semaphore(
     context: FileContext,
-    zip_obj: ZipFile,
+    reader: ZipMemberReader,
     s3_client: "S3",
     semaphore: asyncio.Semaphore,
 ) -> bool:
@@ -178,11 +194,15 @@ async def process_file_with_semaphore(
     Returns True on success, False on failure
     """
     async with semaphore:
-        return await extract_and_upload_single_file(context, zip_obj, s3_client)
+        return await extract_and_upload_single_file(context, reader, s3_client)
 
 
 async def process_zip_contents(
-    zip_obj: ZipFile, s3_client: "S3", zip_path: Path, shared_context: SharedContext
+    zip_obj: ZipFile,
+    s3_client: "S3",
+    zip_path: Path,
+    shared_context: SharedContext,
+    reader: ZipMemberReader,
 ) -> tuple[str, "ProcessingStats"]:
     """
     Process contents of a zip file using  starts new files as soon as slots become available
@@ -193,13 +213,7 @@ async def process_zip_contents(
         await log.ainfo("No XML files found in zip", zip_path=str(zip_path))
         return shared_context.destination_prefix, stats
 
-    await log.ainfo(
-        "Starting dynamic processing",
-        total_files=len(xml_files),
-        space_info=get_space_info(
-            shared_context.temp_dir, shared_context.min_free_bytes
-        ),
-    )
+    await log.ainfo("Starting dynamic processing", total_files=len(xml_files))
 
     file_queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
     for file_path, file_size in xml_files:
@@ -223,7 +237,7 @@ async def process_zip_contents(
         )
 
         result: bool = await process_file_with_semaphore(
-            file_context, zip_obj, s3_client, semaphore
+            file_context, reader, s3_client, semaphore
         )
 
         results.append(result)
@@ -234,9 +248,6 @@ async def process_zip_contents(
                     "Processing progress",
                     processed=len(shared_context.processed_files),
                     total_files=len(xml_files),
-                    space_info=get_space_info(
-                        shared_context.temp_dir, shared_context.min_free_bytes
-                    ),
                     remaining_files=len(xml_files)
                     - len(shared_context.processed_files),
                 )
@@ -284,45 +295,43 @@ async def process_zip_to_s3_async(
     zip_path: Path,
     destination_prefix: str,
     tags: dict[str, str] | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> tuple[str, "ProcessingStats"]:
     """
-    Process all files in a zip to S3, managing space efficiently in batches
+    Stream all XML files in a zip to S3 without extracting them to disk
+    Once cancel_event is set the remaining files are not uploaded
     """
-
-    min_free_bytes = 10 * 1024 * 1024  # 10MB safety buffer
-
     await log.ainfo(
-        "Processing zip file in batches",
+        "Streaming zip file to S3",
         zip_path=str(zip_path),
         destination=destination_prefix,
         max_concurrent=s3_client.max_workers,
     )
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        try:
-            # Create a shared context for the whole process
-            shared_context = SharedContext(
-                temp_dir=temp_dir,
-                destination_prefix=destination_prefix,
-                tags=tags,
-                min_free_bytes=min_free_bytes,
-            )
-
-            with ZipFile(zip_path) as zip_obj:
-                return await process_zip_contents(
-                    zip_obj=zip_obj,
-                    s3_client=s3_client,
-                    zip_path=zip_path,
-                    shared_context=shared_context,
-                )
+    try:
+        shared_context = SharedContext(
+            destination_prefix=destination_prefix,
+            tags=tags,
+        )
 
-        except (OSError, BadZipFile):
-            await log.aerror(
-                "Critical error processing zip file",
-                zip_path=str(zip_path),
-                exc_info=True,
+        with ZipFile(zip_path) as zip_obj, ZipMemberReader(
+            zip_path, cancel_event
+        ) as reader:
+            return await process_zip_contents(
+                zip_obj=zip_obj,
+                s3_client=s3_client,
+                zip_path=zip_path,
+                shared_context=shared_context,
+                reader=reader,
             )
-            raise
+
+    except (OSError, BadZipFile):
+        await log.aerror(
+            "Critical error processing zip file",
+            zip_path=str(zip_path),
+            exc_info=True,
+        )
+        raise
 
 
 def extract_zip_file(zip_path: Path) -> Generator[tuple[str, Path], None, None]:
@@ -0,0 +1,230 @@
+"""
+Parsed TXC artifacts shared between the Step Function stages
+The first stage to parse a file stores the TXCData in S3 keyed by its content hash
+Later stages load it instead of parsing the XML again
+"""
+
+import gzip
+import zlib
+from io import BytesIO
+from typing import Any
+
+from common_layer.s3 import S3
+from common_layer.xml.txc.models import TXCData
+from common_layer.xml.txc.parser.parser_txc import (
+    TXCParserConfig,
+    load_xml_data,
+    parse_txc_from_element,
+    parse_txc_streaming,
+)
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_settings import BaseSettings
+from structlog.stdlib import get_logger
+
+log = get_logger()
+
+ARTIFACT_FORMAT_VERSION = 2
+ARTIFACT_PREFIX = "txc-artifacts"
+
+# Parse everything once so the artifact can serve every later stage
+ARTIFACT_PARSER_CONFIG = TXCParserConfig(
+    track_data=True, file_hash=True, streaming=True
+)
+
+# Parser options that change how a file is parsed but not the result
+NON_SECTION_FIELDS = frozenset(["parallel_sections", "max_workers", "streaming"])
+
+# TXCParserConfig sections and the TXCData fields they fill
+SECTION_FIELDS = {
+    "metadata": "Metadata",
+    "serviced_organisations": "ServicedOrganisations",
+    "stop_points": "StopPoints",
+    "route_sections": "RouteSections",
+    "routes": "Routes",
+    "journey_pattern_sections": "JourneyPatternSections",
+    "operators": "Operators",
+    "services": "Services",
+    "vehicle_journeys": "VehicleJourneys",
+}
+
+
+class TXCArtifact(BaseModel):
+    """
+    Stored TXCData with the parser sections that filled it
+    """
+
+    version: int
+    sections: dict[str, bool]
+    txc_data: TXCData
+
+
+class TXCArtifactSettings(BaseSettings):
+    """
+    Settings for the parsed TXC artifact cache
+    """
+
+    TXC_ARTIFACT_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Store parsed TXCData in S3 and reuse it in later stages",
+    )
+
+
+def get_artifact_key(s3_key: str, file_hash: str) -> str:
+    """
+    Artifact key for an extracted TXC file
+    Kept outside the extracted folder so it's never listed as a TXC file
+    Includes the content hash so a changed file never matches a stale artifact
+    """
+    return f"{ARTIFACT_PREFIX}/{s3_key}.{file_hash}.json.gz"
+
+
+def get_parsed_sections(config: TXCParserConfig) -> dict[str, bool]:
+    """
+    The parser config fields that change the parsed TXCData
+    """
+    return {
+        name: value
+        for name, value in config.model_dump().items()
+        if name not in NON_SECTION_FIELDS
+    }
+
+
+def serialize_artifact(txc_data: TXCData, config: TXCParserConfig) -> bytes:
+    """
+    Gzipped JSON of the TXCData and the sections that were parsed
+    """
+    artifact = TXCArtifact(
+        version=ARTIFACT_FORMAT_VERSION,
+        sections=get_parsed_sections(config),
+        txc_data=txc_data,
+    )
+    return gzip.compress(artifact.model_dump_json().encode(), compresslevel=1)
+
+
+def deserialize_artifact(data: bytes, config: TXCParserConfig) -> TXCData | None:
+    """
+    Load TXCData from an artifact written by serialize_artifact
+    Returns None if the format has changed or it's missing a requested section
+    Raises ValidationError if it no longer matches the TXCData models
+    """
+    artifact = TXCArtifact.model_validate_json(gzip.decompress(data))
+    if artifact.version != ARTIFACT_FORMAT_VERSION:
+        return None
+    for name, requested in get_parsed_sections(config).items():
+        if requested and not artifact.sections.get(name, False):
+            return None
+    return select_sections(artifact.txc_data, config)
+
+
+def select_sections(txc_data: TXCData, config: TXCParserConfig) -> TXCData:
+    """
+    Reset the sections the stage didn't ask for
+    So stages see the same TXCData they would get from parsing
+    """
+    updates: dict[str, Any] = {
+        field_name: None if field_name == "Metadata" else []
+        for section_name, field_name in SECTION_FIELDS.items()
+        if not config.should_parse(section_name)
+    }
+    if config.route_sections and not config.track_data:
+        updates["RouteSections"] = [
+            section.model_copy(
+                update={
+                    "RouteLink": [
+                        link.model_copy(update={"Track": None})
+                        for link in section.RouteLink
+                    ]
+                }
+            )
+            for section in txc_data.RouteSections
+        ]
+    return txc_data.model_copy(update=updates)
+
+
+def parse_txc_bytes(
+    file_data: BytesIO, file_hash: str | None, config: TXCParserConfig | None
+) -> TXCData:
+    """
+    Parse downloaded TXC bytes, setting the file hash on the Metadata
+    The stream is rewound afterwards so it can be read again
+    """
+    file_data.seek(0)
+    if config and config.streaming:
+        txc_data = parse_txc_streaming(file_data, config)
+    else:
+        xml_data = load_xml_data(file_data, strip_namespaces=False)
+        txc_data = parse_txc_from_element(xml_data, config)
+    file_data.seek(0)
+    if file_hash and txc_data.Metadata:
+        txc_data.Metadata.FileHash = file_hash
+    return txc_data
+
+
+def load_txc_artifact(
+    s3_client: S3, s3_key: str, file_hash: str, config: TXCParserConfig
+) -> TXCData | None:
+    """
+    Load the TXCData artifact for a file if one exists that covers the config
+    """
+    artifact_key = get_artifact_key(s3_key, file_hash)
+    data = s3_client.get_optional_object(artifact_key)
+    if data is None:
+        log.info("No TXC artifact found", artifact_key=artifact_key)
+        return None
+    try:
+        txc_data = deserialize_artifact(data, config)
+    except (OSError, EOFError, zlib.error):
+        log.warning("Unreadable TXC artifact", artifact_key=artifact_key, exc_info=True)
+        return None
+    except ValidationError:
+        log.info("TXC artifact doesn't match the models", artifact_key=artifact_key)
+        return None
+    if txc_data is None:
+        log.info("TXC artifact is stale", artifact_key=artifact_key)
+        return None
+    log.info("Loaded TXC artifact", artifact_key=artifact_key, size=len(data))
+    return txc_data
+
+
+def save_txc_artifact(
+    s3_client: S3,
+    s3_key: str,
+    file_hash: str,
+    txc_data: TXCData,
+    config: TXCParserConfig,
+) -> None:
+    """
+    Store the TXCData artifact for a file
+    Failing to write it only means later stages parse the XML themselves
+    """
+    artifact_key = get_artifact_key(s3_key, file_hash)
+    data = serialize_artifact(txc_data, config)
+    try:
+        s3_client.put_object(artifact_key, data)
+    except Exception:  # pylint: disable=broad-exception-caught
+        log.warning("Failed to save TXC artifact", artifact_key=artifact_key)
+        return
+    log.info("Saved TXC artifact", artifact_key=artifact_key, size=len(data))
+
+
+def get_txc_data_from_artifact(
+    s3_client: S3,
+    s3_key: str,
+    file_data: BytesIO,
+    file_hash: str,
+    config: TXCParserConfig | None = None,
+) -> TXCData:
+    """
+    TXCData for the stage from the file's artifact
+    When there isn't one the whole file is parsed and stored for later stages
+    """
+    config = config or TXCParserConfig()
+    txc_data = load_txc_artifact(s3_client, s3_key, file_hash, config)
+    if txc_data is not None:
+        return txc_data
+
+    full_txc_data = parse_txc_bytes(file_data, file_hash, ARTIFACT_PARSER_CONFIG)
+    save_txc_artifact(
+        s3_client, s3_key, file_hash, full_txc_data, ARTIFACT_PARSER_CONFIG
+    )
+    return select_sections(full_txc_data, config)
@@ -2,6 +2,6 @@
 TXC Parser Exports
 """
 
-from .parser_txc import parse_txc_file, parse_txc_from_element
+from .parser_txc import parse_txc_file, parse_txc_from_element, parse_txc_streaming
 
-__all__ = ["parse_txc_file", "parse_txc_from_element"]
+__all__ = ["parse_txc_file", "parse_txc_from_element", "parse_txc_streaming"]
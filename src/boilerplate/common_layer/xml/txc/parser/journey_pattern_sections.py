@@ -9,6 +9,8 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
+    find_elements,
     find_section,
     get_element_bool,
     get_element_int,
@@ -87,14 +89,14 @@ def parse_journey_pattern_timing_link(
         log.warning("JourneyPatternTimingLink missing required id attribute. Skipping.")
         return None
 
-    from_xml = timing_link_xml.find("From")
+    from_xml = find_element(timing_link_xml, "From")
     if from_xml is None:
         log.warning(
             f"JourneyPatternTimingLink {timing_link_id} missing required From element. Skipping."
         )
         return None
 
-    to_xml = timing_link_xml.find("To")
+    to_xml = find_element(timing_link_xml, "To")
     if to_xml is None:
         log.warning(
             f"JourneyPatternTimingLink {timing_link_id} missing required To element. Skipping."
@@ -143,7 +145,7 @@ def parse_journey_pattern_section(
         return None
 
     timing_links: list[TXCJourneyPatternTimingLink] = []
-    for timing_link_xml in section_xml.findall("JourneyPatternTimingLink"):
+    for timing_link_xml in find_elements(section_xml, "JourneyPatternTimingLink"):
         timing_link = parse_journey_pattern_timing_link(timing_link_xml)
         if timing_link:
             timing_links.append(timing_link)
@@ -173,7 +175,7 @@ def parse_journey_pattern_sections(
         return []
 
     journey_pattern_sections: list[TXCJourneyPatternSection] = []
-    for section_xml in section.findall("JourneyPatternSection"):
+    for section_xml in find_elements(section, "JourneyPatternSection"):
         journey_pattern_section = parse_journey_pattern_section(section_xml)
         if journey_pattern_section:
             journey_pattern_sections.append(journey_pattern_section)
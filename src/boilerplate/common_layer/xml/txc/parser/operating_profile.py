@@ -7,7 +7,13 @@ from datetime import date
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ...utils import does_element_exist, get_element_text, get_element_texts
+from ...utils import (
+    does_element_exist,
+    find_element,
+    find_elements,
+    get_element_text,
+    get_element_texts,
+)
 from ..models import (
     TXCBankHolidayDays,
     TXCBankHolidayOperation,
@@ -67,8 +73,10 @@ def parse_bank_holiday_operation(
     """
     VehicleJourney -> OperatingProfile -> BankHolidayOperation -> DaysOfOperaton/DaysOfNonOperation
     """
-    days_of_operation_xml = bank_holiday_operation_xml.find("DaysOfOperation")
-    days_of_non_operation_xml = bank_holiday_operation_xml.find("DaysOfNonOperation")
+    days_of_operation_xml = find_element(bank_holiday_operation_xml, "DaysOfOperation")
+    days_of_non_operation_xml = find_element(
+        bank_holiday_operation_xml, "DaysOfNonOperation"
+    )
 
     if days_of_operation_xml is None and days_of_non_operation_xml is None:
         return None
@@ -117,7 +125,7 @@ def parse_date_ranges(
     operation_type = "Operation" if is_operation else "NonOperation"
     xpath = f"DaysOf{operation_type}/DateRange"
 
-    for date_range_xml in special_days_operation_xml.findall(xpath):
+    for date_range_xml in find_elements(special_days_operation_xml, xpath):
         date_range = parse_date_range(date_range_xml)
         if date_range:
             date_ranges.append(date_range)
@@ -163,7 +171,7 @@ def parse_regular_days(regular_day_type_xml: _Element) -> TXCDaysOfWeek:
     # DaysOfWeek means all days true
     incorrect_implementation = True
 
-    dow_xml = regular_day_type_xml.find("DaysOfWeek")
+    dow_xml = find_element(regular_day_type_xml, "DaysOfWeek")
     holidays_only = does_element_exist(regular_day_type_xml, "HolidaysOnly")
 
     # If we find an empty DaysOfWeek element, handle according to implementation flag
@@ -229,7 +237,7 @@ def parse_operating_profile(
     """
     VehicleJourneys -> VehicleJourney -> OperatingProfile
     """
-    regular_day_type_xml = operating_profile_xml.find("RegularDayType")
+    regular_day_type_xml = find_element(operating_profile_xml, "RegularDayType")
     if regular_day_type_xml is not None:
         regular_day_type = parse_regular_days(regular_day_type_xml)
     else:
@@ -239,12 +247,14 @@ def parse_operating_profile(
         )
         return None
 
-    periodic_day_type_xml = operating_profile_xml.find("PeriodicDayType")
+    periodic_day_type_xml = find_element(operating_profile_xml, "PeriodicDayType")
     periodic_day_type: TXCPeriodicDayType | None = None
     if periodic_day_type_xml is not None:
         periodic_day_type = parse_periodic_days(periodic_day_type_xml)
 
-    special_days_operation_xml = operating_profile_xml.find("SpecialDaysOperation")
+    special_days_operation_xml = find_element(
+        operating_profile_xml, "SpecialDaysOperation"
+    )
 
     special_days_operation = (
         parse_special_days_operation(special_days_operation_xml)
@@ -252,15 +262,17 @@ def parse_operating_profile(
         else None
     )
 
-    bank_holiday_operation_xml = operating_profile_xml.find("BankHolidayOperation")
+    bank_holiday_operation_xml = find_element(
+        operating_profile_xml, "BankHolidayOperation"
+    )
     bank_holiday_operation = (
         parse_bank_holiday_operation(bank_holiday_operation_xml)
         if bank_holiday_operation_xml is not None
         else None
     )
 
-    serviced_organisation_day_type_xml = operating_profile_xml.find(
-        "ServicedOrganisationDayType"
+    serviced_organisation_day_type_xml = find_element(
+        operating_profile_xml, "ServicedOrganisationDayType"
     )
 
     serviced_organisation_day_type = (
@@ -6,7 +6,7 @@ from common_layer.xml.txc.models import (
     TXCServicedOrganisationDays,
     TXCServicedOrganisationDayType,
 )
-from common_layer.xml.utils import get_element_texts
+from common_layer.xml.utils import find_element, get_element_texts
 from lxml.etree import _Element  # type: ignore
 
 
@@ -19,8 +19,8 @@ def parse_serviced_organisation_day_element(
     if element_xml is None:
         return None
 
-    working_days_xml = element_xml.find("WorkingDays")
-    holidays_xml = element_xml.find("Holidays")
+    working_days_xml = find_element(element_xml, "WorkingDays")
+    holidays_xml = find_element(element_xml, "Holidays")
 
     working_days = (
         get_element_texts(working_days_xml, "ServicedOrganisationRef")
@@ -52,12 +52,14 @@ def parse_serviced_organisation_days(
     days_of_operation: list[TXCServicedOrganisationDays] = []
     days_of_non_operation: list[TXCServicedOrganisationDays] = []
 
-    days_of_operation_xml = serviced_organisation_xml.find("DaysOfOperation")
+    days_of_operation_xml = find_element(serviced_organisation_xml, "DaysOfOperation")
     operation_day = parse_serviced_organisation_day_element(days_of_operation_xml)
     if operation_day:
         days_of_operation.append(operation_day)
 
-    days_of_non_operation_xml = serviced_organisation_xml.find("DaysOfNonOperation")
+    days_of_non_operation_xml = find_element(
+        serviced_organisation_xml, "DaysOfNonOperation"
+    )
     non_operation_day = parse_serviced_organisation_day_element(
         days_of_non_operation_xml
     )
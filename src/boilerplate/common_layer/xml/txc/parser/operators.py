@@ -7,7 +7,7 @@ from typing import cast, get_args
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ...utils import find_section, get_element_text, get_tag_str
+from ...utils import find_elements, find_section, get_element_text, get_tag_name
 from ..models import LicenceClassificationT, TransportModeT, TXCOperator
 
 log = get_logger()
@@ -87,8 +87,8 @@ def parse_operators(xml_data: _Element) -> list[TXCOperator]:
     }
 
     operators: list[TXCOperator] = []
-    for operator_xml in section.findall("*"):
-        tag_name = get_tag_str(operator_xml)
+    for operator_xml in find_elements(section, "*"):
+        tag_name = get_tag_name(operator_xml)
         if tag_name is None:
             log.warning("Unknown operator type. Skipping.", tag=operator_xml.tag)
             continue
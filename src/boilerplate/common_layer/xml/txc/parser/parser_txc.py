@@ -2,24 +2,45 @@
 Parse TXC XML into Pydantic Models
 """
 
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
+from typing import Any
 
+from lxml import etree
 from lxml.etree import QName, _Element  # type: ignore
 from pydantic import BaseModel, Field
 from structlog.stdlib import get_logger
 
-from ...utils import get_file_hash, load_xml_tree
+from ...utils import get_file_hash, get_tag_name, load_xml_tree
+from ..models import (
+    AnnotatedStopPointRef,
+    TXCFlexibleVehicleJourney,
+    TXCJourneyPatternSection,
+    TXCOperator,
+    TXCRoute,
+    TXCRouteSection,
+    TXCService,
+    TXCServicedOrganisation,
+    TXCStopPoint,
+    TXCVehicleJourney,
+)
 from ..models.txc_data import TXCData
+from ..models.txc_metadata import TXCMetadata
 from ..parser.metadata import parse_metadata
-from .journey_pattern_sections import parse_journey_pattern_sections
+from .journey_pattern_sections import (
+    parse_journey_pattern_section,
+    parse_journey_pattern_sections,
+)
 from .operators import parse_operators
-from .route_sections import parse_route_sections
+from .parser_txc_parallel import parse_sections_in_pool
+from .route_sections import parse_route_section, parse_route_sections
 from .routes import parse_routes
 from .serviced_organisation import parse_serviced_organisations
 from .services import parse_services
-from .stop_points import parse_stop_points
-from .vehicle_journeys import parse_vehicle_journeys
+from .stop_points import parse_stop_point, parse_stop_points
+from .vehicle_journeys import parse_vehicle_journey, parse_vehicle_journeys
+from .vehicle_journeys_flexible import parse_flexible_vehicle_journey
 
 log = get_logger()
 
@@ -73,6 +94,24 @@ class TXCParserConfig(BaseModel):
         description="Calculate and include file hash in metadata",
         title="Parse File Hash",
     )
+    parallel_sections: bool = Field(
+        default=False,
+        description="Parse the independent sections at the same time in a "
+        "process pool. Ignored when streaming",
+        title="Parallel Section Parse",
+    )
+    max_workers: int | None = Field(
+        default=None,
+        description="Maximum processes for parallel section parsing, "
+        "defaults to the CPU count",
+        title="Max Workers",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Parse the file section by section with iterparse "
+        "instead of loading the whole tree into memory",
+        title="Streaming Parse",
+    )
 
     @classmethod
     def parse_all(cls) -> "TXCParserConfig":
@@ -83,9 +122,7 @@ class TXCParserConfig(BaseModel):
     def parse_stops_only(cls) -> "TXCParserConfig":
         """Create a config where only stop_points are parsed."""
         # Use dict comprehension to set all fields to False except stop_points
-        return cls(
-            **{field: field == "stop_points" for field in cls.model_fields.keys()}
-        )
+        return cls(**{name: name == "stop_points" for name in cls.model_fields.keys()})
 
     def should_parse(self, section_name: str) -> bool:
         """Check if a section should be parsed based on config."""
@@ -103,13 +140,50 @@ def strip_namespace(xml_data: _Element) -> _Element:
     return xml_data
 
 
-def load_xml_data(filename: Path | BytesIO) -> _Element:
+def load_xml_data(filename: Path | BytesIO, strip_namespaces: bool = True) -> _Element:
     """
-    Load the XML Data and strip namespaces for ease of query
+    Load the XML Data and optionally strip namespaces for ease of query
+    The TXC parsers are namespace aware so they don't need the tags rewritten
     """
     log.info("Opening TXC file", filename=filename)
     tree = load_xml_tree(filename)
-    return strip_namespace(tree.getroot())
+    if strip_namespaces:
+        return strip_namespace(tree.getroot())
+    return tree.getroot()
+
+
+PARALLEL_SECTIONS = {
+    "serviced_organisations": "ServicedOrganisations",
+    "stop_points": "StopPoints",
+    "route_sections": "RouteSections",
+    "journey_pattern_sections": "JourneyPatternSections",
+    "operators": "Operators",
+    "services": "Services",
+    "vehicle_journeys": "VehicleJourneys",
+}
+
+
+def txc_data_from_parallel_sections(
+    xml_data: _Element,
+    sections: dict[str, list[Any]],
+    config: TXCParserConfig,
+) -> TXCData:
+    """
+    Join the sections parsed in the process pool into TXCData
+    Routes depend on the route sections so are parsed afterwards
+    """
+    route_sections = sections.get("RouteSections", [])
+    return TXCData(
+        Metadata=parse_metadata(xml_data, file_hash=None) if config.metadata else None,
+        ServicedOrganisations=sections.get("ServicedOrganisations", []),
+        StopPoints=sections.get("StopPoints", []),
+        RouteSections=route_sections,
+        Routes=parse_routes(xml_data, route_sections) if config.routes else [],
+        JourneyPatternSections=sections.get("JourneyPatternSections", []),
+        Operators=sections.get("Operators", []),
+        Services=sections.get("Services", []),
+        VehicleJourneys=sections.get("VehicleJourneys", []),
+    )
 
 
 def parse_txc_from_element(
@@ -122,6 +196,20 @@ def parse_txc_from_element(
     """
     config = config or TXCParserConfig()
 
+    if config.parallel_sections:
+        sections = parse_sections_in_pool(
+            xml_data,
+            [
+                section_name
+                for field_name, section_name in PARALLEL_SECTIONS.items()
+                if config.should_parse(field_name)
+            ],
+            config.track_data,
+            config.max_workers,
+        )
+        if sections is not None:
+            return txc_data_from_parallel_sections(xml_data, sections, config)
+
     # Handle route sections first since it's needed for routes
     route_sections = (
         parse_route_sections(xml_data, parse_track_data=config.track_data)
@@ -154,6 +242,180 @@ def parse_txc_from_element(
     return txc_data
 
 
+@dataclass
+class StreamedTXCSections:
+    """
+    Pydantic models collected while streaming a TXC file
+    Vehicle Journeys are kept separately so the regular journeys
+    come before the flexible ones, matching parse_vehicle_journeys
+    """
+
+    metadata: TXCMetadata | None = None
+    serviced_organisations: list[TXCServicedOrganisation] = field(default_factory=list)
+    stop_points: list[AnnotatedStopPointRef | TXCStopPoint] = field(
+        default_factory=list
+    )
+    route_sections: list[TXCRouteSection] = field(default_factory=list)
+    routes: list[TXCRoute] = field(default_factory=list)
+    journey_pattern_sections: list[TXCJourneyPatternSection] = field(
+        default_factory=list
+    )
+    operators: list[TXCOperator] = field(default_factory=list)
+    services: list[TXCService] = field(default_factory=list)
+    vehicle_journeys: list[TXCVehicleJourney] = field(default_factory=list)
+    flexible_vehicle_journeys: list[TXCFlexibleVehicleJourney] = field(
+        default_factory=list
+    )
+
+    def to_txc_data(self) -> TXCData:
+        """
+        Combine the collected sections into TXCData
+        """
+        return TXCData(
+            Metadata=self.metadata,
+            ServicedOrganisations=self.serviced_organisations,
+            StopPoints=self.stop_points,
+            RouteSections=self.route_sections,
+            Routes=self.routes,
+            JourneyPatternSections=self.journey_pattern_sections,
+            Operators=self.operators,
+            Services=self.services,
+            VehicleJourneys=[
+                *self.vehicle_journeys,
+                *self.flexible_vehicle_journeys,
+            ],
+        )
+
+
+def release_element(elem: _Element) -> None:
+    """
+    Free a processed element and any previously processed siblings
+    """
+    elem.clear()
+    parent = elem.getparent()
+    if parent is None:
+        return
+    while elem.getprevious() is not None:
+        del parent[0]
+
+
+def parse_streamed_item(
+    section_name: str,
+    item_xml: _Element,
+    config: TXCParserConfig,
+    sections: StreamedTXCSections,
+) -> None:
+    """
+    Parse a single child of one of the large TXC sections
+    These are parsed item by item so the section never has to be held in memory
+    """
+    match section_name, get_tag_name(item_xml):
+        case "StopPoints", _ if config.stop_points:
+            stop_point = parse_stop_point(item_xml)
+            if stop_point:
+                sections.stop_points.append(stop_point)
+        case "RouteSections", "RouteSection" if config.route_sections:
+            route_section = parse_route_section(item_xml, config.track_data)
+            if route_section:
+                sections.route_sections.append(route_section)
+        case (
+            "JourneyPatternSections",
+            "JourneyPatternSection",
+        ) if config.journey_pattern_sections:
+            journey_pattern_section = parse_journey_pattern_section(item_xml)
+            if journey_pattern_section:
+                sections.journey_pattern_sections.append(journey_pattern_section)
+        case "VehicleJourneys", "VehicleJourney" if config.vehicle_journeys:
+            vehicle_journey = parse_vehicle_journey(item_xml)
+            if vehicle_journey:
+                sections.vehicle_journeys.append(vehicle_journey)
+        case "VehicleJourneys", "FlexibleVehicleJourney" if config.vehicle_journeys:
+            flexible_journey = parse_flexible_vehicle_journey(item_xml)
+            if flexible_journey:
+                sections.flexible_vehicle_journeys.append(flexible_journey)
+
+
+def parse_streamed_section(
+    section_name: str,
+    root: _Element,
+    config: TXCParserConfig,
+    sections: StreamedTXCSections,
+) -> None:
+    """
+    Parse one of the smaller TXC sections once it has been fully read
+    The root only holds the current section at this point
+    """
+    match section_name:
+        case "ServicedOrganisations" if config.serviced_organisations:
+            sections.serviced_organisations = parse_serviced_organisations(root)
+        case "Routes" if config.routes:
+            sections.routes = parse_routes(root, sections.route_sections)
+        case "Operators" if config.operators:
+            sections.operators = parse_operators(root)
+        case "Services" if config.services:
+            sections.services = parse_services(root)
+
+
+STREAMED_ITEM_SECTIONS = frozenset(
+    ["StopPoints", "RouteSections", "JourneyPatternSections", "VehicleJourneys"]
+)
+
+
+def parse_txc_streaming(
+    source: Path | BytesIO,
+    config: TXCParserConfig | None = None,
+) -> TXCData:
+    """
+    Parse a TXC file with iterparse without building the whole tree
+    Each element is cleared once it has been turned into a Pydantic model
+    Returns the same TXCData as parse_txc_from_element
+    """
+    config = config or TXCParserConfig()
+    log.info("Streaming TXC file", filename=source)
+    sections = StreamedTXCSections()
+    context = etree.iterparse(
+        str(source) if isinstance(source, Path) else source,
+        events=("start", "end"),
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+    depth = 0
+    section_name = ""
+    root: _Element | None = None
+    try:
+        for event, elem in context:
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = elem
+                    if config.metadata:
+                        sections.metadata = parse_metadata(elem, file_hash=None)
+                elif depth == 2:
+                    section_name = get_tag_name(elem) or ""
+                continue
+
+            depth -= 1
+            if depth == 2 and section_name in STREAMED_ITEM_SECTIONS:
+                parse_streamed_item(section_name, elem, config, sections)
+                release_element(elem)
+            elif depth == 1 and root is not None:
+                parse_streamed_section(section_name, root, config, sections)
+                release_element(elem)
+    finally:
+        del context
+
+    log.info(
+        "Streamed TXC file",
+        stop_points=len(sections.stop_points),
+        route_sections=len(sections.route_sections),
+        journey_pattern_sections=len(sections.journey_pattern_sections),
+        vehicle_journeys=len(sections.vehicle_journeys),
+        flexible_vehicle_journeys=len(sections.flexible_vehicle_journeys),
+    )
+    return sections.to_txc_data()
+
+
 def parse_txc_file(
     filename: Path,
     config: TXCParserConfig | None = None,
@@ -166,8 +428,11 @@ def parse_txc_file(
 
     file_hash = get_file_hash(filename) if config.file_hash else None
 
-    xml_data = load_xml_data(filename)
-    txc_data = parse_txc_from_element(xml_data, config)
+    if config.streaming:
+        txc_data = parse_txc_streaming(filename, config)
+    else:
+        xml_data = load_xml_data(filename, strip_namespaces=False)
+        txc_data = parse_txc_from_element(xml_data, config)
 
     if file_hash and txc_data.Metadata:
         txc_data.Metadata.FileHash = file_hash
@@ -0,0 +1,105 @@
+"""
+Parse independent TXC sections at the same time in a process pool
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from lxml import etree
+from lxml.etree import QName, _Element  # type: ignore
+from structlog.stdlib import get_logger
+
+from ...utils import find_element, get_namespace
+from .journey_pattern_sections import parse_journey_pattern_sections
+from .operators import parse_operators
+from .route_sections import parse_route_sections
+from .serviced_organisation import parse_serviced_organisations
+from .services import parse_services
+from .stop_points import parse_stop_points
+from .vehicle_journeys import parse_vehicle_journeys
+
+log = get_logger()
+
+
+def parse_section(
+    section_name: str, section_xml: bytes, parse_track_data: bool
+) -> list[Any]:
+    """
+    Parse a serialised top level section in a worker process
+    The section is wrapped in a TransXChange root so the section parsers can find it
+    """
+    section = etree.fromstring(section_xml)
+    namespace = get_namespace(section)
+    root = etree.Element(
+        QName(namespace, "TransXChange") if namespace else "TransXChange"
+    )
+    root.append(section)
+
+    match section_name:
+        case "ServicedOrganisations":
+            return parse_serviced_organisations(root)
+        case "StopPoints":
+            return parse_stop_points(root)
+        case "RouteSections":
+            return parse_route_sections(root, parse_track_data)
+        case "JourneyPatternSections":
+            return parse_journey_pattern_sections(root)
+        case "Operators":
+            return parse_operators(root)
+        case "Services":
+            return parse_services(root)
+        case "VehicleJourneys":
+            return parse_vehicle_journeys(root)
+    raise ValueError(f"No parallel parser for section {section_name}")
+
+
+def create_executor(max_workers: int | None) -> ProcessPoolExecutor | None:
+    """
+    Create the process pool
+    Returns None where multiprocessing is unavailable (e.g. no /dev/shm in Lambda)
+    """
+    try:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    except (OSError, NotImplementedError):
+        log.warning("Process pool unavailable, parsing sections sequentially")
+        return None
+
+
+def parse_sections_in_pool(
+    xml_data: _Element,
+    section_names: list[str],
+    parse_track_data: bool,
+    max_workers: int | None = None,
+) -> dict[str, list[Any]] | None:
+    """
+    Serialise each requested top level section and parse them concurrently
+    Sections missing from the document return an empty list
+    Returns None if a process pool could not be created
+    """
+    executor = create_executor(max_workers)
+    if executor is None:
+        return None
+
+    results: dict[str, list[Any]] = {name: [] for name in section_names}
+    with executor:
+        futures: dict[str, Future[list[Any]]] = {}
+        for section_name in section_names:
+            section = find_element(xml_data, section_name)
+            if section is None:
+                log.warning("Top Level tag not found", section=section_name)
+                continue
+            futures[section_name] = executor.submit(
+                parse_section,
+                section_name,
+                etree.tostring(section),
+                parse_track_data,
+            )
+        for section_name, future in futures.items():
+            results[section_name] = future.result()
+
+    log.info(
+        "Parsed TXC sections in parallel",
+        sections=list(futures),
+        max_workers=max_workers,
+    )
+    return results
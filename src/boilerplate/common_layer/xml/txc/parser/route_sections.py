@@ -7,9 +7,12 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
+    find_elements,
     find_section,
     get_element_int,
     get_element_text,
+    get_tag_name,
     parse_creation_datetime,
     parse_modification,
     parse_modification_datetime,
@@ -49,7 +52,7 @@ def parse_location(location_xml: _Element) -> TXCLocation | None:
         return None
 
     lon, lat = None, None
-    translation = location_xml.find("Translation", None)
+    translation = find_element(location_xml, "Translation")
     if translation:
         lon, lat = get_lon_lat_from_location(translation)
     else:
@@ -65,10 +68,10 @@ def parse_locations(track_xml: _Element) -> list[TXCLocation] | None:
     """
     Create Locations list
     """
-    if track_xml.tag != "Track":
+    if get_tag_name(track_xml) != "Track":
         return None
     locations: list[TXCLocation] = []
-    location_xmls = track_xml.findall("Mapping/Location")
+    location_xmls = find_elements(track_xml, "Mapping/Location")
     if location_xmls:
         for location_xml in location_xmls:
             location = parse_location(location_xml)
@@ -82,7 +85,7 @@ def parse_track(route_link_xml: _Element) -> TXCTrack | None:
     """
     Create Track
     """
-    track_xml = route_link_xml.find("Track")
+    track_xml = find_element(route_link_xml, "Track")
     if track_xml is not None:
         locations = parse_locations(track_xml)
         if locations:
@@ -139,7 +142,7 @@ def parse_route_links(
     Generate list of route links
     """
     route_links: list[TXCRouteLink] = []
-    route_link_xmls = route_section_xml.findall("RouteLink")
+    route_link_xmls = find_elements(route_section_xml, "RouteLink")
 
     for route_link_xml in route_link_xmls:
         route_link = parse_route_link(route_link_xml, parse_track_data)
@@ -184,7 +187,7 @@ def parse_route_sections(
         return []
 
     route_sections: list[TXCRouteSection] = []
-    route_section_xmls = section.findall("RouteSection")
+    route_section_xmls = find_elements(section, "RouteSection")
 
     for route_section_xml in route_section_xmls:
         generated_route_section = parse_route_section(
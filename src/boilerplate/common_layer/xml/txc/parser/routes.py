@@ -6,6 +6,7 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_elements,
     find_section,
     get_element_text,
     parse_creation_datetime,
@@ -27,7 +28,7 @@ def gather_route_sections(route_xml: _Element, route_sections: list[TXCRouteSect
         route_sections_dict[route_section.id] = route_section
 
     route_section_refs: list[TXCRouteSection] = []
-    for route_section_ref_xml in route_xml.findall("RouteSectionRef"):
+    for route_section_ref_xml in find_elements(route_xml, "RouteSectionRef"):
         route_section_ref = route_section_ref_xml.text
         if route_section_ref in route_sections_dict:
             route_section_refs.append(route_sections_dict[route_section_ref])
@@ -47,7 +48,7 @@ def parse_routes(
         return []
 
     routes: list[TXCRoute] = []
-    for route_xml in section.findall("Route"):
+    for route_xml in find_elements(section, "Route"):
         route_id = route_xml.get("id")
         if not route_id:
             log.warning("Route missing required id attribute. Skipping.")
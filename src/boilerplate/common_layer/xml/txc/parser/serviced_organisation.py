@@ -8,6 +8,8 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
+    find_elements,
     find_section,
     get_elem_bool_default,
     get_element_date,
@@ -56,7 +58,7 @@ def parse_date_ranges(
     Returns None if no date ranges were parsed
     """
     date_ranges: list[TXCServicedOrganisationDatePattern] = []
-    for date_range in date_ranges_xml.findall("DateRange"):
+    for date_range in find_elements(date_ranges_xml, "DateRange"):
         parsed_range = parse_date_range(date_range)
         if parsed_range is not None:
             date_ranges.append(parsed_range)
@@ -67,7 +69,7 @@ def parse_working_days(
     org_xml: _Element,
 ) -> list[TXCServicedOrganisationDatePattern] | None:
     """Parse WorkingDays section of a serviced organisation"""
-    working_days_xml = org_xml.find("WorkingDays")
+    working_days_xml = find_element(org_xml, "WorkingDays")
     if working_days_xml is None:
         return None
     return parse_date_ranges(working_days_xml)
@@ -77,7 +79,7 @@ def parse_holidays(
     org_xml: _Element,
 ) -> list[TXCServicedOrganisationDatePattern] | None:
     """Parse Holidays section of a serviced organisation"""
-    holidays_xml = org_xml.find("Holidays")
+    holidays_xml = find_element(org_xml, "Holidays")
     if holidays_xml is None:
         return None
     return parse_date_ranges(holidays_xml)
@@ -87,7 +89,7 @@ def parse_annotated_locality(
     org_xml: _Element,
 ) -> TXCServicedOrganisationAnnotatedNptgLocalityRef | None:
     """Parse AnnotatedNptgLocalityRef section"""
-    locality_xml = org_xml.find("AnnotatedNptgLocalityRef")
+    locality_xml = find_element(org_xml, "AnnotatedNptgLocalityRef")
     if locality_xml is None:
         return None
     locality_ref = get_element_text(locality_xml, "NptgLocalityRef")
@@ -160,7 +162,7 @@ def parse_serviced_organisations(xml_data: _Element) -> list[TXCServicedOrganisa
         return []
 
     orgs: list[TXCServicedOrganisation] = []
-    for org_xml in section.findall("ServicedOrganisation"):
+    for org_xml in find_elements(section, "ServicedOrganisation"):
         org_parsed = parse_serviced_organisation(org_xml)
         if org_parsed:
             orgs.append(org_parsed)
@@ -9,6 +9,8 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
+    find_elements,
     find_section,
     get_elem_bool_default,
     get_element_date,
@@ -40,7 +42,7 @@ def parse_line_description(line_description_xml: _Element) -> TXCLineDescription
     destination = get_element_text(line_description_xml, "Destination")
     description = get_element_text(line_description_xml, "Description")
 
-    vias_xml = line_description_xml.find("Vias")
+    vias_xml = find_element(line_description_xml, "Vias")
     vias = get_element_texts(vias_xml, "Via") if vias_xml is not None else []
     if not description:
         log.warning("Service Line Description Missing")
@@ -66,13 +68,13 @@ def parse_line(line_xml: _Element) -> TXCLine | None:
         return None
 
     marketing_name = get_element_text(line_xml, "MarketingName")
-    outbound_description_xml = line_xml.find("OutboundDescription")
+    outbound_description_xml = find_element(line_xml, "OutboundDescription")
     outbound_description = (
         parse_line_description(outbound_description_xml)
         if outbound_description_xml is not None
         else None
     )
-    inbound_description_xml = line_xml.find("InboundDescription")
+    inbound_description_xml = find_element(line_xml, "InboundDescription")
     inbound_description = (
         parse_line_description(inbound_description_xml)
         if inbound_description_xml is not None
@@ -153,7 +155,7 @@ def parse_standard_service(standard_service_xml: _Element) -> TXCStandardService
         return None
 
     journey_patterns: list[TXCJourneyPattern] = []
-    for journey_pattern_xml in standard_service_xml.findall("JourneyPattern"):
+    for journey_pattern_xml in find_elements(standard_service_xml, "JourneyPattern"):
         journey_pattern = parse_journey_pattern(journey_pattern_xml)
         if journey_pattern:
             journey_patterns.append(journey_pattern)
@@ -169,7 +171,7 @@ def parse_operating_period(service_xml: _Element) -> tuple[date | None, date | N
     """
     Parse the operating period from OperatingPeriod in a TXC Service
     """
-    operating_period_xml = service_xml.find("OperatingPeriod")
+    operating_period_xml = find_element(service_xml, "OperatingPeriod")
     if operating_period_xml is not None:
         start_date = get_element_date(operating_period_xml, "StartDate")
         end_date = get_element_date(operating_period_xml, "EndDate")
@@ -181,14 +183,14 @@ def parse_service_type(
     service_xml: _Element,
 ) -> tuple[TXCStandardService | None, TXCFlexibleService | None]:
     """Parse standard or flexible service from service XML."""
-    standard_service_xml = service_xml.find("StandardService")
+    standard_service_xml = find_element(service_xml, "StandardService")
     standard_service = (
         parse_standard_service(standard_service_xml)
         if standard_service_xml is not None
         else None
     )
 
-    flexible_service_xml = service_xml.find("FlexibleService")
+    flexible_service_xml = find_element(service_xml, "FlexibleService")
     flexible_service = (
         parse_flexible_service(flexible_service_xml)
         if flexible_service_xml is not None
@@ -207,7 +209,7 @@ def parse_transport_mode(service_xml: _Element) -> TransportModeT:
 def parse_lines_list(service_xml: _Element) -> list[TXCLine]:
     """Parse lines from service XML."""
     lines: list[TXCLine] = []
-    for line_xml in service_xml.findall("Lines/Line"):
+    for line_xml in find_elements(service_xml, "Lines/Line"):
         line = parse_line(line_xml)
         if line:
             lines.append(line)
@@ -226,7 +228,7 @@ def parse_service(service_xml: _Element) -> TXCService | None:
     standard_service, flexible_service = parse_service_type(service_xml)
     mode = parse_transport_mode(service_xml)
 
-    operating_profile_xml = service_xml.find("OperatingProfile")
+    operating_profile_xml = find_element(service_xml, "OperatingProfile")
     operating_profile = (
         parse_operating_profile(operating_profile_xml)
         if operating_profile_xml is not None
@@ -277,7 +279,7 @@ def parse_services(xml_data: _Element) -> list[TXCService]:
         return []
 
     services: list[TXCService] = []
-    for service_xml in section.findall("Service"):
+    for service_xml in find_elements(section, "Service"):
 
         service_parsed = parse_service(service_xml)
         if service_parsed:
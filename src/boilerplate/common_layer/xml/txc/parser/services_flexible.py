@@ -5,7 +5,13 @@ Parsing of FlexibleService in a TXCService
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ...utils import get_elem_bool_default, get_element_text
+from ...utils import (
+    find_element,
+    find_elements,
+    get_elem_bool_default,
+    get_element_text,
+    get_tag_name,
+)
 from ..models import (
     TXCBookingArrangements,
     TXCFixedStopUsage,
@@ -29,7 +35,7 @@ def parse_flexible_stop_usage(
     if not stop_point_ref:
         return None
 
-    if stop_usage_xml.tag == "FlexibleStopUsage":
+    if get_tag_name(stop_usage_xml) == "FlexibleStopUsage":
         return TXCFlexibleStopUsage(StopPointRef=stop_point_ref)
     timing_status: str | None = get_element_text(stop_usage_xml, "TimingStatus")
     return TXCFixedStopUsage(
@@ -49,7 +55,7 @@ def parse_booking_arrangements(booking_xml: _Element) -> TXCBookingArrangements
         )
         return None
     description = " ".join(description.split())
-    phone_xml: _Element | None = booking_xml.find("Phone")
+    phone_xml: _Element | None = find_element(booking_xml, "Phone")
     tel_number: str | None = (
         get_element_text(phone_xml, "TelNationalNumber")
         if phone_xml is not None
@@ -85,17 +91,17 @@ def parse_flexible_journey_pattern(
     stop_points: list[TXCFlexibleStopUsage | TXCFixedStopUsage] = []
     flexible_zones: list[TXCFlexibleStopUsage] = []
 
-    for stop_xml in pattern_xml.findall("StopPointsInSequence/*"):
+    for stop_xml in find_elements(pattern_xml, "StopPointsInSequence/*"):
         stop = parse_flexible_stop_usage(stop_xml)
         if stop:
             stop_points.append(stop)
 
-    for stop_xml in pattern_xml.findall("FlexibleZones/*"):
+    for stop_xml in find_elements(pattern_xml, "FlexibleZones/*"):
         stop = parse_flexible_stop_usage(stop_xml)
         if isinstance(stop, TXCFlexibleStopUsage):
             flexible_zones.append(stop)
 
-    booking_xml: _Element | None = pattern_xml.find("BookingArrangements")
+    booking_xml: _Element | None = find_element(pattern_xml, "BookingArrangements")
     booking: TXCBookingArrangements | None = (
         parse_booking_arrangements(booking_xml) if booking_xml is not None else None
     )
@@ -120,7 +126,7 @@ def parse_flexible_service(flex_service_xml: _Element) -> TXCFlexibleService | N
         return None
 
     patterns: list[TXCFlexibleJourneyPattern] = []
-    for pattern_xml in flex_service_xml.findall("FlexibleJourneyPattern"):
+    for pattern_xml in find_elements(flex_service_xml, "FlexibleJourneyPattern"):
         pattern = parse_flexible_journey_pattern(pattern_xml)
         if pattern:
             patterns.append(pattern)
@@ -14,12 +14,14 @@ from .parse_stop_point_on_street import (
 from .stop_points import (
     parse_descriptor_structure,
     parse_stop_classification_structure,
+    parse_stop_point,
     parse_stop_points,
     parse_txc_stop_point,
 )
 
 __all__ = [
     "parse_stop_points",
+    "parse_stop_point",
     "parse_txc_stop_point",
     "parse_bus_stop_structure",
     "parse_on_street_structure",
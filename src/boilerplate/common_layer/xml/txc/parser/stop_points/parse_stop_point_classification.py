@@ -7,7 +7,7 @@ from typing import cast, get_args
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ....utils import get_element_text
+from ....utils import find_element, get_element_text
 from ...models import (
     STOP_CLASSIFICATION_STOP_TYPE_MAPPING,
     StopClassificationStructure,
@@ -41,7 +41,7 @@ def parse_stop_classification_structure(
         return None
 
     # Try parsing OnStreet first
-    on_street_xml = stop_classification_xml.find("OnStreet")
+    on_street_xml = find_element(stop_classification_xml, "OnStreet")
     if on_street_xml is not None:
         on_street = parse_on_street_structure(on_street_xml)
         if on_street:
@@ -52,7 +52,7 @@ def parse_stop_classification_structure(
             )
 
     # If no OnStreet, try OffStreet
-    off_street_xml = stop_classification_xml.find("OffStreet")
+    off_street_xml = find_element(stop_classification_xml, "OffStreet")
     if off_street_xml is not None:
         off_street = parse_off_street_structure(off_street_xml)
         if off_street:
@@ -5,7 +5,7 @@ Location Parsing
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ....utils import get_element_text
+from ....utils import find_element, get_element_text
 from ...models import LocationStructure, PlaceStructure
 
 log = get_logger()
@@ -15,7 +15,7 @@ def parse_location_structure(location_xml: _Element) -> LocationStructure:
     """
     StopPoints -> StopPoint -> Place -> Location
     """
-    translation_xml = location_xml.find("Translation")
+    translation_xml = find_element(location_xml, "Translation")
     if translation_xml is not None:
         return LocationStructure(
             Longitude=get_element_text(translation_xml, "Longitude"),
@@ -35,7 +35,7 @@ def parse_place_structure(place_xml: _Element) -> PlaceStructure | None:
     """
     StopPoints -> StopPoint -> Place
     """
-    location_xml = place_xml.find("Location")
+    location_xml = find_element(place_xml, "Location")
     location = (
         parse_location_structure(location_xml) if location_xml is not None else None
     )
@@ -7,7 +7,7 @@ from typing import cast, get_args
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ....utils import get_element_text
+from ....utils import find_element, get_element_text
 from ...models import (
     BearingStructure,
     CompassPointT,
@@ -35,7 +35,7 @@ def parse_unmarked_point_structure(
     """
     StopPoints -> StopPoint -> StopClassification -> OnStreet -> Bus -> UnmarkedPoint
     """
-    bearing_xml = unmarked_point_xml.find("Bearing")
+    bearing_xml = find_element(unmarked_point_xml, "Bearing")
     if bearing_xml is None:
         return None
     bearing = parse_bearing_structure(bearing_xml)
@@ -48,7 +48,7 @@ def parse_marked_point_structure(
     """
     StopPoints -> StopPoint -> StopClassification -> OnStreet -> Bus -> MarkedPoint
     """
-    bearing_xml = marked_point_xml.find("Bearing")
+    bearing_xml = find_element(marked_point_xml, "Bearing")
     if bearing_xml is None:
         return None
     bearing = parse_bearing_structure(bearing_xml)
@@ -7,7 +7,7 @@ from typing import cast, get_args
 from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
-from ....utils import get_element_text
+from ....utils import find_element, find_elements, get_element_text
 from ...models import (
     BusStopStructure,
     BusStopTypeT,
@@ -32,8 +32,8 @@ def parse_bus_stop_structure(bus_xml: _Element) -> BusStopStructure | None:
 
     StopPoints -> StopPoint -> StopClassification -> OnStreet -> Bus
     """
-    marked_point_xml = bus_xml.find("MarkedPoint")
-    unmarked_point_xml = bus_xml.find("UnmarkedPoint")
+    marked_point_xml = find_element(bus_xml, "MarkedPoint")
+    unmarked_point_xml = find_element(bus_xml, "UnmarkedPoint")
 
     marked_point = (
         parse_marked_point_structure(marked_point_xml)
@@ -71,7 +71,7 @@ def parse_bus_stop_structure(bus_xml: _Element) -> BusStopStructure | None:
         log.warning("Missing MarkedPoint for marked bus stop type")
         return None
 
-    flexible_zone_xml = bus_xml.find("FlexibleZone")
+    flexible_zone_xml = find_element(bus_xml, "FlexibleZone")
     flexible_zone = (
         parse_flexible_zone(flexible_zone_xml)
         if flexible_zone_xml is not None
@@ -93,7 +93,7 @@ def parse_flexible_zone(xml: _Element) -> FlexibleZoneStructure:
 
     StopPoints -> StopPoint -> StopClassification -> OnStreet -> Bus -> FlexibleZone
     """
-    location_elements = xml.findall("Location")
+    location_elements = find_elements(xml, "Location")
     locations: list[LocationStructure] = []
     for loc_xml in location_elements:
         location = parse_location_structure(loc_xml)
@@ -105,8 +105,8 @@ def parse_taxi_structure(taxi_xml: _Element) -> TaxiStopClassificationStructure
     """
     Parse Taxi OnStreet Structure
     """
-    taxi_rank: _Element | None = taxi_xml.find("TaxiRank")
-    shared_taxi_rank: _Element | None = taxi_xml.find("SharedTaxiRank")
+    taxi_rank: _Element | None = find_element(taxi_xml, "TaxiRank")
+    shared_taxi_rank: _Element | None = find_element(taxi_xml, "SharedTaxiRank")
 
     taxi_rank_bool: bool = taxi_rank is not None
     shared_taxi_rank_bool: bool = shared_taxi_rank is not None
@@ -125,13 +125,13 @@ def parse_on_street_structure(on_street_xml: _Element) -> OnStreetStructure | No
 
     StopPoints -> StopPoint -> StopClassification -> OnStreet
     """
-    bus_xml = on_street_xml.find("Bus")
+    bus_xml = find_element(on_street_xml, "Bus")
     if bus_xml is not None:
         bus = parse_bus_stop_structure(bus_xml)
         if bus:
             return OnStreetStructure(Bus=bus)
 
-    taxi_xml = on_street_xml.find("Taxi")
+    taxi_xml = find_element(on_street_xml, "Taxi")
     if taxi_xml is not None:
         taxi = parse_taxi_structure(taxi_xml)
         if taxi:
@@ -6,7 +6,7 @@ from typing import get_args
 
 from lxml.etree import _Element  # type: ignore
 
-from ....utils import get_element_text
+from ....utils import find_element, get_element_text
 from ...models import (
     TIMING_STATUS_MAPPING,
     AirStopClassificationStructure,
@@ -41,17 +41,17 @@ def parse_bus_and_coach_structure(
     StopPoints -> StopPoint -> StopClassification -> OffStreet -> BusAndCoach
     """
     bay: BayStructure | None = None
-    bay_xml = bus_and_coach_xml.find("Bay")
+    bay_xml = find_element(bus_and_coach_xml, "Bay")
     if bay_xml is not None:
         bay = parse_bay_structure(bay_xml)
 
     varibay: BayStructure | None = None
-    varibay_xml = bus_and_coach_xml.find("VariableBay")
+    varibay_xml = find_element(bus_and_coach_xml, "VariableBay")
     if varibay_xml is not None:
         varibay = parse_bay_structure(varibay_xml)
 
-    entrance: bool = bus_and_coach_xml.find("Entrance") is not None
-    access_area: bool = bus_and_coach_xml.find("AccessArea") is not None
+    entrance: bool = find_element(bus_and_coach_xml, "Entrance") is not None
+    access_area: bool = find_element(bus_and_coach_xml, "AccessArea") is not None
 
     if not any([bay, varibay, entrance, access_area]):
         return None
@@ -68,9 +68,9 @@ def parse_ferry_structure(
     Parse the Ferry structure within the OffStreet section.
     StopPoints -> StopPoint -> StopClassification -> OffStreet -> Ferry
     """
-    entrance: bool = ferry_xml.find("Entrance") is not None
-    access_area: bool = ferry_xml.find("AccessArea") is not None
-    berth: bool = ferry_xml.find("Berth") is not None
+    entrance: bool = find_element(ferry_xml, "Entrance") is not None
+    access_area: bool = find_element(ferry_xml, "AccessArea") is not None
+    berth: bool = find_element(ferry_xml, "Berth") is not None
 
     if not any([entrance, access_area, berth]):
         return None
@@ -87,9 +87,9 @@ def parse_rail_structure(
     Parse the Rail structure within the OffStreet section.
     StopPoints -> StopPoint -> StopClassification -> OffStreet -> Rail
     """
-    entrance: bool = rail_xml.find("Entrance") is not None
-    access_area: bool = rail_xml.find("AccessArea") is not None
-    platform: bool = rail_xml.find("Platform") is not None
+    entrance: bool = find_element(rail_xml, "Entrance") is not None
+    access_area: bool = find_element(rail_xml, "AccessArea") is not None
+    platform: bool = find_element(rail_xml, "Platform") is not None
 
     if not any([entrance, access_area, platform]):
         return None
@@ -103,9 +103,9 @@ def parse_metro_structure(
     metro_xml: _Element,
 ) -> MetroStopClassificationStructure | None:
     """Parse the Metro structure within the OffStreet section."""
-    entrance_xml = metro_xml.find("Entrance")
-    access_area_xml = metro_xml.find("AccessArea")
-    platform_xml = metro_xml.find("Platform")
+    entrance_xml = find_element(metro_xml, "Entrance")
+    access_area_xml = find_element(metro_xml, "AccessArea")
+    platform_xml = find_element(metro_xml, "Platform")
 
     entrance = entrance_xml is not None
     access_area = access_area_xml is not None
@@ -123,8 +123,8 @@ def parse_air_structure(
     metro_xml: _Element,
 ) -> AirStopClassificationStructure | None:
     """Parse the Air structure within the OffStreet section."""
-    entrance_xml = metro_xml.find("Entrance")
-    access_area_xml = metro_xml.find("AccessArea")
+    entrance_xml = find_element(metro_xml, "Entrance")
+    access_area_xml = find_element(metro_xml, "AccessArea")
 
     entrance = entrance_xml is not None
     access_area = access_area_xml is not None
@@ -6,12 +6,15 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ....utils import (
+    find_element,
+    find_elements,
     find_section,
     get_element_bool,
     get_element_datetime,
     get_element_int,
     get_element_text,
     get_element_texts,
+    get_tag_name,
 )
 from ...models import AnnotatedStopPointRef, DescriptorStructure, TXCStopPoint
 from .parse_stop_point_classification import parse_stop_classification_structure
@@ -76,17 +79,17 @@ def parse_txc_stop_point(stop_xml: _Element) -> TXCStopPoint | None:
         )
         return None
 
-    descriptor_xml = stop_xml.find("Descriptor")
+    descriptor_xml = find_element(stop_xml, "Descriptor")
     descriptor = (
         parse_descriptor_structure(descriptor_xml)
         if descriptor_xml is not None
         else None
     )
 
-    place_xml = stop_xml.find("Place")
+    place_xml = find_element(stop_xml, "Place")
     place = parse_place_structure(place_xml) if place_xml is not None else None
 
-    stop_classification_xml = stop_xml.find("StopClassification")
+    stop_classification_xml = find_element(stop_xml, "StopClassification")
     stop_classification = (
         parse_stop_classification_structure(stop_classification_xml)
         if stop_classification_xml is not None
@@ -129,6 +132,23 @@ def parse_txc_stop_point(stop_xml: _Element) -> TXCStopPoint | None:
     return txc_stop_point
 
 
+def parse_stop_point(stop_xml: _Element) -> AnnotatedStopPointRef | TXCStopPoint | None:
+    """
+    StopPoints -> AnnotatedStopPointRef | StopPoint
+    Returns None for unknown or invalid stop points
+    """
+    tag_name = get_tag_name(stop_xml)
+    try:
+        if tag_name == "AnnotatedStopPointRef":
+            return parse_annotated_stop_point_ref(stop_xml)
+        if tag_name == "StopPoint":
+            return parse_txc_stop_point(stop_xml)
+        log.warning("Unknown stop point type. Skipping.", tag=stop_xml.tag)
+    except ValueError:
+        log.error("Error Processing Stop Point", exc_info=True)
+    return None
+
+
 def parse_stop_points(xml_data: _Element) -> list[AnnotatedStopPointRef | TXCStopPoint]:
     """
     Convert StopPoints XML into Pydantic Models
@@ -138,22 +158,12 @@ def parse_stop_points(xml_data: _Element) -> list[AnnotatedStopPointRef | TXCSto
     except ValueError:
         return []
     stop_points: list[AnnotatedStopPointRef | TXCStopPoint] = []
-    stops_xml = section.findall("*")
+    stops_xml = find_elements(section, "*")
 
     for stop_xml in stops_xml:
-        try:
-            if stop_xml.tag == "AnnotatedStopPointRef":
-                stop_points.append(parse_annotated_stop_point_ref(stop_xml))
-            elif stop_xml.tag == "StopPoint":
-                stop_point = parse_txc_stop_point(stop_xml)
-                if stop_point:
-
-                    stop_points.append(stop_point)
-            else:
-                log.warning("Unknown stop point type. Skipping.", tag=stop_xml.tag)
-        except ValueError:
-            log.error("Error Processing Stop Point", exc_info=True)
-            continue
+        stop_point = parse_stop_point(stop_xml)
+        if stop_point:
+            stop_points.append(stop_point)
     annotated_stop_point_ref_count = sum(
         isinstance(stop, AnnotatedStopPointRef) for stop in stop_points
     )
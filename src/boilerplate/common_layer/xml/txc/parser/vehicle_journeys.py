@@ -8,6 +8,8 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
+    find_elements,
     find_section,
     get_element_int,
     get_element_text,
@@ -63,12 +65,12 @@ def parse_vehicle_journey_timing_link(
     Parse VehicleJourneyTimingLink section
     """
     link_id = timing_link_xml.get("id")
-    from_xml = timing_link_xml.find("From")
+    from_xml = find_element(timing_link_xml, "From")
     from_stop_usage = (
         parse_vehicle_journey_stop_usage(from_xml) if from_xml is not None else None
     )
 
-    to_xml = timing_link_xml.find("To")
+    to_xml = find_element(timing_link_xml, "To")
     to_stop_usage = (
         parse_vehicle_journey_stop_usage(to_xml) if to_xml is not None else None
     )
@@ -100,7 +102,9 @@ def parse_vehicle_journey_timing_links(
     Parse all VehicleJourneyTimingLink sections
     """
     timing_links: list[TXCVehicleJourneyTimingLink] = []
-    for timing_link_xml in vehicle_journey_xml.findall("VehicleJourneyTimingLink"):
+    for timing_link_xml in find_elements(
+        vehicle_journey_xml, "VehicleJourneyTimingLink"
+    ):
         timing_link = parse_vehicle_journey_timing_link(timing_link_xml)
         timing_links.append(timing_link)
     return timing_links
@@ -110,13 +114,13 @@ def parse_operational(operational_xml: _Element) -> TXCOperational | None:
     """
     VehicleJourney->Operational
     """
-    ticket_machine_xml = operational_xml.find("TicketMachine")
+    ticket_machine_xml = find_element(operational_xml, "TicketMachine")
     ticket_machine = None
     if ticket_machine_xml is not None:
         journey_code = get_element_text(ticket_machine_xml, "JourneyCode")
         ticket_machine = TXCTicketMachine(JourneyCode=journey_code)
 
-    block_xml = operational_xml.find("Block")
+    block_xml = find_element(operational_xml, "Block")
     block = None
     if block_xml is not None:
         description = get_element_text(block_xml, "Description")
@@ -193,12 +197,12 @@ def parse_vehicle_journey(vehicle_journey_xml: _Element) -> TXCVehicleJourney |
         )
         return None
 
-    operational_xml = vehicle_journey_xml.find("Operational")
+    operational_xml = find_element(vehicle_journey_xml, "Operational")
     operational = (
         parse_operational(operational_xml) if operational_xml is not None else None
     )
 
-    operating_profile_xml = vehicle_journey_xml.find("OperatingProfile")
+    operating_profile_xml = find_element(vehicle_journey_xml, "OperatingProfile")
     operating_profile = (
         parse_operating_profile(operating_profile_xml)
         if operating_profile_xml is not None
@@ -219,7 +223,7 @@ def parse_vehicle_journey(vehicle_journey_xml: _Element) -> TXCVehicleJourney |
         else "notContracted"
     )
 
-    layover_point_xml = vehicle_journey_xml.find("LayoverPoint")
+    layover_point_xml = find_element(vehicle_journey_xml, "LayoverPoint")
     layover_point = (
         parse_layover_point(layover_point_xml)
         if layover_point_xml is not None
@@ -269,12 +273,12 @@ def parse_vehicle_journeys(
 
     journeys: list[TXCVehicleJourney | TXCFlexibleVehicleJourney] = []
 
-    for vehicle_journey_xml in section.findall("VehicleJourney"):
+    for vehicle_journey_xml in find_elements(section, "VehicleJourney"):
         vehicle_journey = parse_vehicle_journey(vehicle_journey_xml)
         if vehicle_journey:
             journeys.append(vehicle_journey)
 
-    for flexible_journey_xml in section.findall("FlexibleVehicleJourney"):
+    for flexible_journey_xml in find_elements(section, "FlexibleVehicleJourney"):
         flexible_journey = parse_flexible_vehicle_journey(flexible_journey_xml)
         if flexible_journey:
             journeys.append(flexible_journey)
@@ -8,7 +8,9 @@ from lxml.etree import _Element  # type: ignore
 from structlog.stdlib import get_logger
 
 from ...utils import (
+    find_element,
     get_element_text,
+    get_tag_name,
     parse_creation_datetime,
     parse_modification,
     parse_modification_datetime,
@@ -36,9 +38,10 @@ def parse_flexible_service_times(
 
     # Process children in document order
     for child in flexible_times_xml:
-        if child.tag == "AllDayService":
+        tag_name = get_tag_name(child)
+        if tag_name == "AllDayService":
             service_times.append(TXCFlexibleServiceTimes(AllDayService=True))
-        elif child.tag == "ServicePeriod":
+        elif tag_name == "ServicePeriod":
             start_time = get_element_text(child, "StartTime")
             if not start_time:
                 log.warning("ServicePeriod missing StartTime")
@@ -87,7 +90,7 @@ def parse_flexible_vehicle_journey(
         log.warning("FlexibleVehicleJourney missing LineRef")
         return None
 
-    flexible_times_xml = flexible_journey_xml.find("FlexibleServiceTimes")
+    flexible_times_xml = find_element(flexible_journey_xml, "FlexibleServiceTimes")
     if flexible_times_xml is None:
         log.warning("FlexibleVehicleJourney missing FlexibleServiceTimes element")
         return None
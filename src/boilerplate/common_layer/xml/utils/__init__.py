@@ -16,6 +16,8 @@ from .xml_utils_attributes import (
 )
 from .xml_utils_tags import (
     does_element_exist,
+    find_element,
+    find_elements,
     get_elem_bool_default,
     get_element_bool,
     get_element_date,
@@ -23,6 +25,8 @@ from .xml_utils_tags import (
     get_element_int,
     get_element_text,
     get_element_texts,
+    get_namespace,
+    get_namespaced_path,
     get_tag_name,
     get_tag_str,
 )
@@ -50,6 +54,10 @@ __all__ = [
     "get_tag_str",
     "get_tag_name",
     "does_element_exist",
+    "find_element",
+    "find_elements",
+    "get_namespace",
+    "get_namespaced_path",
     # Hashing Functions
     "get_file_hash",
     "get_bytes_hash",
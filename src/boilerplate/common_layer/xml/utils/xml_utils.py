@@ -9,6 +9,8 @@ from lxml import etree
 from lxml.etree import _Element, _ElementTree, parse  # type: ignore
 from structlog.stdlib import get_logger
 
+from .xml_utils_tags import find_element
+
 log = get_logger()
 
 
@@ -16,7 +18,7 @@ def find_section(xml_data: _Element, section_name: str) -> _Element:
     """
     Get Top Level XML Tag Element
     """
-    section = xml_data.find(section_name)
+    section = find_element(xml_data, section_name)
     if section is None:
         error_message = "Top Level tag not found"
         log.warning(error_message, section=section_name)
@@ -3,6 +3,7 @@ Functions to extract info from XML tags
 """
 
 from datetime import date, datetime
+from functools import lru_cache
 
 from lxml.etree import QName, _Element  # type: ignore
 from structlog.stdlib import get_logger
@@ -10,6 +11,48 @@ from structlog.stdlib import get_logger
 log = get_logger()
 
 
+def get_namespace(xml_element: _Element) -> str | None:
+    """
+    Get the namespace of an element from its tag
+    E.g.
+     - Tag: "{http://www.transxchange.org.uk/}StopPoint"
+     - Output: http://www.transxchange.org.uk/
+    """
+    tag = xml_element.tag
+    if isinstance(tag, str) and tag.startswith("{"):
+        return tag[1 : tag.index("}")]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def get_namespaced_path(path: str, namespace: str | None) -> str:
+    """
+    Qualify each tag in an ElementPath with the namespace
+    So namespaced documents can be queried without rewriting every tag
+    E.g. "From/StopPointRef" -> "{ns}From/{ns}StopPointRef"
+    """
+    if namespace is None:
+        return path
+    return "/".join(
+        step if not step or step[0] in "*.{@[" else f"{{{namespace}}}{step}"
+        for step in path.split("/")
+    )
+
+
+def find_element(xml_element: _Element, path: str) -> _Element | None:
+    """
+    Find the first matching child using the namespace of the element
+    """
+    return xml_element.find(get_namespaced_path(path, get_namespace(xml_element)))
+
+
+def find_elements(xml_element: _Element, path: str) -> list[_Element]:
+    """
+    Find all matching children using the namespace of the element
+    """
+    return xml_element.findall(get_namespaced_path(path, get_namespace(xml_element)))
+
+
 def does_element_exist(xml_element: _Element | None, element_name: str) -> bool:
     """
     Check whether element is there
@@ -18,14 +61,14 @@ def does_element_exist(xml_element: _Element | None, element_name: str) -> bool:
     """
     if xml_element is None:
         return False
-    return xml_element.find(element_name) is not None
+    return find_element(xml_element, element_name) is not None
 
 
 def get_element_text(xml_data: _Element, field_name: str) -> str | None:
     """
     Get XML Tag Text Value as string
     """
-    element = xml_data.find(field_name)
+    element = find_element(xml_data, field_name)
     if element is not None:
         return element.text
     return None
@@ -35,7 +78,7 @@ def get_element_texts(xml_data: _Element, field_name: str) -> list[str]:
     """
     Get a list of text values from multiple XML tags with the same name.
     """
-    elements = xml_data.findall(field_name)
+    elements = find_elements(xml_data, field_name)
     if elements:
         return [element.text for element in elements if element.text]
     return []
@@ -4,7 +4,7 @@ AV Scan Functions
 
 import os
 from pathlib import Path
-from typing import BinaryIO
+from typing import Protocol
 
 from clamd import BufferTooLongError, ClamdNetworkSocket
 from clamd import ConnectionError as ClamdConnectionError
@@ -21,6 +21,21 @@ from .models import ClamAVConfig, ScanResult
 log = get_logger()
 
 
+class ScanStream(Protocol):
+    """
+    Readable binary stream with a name, such as an open file
+    """
+
+    @property
+    def name(self) -> str:
+        """Name used in scan errors"""
+        ...
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Read up to size bytes, all remaining when -1"""
+        ...
+
+
 def get_clamav_config() -> ClamAVConfig:
     """
     Get Config for ClamAV
@@ -91,27 +106,36 @@ class FileScanner:
         """
         try:
             with file_path.open("rb") as file_:
-                result = self._perform_scan(file_)
-
-            if result.status == "ERROR":
-                log.error("Antivirus scan: FAILED", result=result)
-                raise ClamAVScanFailed(filename=str(file_path))
-            if result.status == "FOUND":
-                log.warning("Antivirus scan: FOUND", reason=result.reason)
-                if result.reason:
-                    raise SuspiciousFile(
-                        filename=str(file_path), message=f"Virus found: {result.reason}"
-                    )
-                raise SuspiciousFile(filename=str(file_path))
-
-            log.info("Antivirus scan: OK", file_path=str(file_path))
-
+                self.scan_stream(file_)
         except (OSError, IOError) as e:
             msg = f"Failed to read file for virus scan: {e}"
             log.exception(msg)
             raise ClamConnectionError(filename=str(file_path), message=msg) from e
 
-    def _perform_scan(self, file_: BinaryIO) -> ScanResult:
+    def scan_stream(self, file_: ScanStream) -> None:
+        """
+        Scan an open file for viruses, reading it once from its current position
+
+        Args:
+            file_: Readable binary file object with a name
+        """
+        filename = str(file_.name)
+        result = self._perform_scan(file_)
+
+        if result.status == "ERROR":
+            log.error("Antivirus scan: FAILED", result=result)
+            raise ClamAVScanFailed(filename=filename)
+        if result.status == "FOUND":
+            log.warning("Antivirus scan: FOUND", reason=result.reason)
+            if result.reason:
+                raise SuspiciousFile(
+                    filename=filename, message=f"Virus found: {result.reason}"
+                )
+            raise SuspiciousFile(filename=filename)
+
+        log.info("Antivirus scan: OK", file_path=filename)
+
+    def _perform_scan(self, file_: ScanStream) -> ScanResult:
         """
         Perform the ClamAV scan on an open file
 
@@ -158,14 +182,25 @@ class FileScanner:
             raise ClamConnectionError(filename=str(file_.name), message=msg) from e
 
 
-def av_scan_file(clam_av_config: ClamAVConfig, file_to_scan: Path) -> None:
+def get_file_scanner(clam_av_config: ClamAVConfig) -> FileScanner:
     """
-    Scan the file with a scanner
+    Connect to ClamAV, checking it's responding
     """
-    # Connect/Scan the file object
     av_scanner = FileScanner(clam_av_config)
-
-    # Check if ClamAV is responding
     if not av_scanner.clamav.ping():
         raise ClamConnectionError("ClamAV is not running or accessible.")
-    av_scanner.scan(file_to_scan)
+    return av_scanner
+
+
+def av_scan_file(clam_av_config: ClamAVConfig, file_to_scan: Path) -> None:
+    """
+    Scan the file with a scanner
+    """
+    get_file_scanner(clam_av_config).scan(file_to_scan)
+
+
+def av_scan_stream(clam_av_config: ClamAVConfig, file_: ScanStream) -> None:
+    """
+    Scan an open file with a scanner
+    """
+    get_file_scanner(clam_av_config).scan_stream(file_)
@@ -17,10 +17,9 @@ from common_layer.exceptions import S3FileTooLargeError
 from common_layer.s3 import S3, get_filename_from_object_key_except
 from structlog.stdlib import get_logger
 
-from .av_scan import av_scan_file, get_clamav_config
-from .hashing import calculate_and_update_file_hash
+from .av_scan import get_clamav_config
 from .models import ClamAVScannerInputData
-from .s3_upload import verify_and_extract
+from .scan_pipeline import scan_verify_and_extract
 
 log = get_logger()
 
@@ -67,16 +66,16 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
     )
 
     try:
-        calculate_and_update_file_hash(db, input_data, downloaded_file_path)
-        if not input_data.skip_virus_scan:
-            av_scan_file(clam_av_config, downloaded_file_path)
-        else:
-            log.warning("Skipping Virus Scan")
-
         filename = get_filename_from_object_key_except(input_data.s3_file_key)
 
-        generated_prefix, stats = verify_and_extract(
-            s3_handler, downloaded_file_path, filename, context.aws_request_id
+        generated_prefix, stats = scan_verify_and_extract(
+            s3_handler,
+            db,
+            input_data,
+            clam_av_config,
+            downloaded_file_path,
+            filename,
+            context.aws_request_id,
         )
 
         msg = (
@@ -2,11 +2,8 @@
 File Hashing Update Functions
 """
 
-from pathlib import Path
-
 from common_layer.database.client import SqlDB
 from common_layer.database.repos import OrganisationDatasetRevisionRepo
-from common_layer.xml.utils import get_file_hash
 from structlog.stdlib import get_logger
 
 from .models import ClamAVScannerInputData
@@ -14,19 +11,11 @@ from .models import ClamAVScannerInputData
 log = get_logger()
 
 
-def calculate_and_update_file_hash(
-    db: SqlDB,
-    input_data: ClamAVScannerInputData,
-    file_path: Path,
-):
+def update_file_hash(db: SqlDB, input_data: ClamAVScannerInputData, file_hash: str):
     """
-    Fetch the File from S3
-
     Update the database dataset revision with the File Hash
+    The hash is calculated while the file is streamed to the virus scan
     """
-    file_hash = get_file_hash(file_path)
-    log.debug("Generated File Hash", hash=file_hash)
-
     OrganisationDatasetRevisionRepo(db).update_original_file_hash(
         input_data.revision_id, file_hash
     )
@@ -34,5 +23,4 @@ def calculate_and_update_file_hash(
         "Generated File Hash and updated original_file_hash column in Dataset Revision",
         revision_id=input_data.revision_id,
         file_hash=file_hash,
-        file_path=str(file_path),
     )
@@ -3,6 +3,7 @@ Post ClamAV Scan, upload files to S3
 """
 
 import asyncio
+import threading
 from pathlib import Path
 
 from common_layer.s3 import (
@@ -33,7 +34,11 @@ def make_output_folder_name(
 
 
 def verify_and_extract(
-    s3_handler: S3, downloaded_file_path: Path, filename: str, request_id: str
+    s3_handler: S3,
+    downloaded_file_path: Path,
+    filename: str,
+    request_id: str,
+    cancel_event: threading.Event | None = None,
 ) -> tuple[str, ProcessingStats]:
     """
     Scan and extract eh files
@@ -42,17 +47,21 @@ def verify_and_extract(
         verify_zip_file(downloaded_file_path, filename)
     s3_output_folder = make_output_folder_name(downloaded_file_path, request_id)
     generated_prefix = unzip_and_upload_files(
-        s3_handler, downloaded_file_path, s3_output_folder
+        s3_handler, downloaded_file_path, s3_output_folder, cancel_event
     )
     return generated_prefix
 
 
 def unzip_and_upload_files(
-    s3_handler: S3, file_path: Path, s3_output_folder: str
+    s3_handler: S3,
+    file_path: Path,
+    s3_output_folder: str,
+    cancel_event: threading.Event | None = None,
 ) -> tuple[str, ProcessingStats]:
     """
     If the file is a zip, unzip and upload its contents to S3.
     Otherwise, copy the single file to a new folder and return that folder path.
+    Setting cancel_event stops the remaining zip contents being uploaded
     """
     tags = {
         "Lifecycle": "temporary",
@@ -68,6 +77,7 @@ def unzip_and_upload_files(
                 zip_path=file_path,
                 destination_prefix=s3_output_folder,
                 tags=tags,
+                cancel_event=cancel_event,
             )
         )
 
@@ -0,0 +1,167 @@
+"""
+Single read of the downloaded file for the hash and virus scan
+Runs alongside zip verification and extraction, cancelling it if the scan fails
+"""
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from common_layer.database.client import SqlDB
+from common_layer.exceptions import ClamConnectionError
+from common_layer.s3 import S3, ProcessingStats
+from structlog.stdlib import get_logger
+
+from .av_scan import av_scan_stream
+from .hashing import update_file_hash
+from .models import ClamAVConfig, ClamAVScannerInputData
+from .s3_upload import make_output_folder_name, verify_and_extract
+
+log = get_logger()
+
+HASH_READ_CHUNK_BYTES = 1024 * 1024
+
+
+class HashingReader:
+    """
+    File reader that hashes each chunk as it's read
+    Lets the virus scan stream and the hash share one read of the file
+    """
+
+    def __init__(self, file_: BinaryIO):
+        self._file = file_
+        self._sha1 = hashlib.sha1()
+        self.name = str(file_.name)
+
+    def read(self, size: int = -1, /) -> bytes:
+        """
+        Read and hash the next chunk
+        """
+        chunk = self._file.read(size)
+        self._sha1.update(chunk)
+        return chunk
+
+    def read_remaining(self) -> None:
+        """
+        Hash anything the scan didn't read
+        """
+        while self.read(HASH_READ_CHUNK_BYTES):
+            pass
+
+    def hexdigest(self) -> str:
+        """
+        SHA1 of the file, matching get_file_hash once fully read
+        """
+        return self._sha1.hexdigest()
+
+
+@dataclass
+class ScanOutcome:
+    """
+    File hash and the exception raised by the scan, if any
+    """
+
+    file_hash: str
+    error: Exception | None = None
+
+
+def hash_and_scan_file(
+    clam_av_config: ClamAVConfig,
+    file_path: Path,
+    skip_virus_scan: bool,
+    scan_failed: threading.Event,
+) -> ScanOutcome:
+    """
+    Hash and virus scan the file in one read
+    Sets scan_failed as soon as the scan fails so extraction can stop
+    """
+    error: Exception | None = None
+    try:
+        with file_path.open("rb") as file_:
+            reader = HashingReader(file_)
+            try:
+                if skip_virus_scan:
+                    log.warning("Skipping Virus Scan")
+                else:
+                    av_scan_stream(clam_av_config, reader)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                scan_failed.set()
+                error = err
+            reader.read_remaining()
+            return ScanOutcome(file_hash=reader.hexdigest(), error=error)
+    except OSError as err:
+        scan_failed.set()
+        msg = f"Failed to read file for virus scan: {err}"
+        log.exception(msg)
+        raise ClamConnectionError(filename=str(file_path), message=msg) from err
+
+
+def complete_scan(
+    outcome: ScanOutcome,
+    db: SqlDB,
+    input_data: ClamAVScannerInputData,
+    s3_handler: S3,
+    extracted_prefix: str,
+) -> None:
+    """
+    Store the file hash and raise the scan error
+    Removes anything extracted before the scan failed
+    """
+    update_file_hash(db, input_data, outcome.file_hash)
+    if outcome.error is None:
+        return
+    remove_extracted_files(s3_handler, extracted_prefix)
+    raise outcome.error
+
+
+def remove_extracted_files(s3_handler: S3, extracted_prefix: str) -> None:
+    """
+    Delete anything extracted before the scan failed
+    """
+    log.error(
+        "Scan failed, removing extracted files", extracted_prefix=extracted_prefix
+    )
+    s3_handler.delete_prefix(extracted_prefix)
+
+
+def scan_verify_and_extract(
+    s3_handler: S3,
+    db: SqlDB,
+    input_data: ClamAVScannerInputData,
+    clam_av_config: ClamAVConfig,
+    downloaded_file_path: Path,
+    filename: str,
+    request_id: str,
+) -> tuple[str, ProcessingStats]:
+    """
+    Hash and scan the file while the zip is verified and extracted
+    A scan failure takes precedence over verification errors
+    Whenever the scan fails the extracted files are removed, even if the file
+    couldn't be read to hash it
+    """
+    scan_failed = threading.Event()
+    extracted_prefix = make_output_folder_name(downloaded_file_path, request_id)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scan_future = executor.submit(
+            hash_and_scan_file,
+            clam_av_config,
+            downloaded_file_path,
+            input_data.skip_virus_scan,
+            scan_failed,
+        )
+        try:
+            generated_prefix, stats = verify_and_extract(
+                s3_handler, downloaded_file_path, filename, request_id, scan_failed
+            )
+        finally:
+            try:
+                outcome = scan_future.result()
+            except Exception:
+                if scan_failed.is_set():
+                    remove_extracted_files(s3_handler, extracted_prefix)
+                raise
+            complete_scan(outcome, db, input_data, s3_handler, extracted_prefix)
+    return generated_prefix, stats
@@ -14,14 +14,15 @@ log = get_logger()
 
 
 def create_violation_from_error(
-    error: _LogEntry, revision_id: int, filename: str
+    error: _LogEntry, revision_id: int, filename: str, line: int | None = None
 ) -> DataQualitySchemaViolation:
     """
     Create a DataQualitySchemaViolation instance from an lxml error
+    The line overrides the error's, which streaming validation doesn't set
     """
     return DataQualitySchemaViolation(
         filename=filename,
-        line=error.line,
+        line=error.line if line is None else line,
         details=error.message,
         created=datetime.now(UTC),
         revision_id=revision_id,
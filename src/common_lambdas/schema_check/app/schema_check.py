@@ -2,11 +2,15 @@
 SchemaCheckLambda
 """
 
+from itertools import chain
 from typing import Any
 
 import common_layer.aws.datadog.tracing  # type: ignore # pylint: disable=unused-import
+from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import BotoCoreError, ClientError
+from common_layer.aws import configure_metrics
+from common_layer.aws.metrics import get_metric_name
 from common_layer.database.client import SqlDB
 from common_layer.database.models import DataQualitySchemaViolation
 from common_layer.db.constants import StepName
@@ -17,14 +21,51 @@ from common_layer.s3 import S3, get_filename_from_object_key_except
 from lxml.etree import _Element  # type: ignore
 from lxml.etree import XMLSchema, XMLSyntaxError, parse
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings
 from structlog.stdlib import get_logger
 
 from .constants import XMLDataType, XMLSchemaType
 from .db_operations import add_violations_to_db, create_violation_from_error
-from .schema_loader import load_schema
+from .schema_loader import SCHEMA_CACHE, SchemaLoadStats, load_schema
+from .streaming import iter_chunks, read_xml_root, stream_schema_violations
 from .utils import get_xml_type
 
 log = get_logger()
+metrics = configure_metrics(StepName.TIMETABLE_SCHEMA_CHECK)
+
+
+class SchemaCheckSettings(BaseSettings):
+    """
+    Schema Check configuration
+    """
+
+    SCHEMA_CACHE_PREWARM: bool = Field(
+        default=False,
+        description="Compile every schema in SCHEMA_SPECS during Lambda init",
+    )
+    SCHEMA_CHECK_STREAMING: bool = Field(
+        default=False,
+        description=(
+            "Validate files while they stream from S3 instead of as a tree, "
+            "content errors are reported on the element's closing tag line"
+        ),
+    )
+
+
+def prewarm_schema_cache() -> None:
+    """
+    Compile the schemas during the init phase so the first invocation doesn't
+    A failure is left for the invocation to raise when it loads the schema
+    """
+    if not SchemaCheckSettings().SCHEMA_CACHE_PREWARM:
+        return
+    try:
+        SCHEMA_CACHE.prewarm()
+    except Exception:  # pylint: disable=broad-exception-caught
+        log.warning("Failed to pre-warm XMLSchema cache", exc_info=True)
+
+
+prewarm_schema_cache()
 
 
 class SchemaCheckInputData(BaseModel):
@@ -114,24 +155,83 @@ def validate_schema_type(data_type: XMLDataType, detected_schema_type: XMLSchema
         )
 
 
+def add_schema_load_metrics(stats: SchemaLoadStats) -> None:
+    """
+    Record whether the schema was cached and how long compiling it took
+    """
+    metrics.add_metric(
+        name=get_metric_name("schema_cache_hits"),
+        unit=MetricUnit.Count,
+        value=int(stats.cache_hit),
+    )
+    metrics.add_metric(
+        name=get_metric_name("schema_compile_time"),
+        unit=MetricUnit.Seconds,
+        value=stats.compile_seconds,
+    )
+
+
+def load_checked_schema(
+    input_data: SchemaCheckInputData, xml_root: _Element
+) -> XMLSchema:
+    """
+    Load the schema for the XML's root element
+    """
+    schema_type, schema_version = get_xml_type(xml_root)
+
+    validate_schema_type(input_data.dataset_type, schema_type)
+
+    load_stats = SchemaLoadStats()
+    xml_schema = load_schema(schema_type, schema_version, load_stats)
+    add_schema_load_metrics(load_stats)
+    return xml_schema
+
+
+def process_schema_check_streaming(
+    input_data: SchemaCheckInputData,
+) -> list[DataQualitySchemaViolation]:
+    """
+    Schema Check that validates the file as it streams from S3
+    Only the root element is parsed before the schema is known
+    """
+    s3_client = S3(bucket_name=input_data.s3_bucket_name)
+    try:
+        log.info("Streaming XML from S3", s3_key=input_data.s3_file_key)
+        streaming_body = s3_client.get_object(input_data.s3_file_key)
+        xml_root, head_chunks = read_xml_root(streaming_body)
+    except (ClientError, BotoCoreError):
+        log.error("S3 Operation Failed", s3_key=input_data.s3_file_key, exc_info=True)
+        raise
+
+    xml_schema = load_checked_schema(input_data, xml_root)
+    filename = get_filename_from_object_key_except(input_data.s3_file_key)
+
+    return stream_schema_violations(
+        xml_schema,
+        chain(head_chunks, iter_chunks(streaming_body)),
+        input_data.revision_id,
+        filename,
+    )
+
+
 def process_schema_check(
     input_data: SchemaCheckInputData,
 ) -> list[DataQualitySchemaViolation]:
     """
     Process Schema Check
     """
-    xml_root = parse_xml_from_s3(input_data)
-    schema_type, schema_version = get_xml_type(xml_root)
+    if SchemaCheckSettings().SCHEMA_CHECK_STREAMING:
+        return process_schema_check_streaming(input_data)
 
-    validate_schema_type(input_data.dataset_type, schema_type)
-
-    xml_schema = load_schema(schema_type, schema_version)
+    xml_root = parse_xml_from_s3(input_data)
+    xml_schema = load_checked_schema(input_data, xml_root)
 
     filename = get_filename_from_object_key_except(input_data.s3_file_key)
 
     return get_schema_violations(xml_schema, xml_root, input_data.revision_id, filename)
 
 
+@metrics.log_metrics  # type: ignore
 @file_processing_result_to_db(step_name=StepName.TIMETABLE_SCHEMA_CHECK)
 def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str, Any]:
     """
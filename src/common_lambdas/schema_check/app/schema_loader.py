@@ -2,7 +2,10 @@
 Functions for loading an XMLSchema for validation purposes
 """
 
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 
 from common_layer.exceptions import SchemaUnknown, XMLSyntaxError
 from lxml.etree import ParseError, XMLParser, XMLSchema, XMLSchemaParseError, parse
@@ -29,9 +32,9 @@ def get_schema_spec(schema_type: XMLSchemaType, version: str) -> SchemaSpec:
     return schema_spec
 
 
-def load_schema(schema_type: XMLSchemaType, version: str) -> XMLSchema:
+def compile_schema(schema_type: XMLSchemaType, version: str) -> XMLSchema:
     """
-    Load an XML schema using the given schema type and version.
+    Parse and compile an XML schema from disk using the given schema type and version.
     Returns: Loaded XMLSchema object
     """
     schema_spec = get_schema_spec(schema_type, version)
@@ -62,3 +65,90 @@ def load_schema(schema_type: XMLSchemaType, version: str) -> XMLSchema:
     except (XMLSchemaParseError, ParseError) as e:
         log.error("Error Parsing Schema XML", exc_info=True)
         raise XMLSyntaxError("Error Parsing Schema") from e
+
+
+@dataclass
+class SchemaLoadStats:
+    """
+    Whether a schema came from the cache and how long compiling it took
+    """
+
+    cache_hit: bool = False
+    compile_seconds: float = 0.0
+
+
+class XMLSchemaCache:
+    """
+    Compiled XMLSchemas by schema type and version
+    Held at module level so warm Lambda invocations skip compiling the XSDs
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[tuple[XMLSchemaType, str], XMLSchema] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def get(
+        self,
+        schema_type: XMLSchemaType,
+        version: str,
+        stats: SchemaLoadStats | None = None,
+    ) -> XMLSchema:
+        """
+        Get a compiled schema, compiling it on first use
+        """
+        stats = stats if stats is not None else SchemaLoadStats()
+        key = (schema_type, version)
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is not None:
+                stats.cache_hit = True
+                return schema
+
+            start = time.perf_counter()
+            schema = compile_schema(schema_type, version)
+            stats.compile_seconds = time.perf_counter() - start
+            self._schemas[key] = schema
+        log.info(
+            "Compiled XMLSchema",
+            schema_type=schema_type.value,
+            version=version,
+            compile_seconds=round(stats.compile_seconds, 3),
+        )
+        return schema
+
+    def prewarm(self) -> float:
+        """
+        Compile every schema in SCHEMA_SPECS
+        Returns the total compile time in seconds
+        """
+        total_seconds = 0.0
+        for schema_type, version in SCHEMA_SPECS:
+            stats = SchemaLoadStats()
+            self.get(schema_type, version, stats)
+            total_seconds += stats.compile_seconds
+        log.info("Pre-warmed XMLSchema cache", compile_seconds=round(total_seconds, 3))
+        return total_seconds
+
+    def clear(self) -> None:
+        """
+        Remove all compiled schemas
+        """
+        with self._lock:
+            self._schemas.clear()
+
+
+SCHEMA_CACHE = XMLSchemaCache()
+
+
+def load_schema(
+    schema_type: XMLSchemaType, version: str, stats: SchemaLoadStats | None = None
+) -> XMLSchema:
+    """
+    Load a compiled XML schema using the given schema type and version.
+    Compiled once per Lambda container and reused by warm invocations
+    Returns: Loaded XMLSchema object
+    """
+    return SCHEMA_CACHE.get(schema_type, version, stats)
@@ -0,0 +1,173 @@
+"""
+Streaming schema validation for large XML files
+The file is validated while it's parsed without building a tree
+
+Errors are numbered with the line being parsed when libxml2 reports them,
+which isn't always the line the tree path reports:
+    Missing or unexpected content is reported on the element's closing tag
+    Key and keyref errors are reported on the closing tag of the element
+    declaring the constraint, for TransXChange the last line of the file
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import BinaryIO, Iterable, Iterator
+
+from common_layer.database.models import DataQualitySchemaViolation
+from common_layer.exceptions import XMLSyntaxError as ETLXMLSyntaxError
+from lxml.etree import (  # type: ignore
+    PyErrorLog,
+    XMLParser,
+    XMLPullParser,
+    XMLSchema,
+    XMLSyntaxError,
+    _Element,
+    _LogEntry,
+    use_global_python_log,
+)
+from structlog.stdlib import get_logger
+
+from .db_operations import create_violation_from_error
+
+log = get_logger()
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+_thread_state = threading.local()
+
+
+class SchemaErrorRecorder(PyErrorLog):
+    """
+    Receives schema errors from libxml2 as they are reported
+    Errors from a validating parser have no line number,
+    so the line being fed to the parser is recorded with them
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.line = 0
+        self._errors: list[tuple[int, _LogEntry]] | None = None
+
+    def receive(self, log_entry: _LogEntry) -> None:
+        """
+        Called by lxml for every error in the thread
+        """
+        if self._errors is None:
+            return
+        if log_entry.domain_name == "SCHEMASV":
+            self._errors.append((self.line, log_entry))
+
+    @contextmanager
+    def recording(self) -> Iterator[list[tuple[int, _LogEntry]]]:
+        """
+        Collect the schema errors reported inside the block
+        """
+        self._errors = []
+        self.line = 0
+        try:
+            yield self._errors
+        finally:
+            self._errors = None
+
+
+def get_error_recorder() -> SchemaErrorRecorder:
+    """
+    The thread's SchemaErrorRecorder, installed as its global lxml error log
+    lxml can't return the log it replaces so it stays installed for the life of
+    the thread, dropping errors outside recording()
+    Parsers and schemas keep their own error logs so they're unaffected
+    """
+    recorder: SchemaErrorRecorder | None = getattr(_thread_state, "recorder", None)
+    if recorder is None:
+        recorder = SchemaErrorRecorder()
+        use_global_python_log(recorder)
+        _thread_state.recorder = recorder
+    return recorder
+
+
+def iter_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Read the stream in fixed size chunks
+    """
+    return iter(partial(stream.read, STREAM_CHUNK_BYTES), b"")
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[tuple[int, bytes]]:
+    """
+    Split the chunks at line ends, numbering the line each piece is on
+    """
+    line = 1
+    for chunk in chunks:
+        for piece in chunk.splitlines(keepends=True):
+            yield line, piece
+            if piece.endswith(b"\n"):
+                line += 1
+
+
+def read_xml_root(stream: BinaryIO) -> tuple[_Element, list[bytes]]:
+    """
+    Read until the root element starts to find the schema to validate against
+    Returns the root and the chunks read so they can be fed to the validating parser
+    """
+    parser = XMLPullParser(events=("start",))
+    chunks: list[bytes] = []
+    try:
+        for chunk in iter_chunks(stream):
+            chunks.append(chunk)
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                return element, chunks
+        parser.close()
+    except XMLSyntaxError as exc:
+        log.error("XML Parsing Failed", exc_info=True)
+        raise ETLXMLSyntaxError from exc
+    raise ETLXMLSyntaxError("No root element found")
+
+
+class ValidationTarget:
+    """
+    Parser target that builds nothing
+    The schema validates the parse events so no tree is needed
+    """
+
+    def close(self) -> None:
+        """
+        Called once the whole document has been parsed
+        """
+
+
+def stream_schema_violations(
+    schema: XMLSchema,
+    chunks: Iterable[bytes],
+    revision_id: int,
+    filename: str,
+) -> list[DataQualitySchemaViolation]:
+    """
+    Validate the XML against the schema while it's parsed, collecting any violations
+    Parsers with a target only raise for malformed XML, not for schema violations
+    """
+    log.info("Streaming File Through Schema Validation")
+    parser = XMLParser(target=ValidationTarget(), schema=schema)
+    recorder = get_error_recorder()
+    with recorder.recording() as errors:
+        try:
+            for line, piece in iter_lines(chunks):
+                recorder.line = line
+                parser.feed(piece)
+            parser.close()
+        except XMLSyntaxError as exc:
+            log.error("XML Parsing Failed", exc_info=True)
+            raise ETLXMLSyntaxError from exc
+
+    violations = [
+        create_violation_from_error(error, revision_id, filename, line=line)
+        for line, error in errors
+    ]
+    if violations:
+        log.warning(
+            "Schema Violations Found", count=len(violations), revision_id=revision_id
+        )
+    else:
+        log.info("No Violations Found", revision_id=revision_id)
+    return violations
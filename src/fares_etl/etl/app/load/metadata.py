@@ -2,11 +2,11 @@
 Setup organisation dataset metadata tables
 """
 
-from common_layer.dynamodb.client import NaptanStopPointDynamoDBClient
 from common_layer.dynamodb.client.fares_metadata import (
     DynamoDBFaresMetadata,
     FaresDynamoDBMetadataInput,
 )
+from common_layer.naptan_snapshot import create_stop_point_client
 from common_layer.xml.netex.models import PublicationDeliveryStructure
 
 from ..transform.data_catalogue import create_data_catalogue
@@ -22,7 +22,7 @@ def load_metadata_into_dynamodb(
     Load metadata into dynamodb
     """
     dynamodb_fares_metadata_client = DynamoDBFaresMetadata()
-    dynamodb_naptan_stop_point_client = NaptanStopPointDynamoDBClient()
+    dynamodb_naptan_stop_point_client = create_stop_point_client()
 
     metadata = create_metadata(netex)
     stop_ids = get_stop_ids(netex, dynamodb_naptan_stop_point_client)
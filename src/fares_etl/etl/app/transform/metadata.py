@@ -3,7 +3,7 @@ Create fares metadata
 """
 
 from common_layer.database.models import FaresMetadata
-from common_layer.dynamodb.client import NaptanStopPointDynamoDBClient
+from common_layer.naptan_snapshot import StopPointClient
 from common_layer.xml.netex.helpers import (
     earliest_tariff_from_date,
     get_fare_products,
@@ -52,7 +52,7 @@ def create_metadata(netex: PublicationDeliveryStructure) -> FaresMetadata:
 
 def get_stop_ids(
     netex: PublicationDeliveryStructure,
-    dynamodb_naptan_stop_point_client: NaptanStopPointDynamoDBClient,
+    dynamodb_naptan_stop_point_client: StopPointClient,
 ) -> list[int]:
     """
     Get list of stop PrivateCodes from NeTEx
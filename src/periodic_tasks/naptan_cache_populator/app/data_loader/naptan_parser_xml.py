@@ -8,6 +8,7 @@ from typing import Any, AsyncIterator
 
 from botocore.exceptions import ClientError
 from common_layer.dynamodb.client_loader import DynamoDBLoader
+from common_layer.naptan_snapshot import NaptanSnapshotWriter
 from common_layer.xml.txc.parser.parser_txc import strip_namespace
 from common_layer.xml.txc.parser.stop_points import parse_txc_stop_point
 from lxml import etree
@@ -61,10 +62,13 @@ def prepare_naptan_data(url: str, data_dir: Path) -> Path:
     return download_naptan_xml(url, data_dir)
 
 
-async def async_stream_stop_points(xml_path: Path) -> AsyncIterator[dict[str, Any]]:
+async def async_stream_stop_points(
+    xml_path: Path, snapshot_writer: NaptanSnapshotWriter | None = None
+) -> AsyncIterator[dict[str, Any]]:
     """
     Stream stop points from XML file.
     Uses iterparse for memory efficiency and validates stop points before processing.
+    Parsed stop points are also added to the snapshot when a writer is given.
     """
     context = etree.iterparse(
         str(xml_path),
@@ -86,6 +90,8 @@ async def async_stream_stop_points(xml_path: Path) -> AsyncIterator[dict[str, An
             stop_point = strip_namespace(stop_point)
 
             if stop_data := parse_txc_stop_point(stop_point):
+                if snapshot_writer:
+                    snapshot_writer.add(stop_data)
                 yield stop_data.model_dump()
 
             # Clean up processed elements
@@ -201,6 +207,7 @@ def load_naptan_data_from_xml(
     data_dir: Path,
     dynamo_loader: DynamoDBLoader,
     write_mode: WriteMode,
+    snapshot_writer: NaptanSnapshotWriter | None = None,
 ) -> tuple[int, int]:
     """
     Process NaPTAN XML data from URL and load into DynamoDB.
@@ -216,5 +223,5 @@ def load_naptan_data_from_xml(
     )
 
     xml_path = prepare_naptan_data(url, data_dir)
-    stream = async_stream_stop_points(xml_path)
+    stream = async_stream_stop_points(xml_path, snapshot_writer)
     return asyncio.run(process_stop_points(stream, dynamo_loader, write_mode))
@@ -3,6 +3,7 @@ Naptan Cache Lambda
 """
 
 import json
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,8 @@ from aws_lambda_powertools import Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from common_layer.dynamodb.client_loader import DynamoDBLoader
 from common_layer.json_logging import configure_logging
+from common_layer.naptan_snapshot import NaptanSnapshotWriter
+from common_layer.s3 import S3
 from pydantic import ValidationError
 from structlog.stdlib import get_logger
 
@@ -20,6 +23,22 @@ tracer = Tracer()
 log = get_logger()
 
 
+def upload_snapshot(writer: NaptanSnapshotWriter, bucket: str, key: str) -> int:
+    """
+    Finish writing the NaPTAN snapshot and upload it for the stop point clients
+    """
+    stop_point_count = writer.close()
+    S3(bucket).upload_file(writer.path, key)
+    writer.path.unlink()
+    log.info(
+        "Uploaded NaPTAN snapshot",
+        bucket=bucket,
+        key=key,
+        stop_point_count=stop_point_count,
+    )
+    return stop_point_count
+
+
 @tracer.capture_lambda_handler
 def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     """
@@ -42,12 +61,28 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
         max_concurrent_batches=input_data.max_concurrent_batches,
     )
 
-    processed_count, error_count = load_naptan_data_from_xml(
-        url=str(input_data.naptan_url),
-        data_dir=Path("/tmp"),
-        dynamo_loader=dynamo_loader,
-        write_mode=input_data.write_mode,
-    )
+    data_dir = Path("/tmp")
+    with ExitStack() as stack:
+        snapshot_writer = (
+            stack.enter_context(
+                NaptanSnapshotWriter(data_dir / Path(input_data.snapshot_key).name)
+            )
+            if input_data.snapshot_bucket
+            else None
+        )
+
+        processed_count, error_count = load_naptan_data_from_xml(
+            url=str(input_data.naptan_url),
+            data_dir=data_dir,
+            dynamo_loader=dynamo_loader,
+            write_mode=input_data.write_mode,
+            snapshot_writer=snapshot_writer,
+        )
+
+        if snapshot_writer and input_data.snapshot_bucket:
+            upload_snapshot(
+                snapshot_writer, input_data.snapshot_bucket, input_data.snapshot_key
+            )
 
     response = {
         "statusCode": 200,
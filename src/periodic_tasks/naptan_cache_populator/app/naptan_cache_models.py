@@ -4,6 +4,7 @@ Pydantic Models
 
 from enum import Enum
 
+from common_layer.naptan_snapshot import DEFAULT_SNAPSHOT_KEY
 from pydantic import BaseModel, HttpUrl, field_validator
 
 
@@ -22,6 +23,8 @@ class NaptanProcessingInput(BaseModel):
     aws_region: str = "eu-west-2"
     max_concurrent_batches: int | None = None
     write_mode: WriteMode = WriteMode.BATCH
+    snapshot_bucket: str | None = None
+    snapshot_key: str = DEFAULT_SNAPSHOT_KEY
 
     @field_validator("dynamo_table")
     @classmethod
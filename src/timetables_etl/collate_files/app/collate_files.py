@@ -14,15 +14,19 @@ from common_layer.database.models import OrganisationTXCFileAttributes
 from common_layer.database.repos import OrganisationTXCFileAttributesRepo
 from common_layer.db.constants import StepName
 from common_layer.db.file_processing_result import file_processing_result_to_db
+from common_layer.dynamodb.client.cache import DynamoDBCache
+from common_layer.dynamodb.data_manager import FileProcessingDataManager
+from common_layer.dynamodb.models import TXCFileAttributes
 from common_layer.s3 import S3
 from pydantic import RootModel
 from structlog.stdlib import get_logger
 
-from .models import CollateFilesInputData, ETLMapInputData
+from .models import CollateFilesInputData, CollateFilesSettings, ETLMapInputData
 from .txc_filtering import (
     create_etl_inputs_from_map_results,
     deduplicate_file_attributes_by_filename,
     filter_txc_files_by_service_code,
+    get_unchanged_files,
 )
 
 log = get_logger()
@@ -61,6 +65,9 @@ def count_and_log_file_status(
         "ETL inputs created from map results",
         superceded_files=superceded_count,
         active_files=active_count,
+        unchanged_files=sum(
+            1 for input_file in map_inputs if input_file.live_file_attributes_id
+        ),
         total_files=len(map_inputs),
     )
 
@@ -97,12 +104,16 @@ def upload_map_input_to_s3(
 
 
 def collate_files(
-    input_data: CollateFilesInputData, db: SqlDB, s3: S3
+    input_data: CollateFilesInputData,
+    db: SqlDB,
+    s3: S3,
+    live_attributes: list[TXCFileAttributes] | None = None,
 ) -> tuple[list[ETLMapInputData], str]:
     """
     - Get the File Attributes for the Revision ID
     - Get the Map Processing Results from S3
     - Process using the BODS filtering logic by Service ID / Start Date
+    - Match files unchanged since the live revision when its attributes are given
     - Generate the PTI+ETL Map Input Data
     - Upload to S3 and return Object Key
     """
@@ -116,6 +127,7 @@ def collate_files(
         all_files=file_attributes,
         filtered_files=filtered_files,
         map_results=map_results,
+        unchanged_files=get_unchanged_files(file_attributes, live_attributes or []),
     )
 
     count_and_log_file_status(map_inputs)
@@ -162,6 +174,12 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
     input_data = CollateFilesInputData(**event)
     db = SqlDB()
     s3 = S3(input_data.s3_bucket_name)
-    map_inputs, s3_object_key = collate_files(input_data, db, s3)
+    live_attributes = None
+    if CollateFilesSettings().INCREMENTAL_ETL_ENABLED:
+        data_manager = FileProcessingDataManager(db, DynamoDBCache())
+        live_attributes = data_manager.get_cached_live_txc_file_attributes(
+            input_data.revision_id
+        )
+    map_inputs, s3_object_key = collate_files(input_data, db, s3, live_attributes)
 
     return generate_response(map_inputs, s3_object_key)
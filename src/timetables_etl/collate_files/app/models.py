@@ -5,6 +5,21 @@ Collete Files Models
 from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings
+
+
+class CollateFilesSettings(BaseSettings):
+    """
+    Collate Files configuration
+    """
+
+    INCREMENTAL_ETL_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Clone the Transmodel data of files unchanged since the live revision "
+            "instead of running the full ETL"
+        ),
+    )
 
 
 class CollateFilesInputData(BaseModel):
@@ -34,3 +49,11 @@ class ETLMapInputData(BaseModel):
         bool, Field(alias="SupersededTimetable", default=False)
     ]
     file_attributes_id: Annotated[int, Field(alias="TxcFileAttributesId")]
+    live_file_attributes_id: Annotated[
+        int | None,
+        Field(
+            alias="LiveTxcFileAttributesId",
+            default=None,
+            description="File in the live revision with the same hash to clone from",
+        ),
+    ]
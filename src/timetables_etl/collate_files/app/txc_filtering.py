@@ -6,6 +6,7 @@ from datetime import date
 
 from common_layer.aws.step import MapExecutionSucceeded, MapResults
 from common_layer.database.models import OrganisationTXCFileAttributes
+from common_layer.dynamodb.models import TXCFileAttributes
 from structlog.stdlib import get_logger
 
 from .models import ETLMapInputData
@@ -173,16 +174,36 @@ def build_filename_map(
     return filename_to_map_result
 
 
+def get_unchanged_files(
+    files: list[OrganisationTXCFileAttributes],
+    live_attributes: list[TXCFileAttributes],
+) -> dict[int, int]:
+    """
+    Map file attributes IDs to the live revision file attributes with the same hash
+    """
+    live_ids_by_hash = {
+        attributes.hash: attributes.id for attributes in live_attributes
+    }
+    return {
+        file.id: live_ids_by_hash[file.hash]
+        for file in files
+        if file.hash in live_ids_by_hash
+    }
+
+
 def create_etl_map_inputs(
     all_files: list[OrganisationTXCFileAttributes],
     filtered_files: list[OrganisationTXCFileAttributes],
     filename_map: dict[str, MapExecutionSucceeded],
+    unchanged_files: dict[int, int] | None = None,
 ) -> list[ETLMapInputData]:
     """
     Create S3FileReference objects for files,
     marking those not in filtered_files as superceded
+    Active files unchanged since the live revision reference the live file to clone
     """
     filtered_file_ids = {file.id for file in filtered_files}
+    unchanged_files = unchanged_files or {}
 
     s3_references: list[ETLMapInputData] = []
 
@@ -200,6 +221,9 @@ def create_etl_map_inputs(
                     s3_file_key=map_result.parsed_input.Key,
                     superseded_timetable=is_superceded,
                     file_attributes_id=file.id,
+                    live_file_attributes_id=(
+                        None if is_superceded else unchanged_files.get(file.id)
+                    ),
                 )
 
                 s3_references.append(s3_reference)
@@ -211,10 +235,13 @@ def create_etl_inputs_from_map_results(
     all_files: list[OrganisationTXCFileAttributes],
     filtered_files: list[OrganisationTXCFileAttributes],
     map_results: MapResults,
+    unchanged_files: dict[int, int] | None = None,
 ) -> list[ETLMapInputData]:
     """
     For each successful file build a list of Map inputs checking whether to supercede
     """
     filename_map = build_filename_map(map_results)
 
-    return create_etl_map_inputs(all_files, filtered_files, filename_map)
+    return create_etl_map_inputs(
+        all_files, filtered_files, filename_map, unchanged_files
+    )
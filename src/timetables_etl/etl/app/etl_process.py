@@ -22,11 +22,17 @@ from common_layer.dynamodb.client.naptan_stop_points import (
     NaptanStopPointDynamoDBClient,
 )
 from common_layer.dynamodb.data_manager import FileProcessingDataManager
+from common_layer.naptan_snapshot import create_stop_point_client
 from common_layer.xml.txc.parser.parser_txc import TXCParserConfig
 from structlog.stdlib import get_logger
 
-from .metrics import create_datadog_metrics
-from .models import ETLInputData, ETLTaskClients, TaskData
+from .load.unchanged_file import clone_unchanged_file
+from .metrics import (
+    create_datadog_metrics,
+    create_db_pool_metrics,
+    create_stop_point_client_metrics,
+)
+from .models import ETLInputData, ETLProcessStats, ETLTaskClients, TaskData
 from .pipeline import transform_data
 
 log = get_logger()
@@ -45,6 +51,7 @@ PARSER_CONFIG = TXCParserConfig(
     journey_pattern_sections=True,
     vehicle_journeys=True,
     track_data=True,
+    streaming=True,
 )
 
 
@@ -81,15 +88,13 @@ def get_task_data(input_data: ETLInputData, db: SqlDB) -> TaskData:
     )
 
 
-@metrics.log_metrics  # type: ignore
-@file_processing_result_to_db(step_name=StepName.ETL_PROCESS)
-def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str, Any]:
+def run_etl(
+    input_data: ETLInputData, task_data: TaskData, db: SqlDB
+) -> ETLProcessStats:
     """
-    Timetable ETL
+    Download, parse and load the TXC File
     """
-    input_data = ETLInputData(**event)
-    db = SqlDB()
-    stop_point_client = NaptanStopPointDynamoDBClient()
+    stop_point_client = create_stop_point_client()
     dynamodb = DynamoDBCache()
     data_manager = FileProcessingDataManager(db, dynamodb)
     task_clients = ETLTaskClients(
@@ -99,13 +104,35 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
     txc_data = download_and_parse_txc(
         input_data.s3_bucket_name, input_data.s3_file_key, PARSER_CONFIG
     )
-    task_data = get_task_data(input_data, db)
     stats = transform_data(
         txc_data,
         task_data,
         task_clients,
     )
+    if isinstance(stop_point_client, NaptanStopPointDynamoDBClient):
+        create_stop_point_client_metrics(
+            metrics, stop_point_client.cache_stats, stop_point_client.request_stats
+        )
+    return stats
+
+
+@metrics.log_metrics  # type: ignore
+@file_processing_result_to_db(step_name=StepName.ETL_PROCESS)
+def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str, Any]:
+    """
+    Timetable ETL
+    Files unchanged since the live revision have their data cloned instead
+    """
+    input_data = ETLInputData(**event)
+    db = SqlDB()
+    task_data = get_task_data(input_data, db)
+    stats: ETLProcessStats | None = None
+    if input_data.live_file_attributes_id is not None:
+        stats = clone_unchanged_file(input_data.live_file_attributes_id, task_data, db)
+    if stats is None:
+        stats = run_etl(input_data, task_data, db)
     create_datadog_metrics(metrics, stats)
+    create_db_pool_metrics(metrics, db.pool_stats)
     return {
         "status_code": 200,
         "message": "ETL Completed",
@@ -2,9 +2,10 @@
 Context grouping dataclasses
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Sequence
+from functools import cached_property
+from typing import TYPE_CHECKING, Sequence
 
 from common_layer.database import SqlDB
 from common_layer.database.models import (
@@ -26,11 +27,33 @@ from common_layer.xml.txc.models.txc_vehicle_journey_flexible import (
 from ..helpers import FlexibleZoneLookup, StopsLookup
 from ..helpers.dataclasses import ReferenceDataLookups
 from ..helpers.types import ServicedOrgLookup
+from ..models import TaskData
 from ..transform.service_pattern_mapping import (
     ServicePatternMapping,
     ServicePatternMetadata,
+    map_unique_journey_patterns,
 )
 
+if TYPE_CHECKING:
+    from ..transform.vehicle_journey_operations import VehicleJourneyOperations
+
+
+@dataclass
+class ServicePatternFileContext:
+    """Per file data shared by the service pattern loaders of every service"""
+
+    txc: TXCData
+    task_data: TaskData
+    lookups: ReferenceDataLookups
+    db: SqlDB
+
+    @cached_property
+    def service_pattern_mapping(self) -> ServicePatternMapping:
+        """
+        Mapping of every journey pattern in the file, built on first use
+        """
+        return map_unique_journey_patterns(self.txc, self.lookups)
+
 
 @dataclass
 class ProcessPatternCommonContext:
@@ -105,6 +128,10 @@ class OperatingProfileProcessingContext:
     txc_serviced_orgs_dict: dict[str, TXCServicedOrganisation]
     txc_services: list[TXCService]
     db: SqlDB
+    expanded_profiles: dict[str, "VehicleJourneyOperations"] = field(
+        default_factory=dict,
+        metadata={"description": "Operations of the first journey by profile key"},
+    )
 
 
 @dataclass
@@ -2,18 +2,17 @@
 Flexible Service Pattern Handling
 """
 
-from common_layer.database import SqlDB
 from common_layer.database.models import TransmodelServicePattern
-from common_layer.xml.txc.models import TXCData, TXCService
+from common_layer.xml.txc.models import TXCService
 from structlog.stdlib import get_logger
 
-from ..helpers import ReferenceDataLookups
-from ..models import PatternCommonStats, TaskData
-from ..transform.service_pattern_mapping import (
-    get_flexible_service_pattern_ids,
-    map_unique_journey_patterns,
+from ..models import PatternCommonStats
+from ..transform.service_pattern_mapping import get_flexible_service_pattern_ids
+from .models_context import (
+    ProcessPatternCommonContext,
+    ProcessServicePatternContext,
+    ServicePatternFileContext,
 )
-from .models_context import ProcessPatternCommonContext, ProcessServicePatternContext
 from .servicepatterns_common import process_pattern_common, process_service_pattern
 
 log = get_logger()
@@ -21,10 +20,7 @@ log = get_logger()
 
 def process_flexible_service_patterns(
     service: TXCService,
-    txc: TXCData,
-    task_data: TaskData,
-    lookups: ReferenceDataLookups,
-    db: SqlDB,
+    file_context: ServicePatternFileContext,
 ) -> tuple[list[TransmodelServicePattern], PatternCommonStats]:
     """Process patterns for flexible services"""
     patterns: list[TransmodelServicePattern] = []
@@ -32,6 +28,10 @@ def process_flexible_service_patterns(
     if not service.FlexibleService:
         return [], stats
 
+    txc = file_context.txc
+    task_data = file_context.task_data
+    lookups = file_context.lookups
+    db = file_context.db
     service_pattern_context = ProcessServicePatternContext(
         revision=task_data.revision,
         journey_pattern_sections=txc.JourneyPatternSections,
@@ -40,7 +40,7 @@ def process_flexible_service_patterns(
         db=db,
     )
 
-    service_pattern_mapping = map_unique_journey_patterns(txc, lookups)
+    service_pattern_mapping = file_context.service_pattern_mapping
     flexible_service_pattern_ids = get_flexible_service_pattern_ids(
         service.FlexibleService, service_pattern_mapping
     )
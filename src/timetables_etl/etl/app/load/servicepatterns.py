@@ -2,18 +2,17 @@
 Transmodel Service Patterns Loader
 """
 
-from common_layer.database import SqlDB
 from common_layer.database.models import TransmodelServicePattern
-from common_layer.xml.txc.models import TXCData, TXCService
+from common_layer.xml.txc.models import TXCService
 from structlog.stdlib import get_logger
 
-from ..helpers import ReferenceDataLookups
-from ..models import PatternCommonStats, TaskData
-from ..transform.service_pattern_mapping import (
-    get_standard_service_pattern_ids,
-    map_unique_journey_patterns,
+from ..models import PatternCommonStats
+from ..transform.service_pattern_mapping import get_standard_service_pattern_ids
+from .models_context import (
+    ProcessPatternCommonContext,
+    ProcessServicePatternContext,
+    ServicePatternFileContext,
 )
-from .models_context import ProcessPatternCommonContext, ProcessServicePatternContext
 from .service_patterns_flexible import process_flexible_service_patterns
 from .servicepatterns_common import process_pattern_common, process_service_pattern
 
@@ -22,10 +21,7 @@ log = get_logger()
 
 def process_standard_service_patterns(
     service: TXCService,
-    txc: TXCData,
-    task_data: TaskData,
-    lookups: ReferenceDataLookups,
-    db: SqlDB,
+    file_context: ServicePatternFileContext,
 ) -> tuple[list[TransmodelServicePattern], PatternCommonStats]:
     """Process patterns for standard services"""
     patterns: list[TransmodelServicePattern] = []
@@ -33,6 +29,10 @@ def process_standard_service_patterns(
     if not service.StandardService:
         return [], stats
 
+    txc = file_context.txc
+    task_data = file_context.task_data
+    lookups = file_context.lookups
+    db = file_context.db
     # pylint: disable=duplicate-code
     service_pattern_context = ProcessServicePatternContext(
         revision=task_data.revision,
@@ -42,7 +42,7 @@ def process_standard_service_patterns(
         db=db,
     )
 
-    service_pattern_mapping = map_unique_journey_patterns(txc, lookups)
+    service_pattern_mapping = file_context.service_pattern_mapping
     standard_service_pattern_ids = get_standard_service_pattern_ids(
         service.StandardService, service_pattern_mapping
     )
@@ -71,10 +71,7 @@ def process_standard_service_patterns(
 
 def load_transmodel_service_patterns(
     service: TXCService,
-    txc: TXCData,
-    task_data: TaskData,
-    lookups: ReferenceDataLookups,
-    db: SqlDB,
+    file_context: ServicePatternFileContext,
 ) -> tuple[list[TransmodelServicePattern], PatternCommonStats]:
     """
     Generate and load transmodel service patterns for both standard and flexible services
@@ -85,14 +82,14 @@ def load_transmodel_service_patterns(
     if service.StandardService:
         log.info("Processing StandardService data", service_code=service.ServiceCode)
         service_patterns, stats = process_standard_service_patterns(
-            service, txc, task_data, lookups, db
+            service, file_context
         )
         patterns.extend(service_patterns)
 
     if service.FlexibleService:
         log.info("Processing FlexibleService Data", service_code=service.ServiceCode)
         service_patterns, stats = process_flexible_service_patterns(
-            service, txc, task_data, lookups, db
+            service, file_context
         )
         patterns.extend(service_patterns)
 
@@ -12,7 +12,7 @@ from common_layer.database.models import (
     TransmodelServicePatternLocality,
 )
 from common_layer.database.repos import (
-    TransmodelBankHolidaysRepo,
+    BANK_HOLIDAY_INDEX,
     TransmodelServicePatternAdminAreaRepo,
     TransmodelServicePatternLocalityRepo,
     TransmodelServicePatternRepo,
@@ -202,7 +202,7 @@ def process_pattern_common(
     reference_journey_pattern = get_reference_journey_pattern(
         service, context.service_pattern.service_pattern_id, sp_data.journey_pattern_ids
     )
-    bank_holidays = TransmodelBankHolidaysRepo(context.db).get_bank_holidays_lookup(
+    bank_holidays = BANK_HOLIDAY_INDEX.get(context.db).get_bank_holidays_lookup(
         service.StartDate, service.EndDate
     )
 
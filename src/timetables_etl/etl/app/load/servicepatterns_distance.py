@@ -3,29 +3,90 @@
 Functions for loading Service Pattern Distance
 """
 
-from math import asin, cos, radians, sin, sqrt
+from collections import OrderedDict
 
+import numpy as np
+import shapely
 from common_layer.database import SqlDB
 from common_layer.database.models import (
     NaptanStopPoint,
     TransmodelServicePatternDistance,
+    TransmodelTracks,
 )
 from common_layer.database.repos import TransmodelServicePatternDistanceRepo
 from common_layer.xml.txc.models import TXCService
 from geoalchemy2 import WKBElement
-from geoalchemy2.shape import from_shape, to_shape  # type: ignore
+from numpy.typing import ArrayLike, NDArray
 from shapely import LineString, MultiLineString
-from shapely.ops import linemerge
+from shapely.geometry.base import BaseGeometry
 from structlog.stdlib import get_logger
 
 from ..api.geometry import OSRMGeometryAPI
 from ..helpers import TrackLookup
+from ..transform.tracks import to_wkb_element
 
 log = get_logger()
 
 SRID = 4326
 
 
+def get_wkb_bytes(geometry: WKBElement) -> bytes:
+    """
+    Raw WKB of a geometry created in this file (memoryview) or loaded from the DB (hex)
+    """
+    data = geometry.data
+    return bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+
+
+class TrackCoordinatesCache:
+    """
+    Coordinates of decoded track geometries keyed by their WKB
+    Service patterns sharing stop pairs reuse the decoded tracks
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self._max_size = max_size
+        self._lines: OrderedDict[bytes, tuple[NDArray[np.float64], ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def clear(self) -> None:
+        """Remove all decoded tracks"""
+        self._lines.clear()
+
+    def get_many(self, wkbs: list[bytes]) -> list[tuple[NDArray[np.float64], ...]]:
+        """
+        The LineString coordinates of each geometry, empty for other geometry types
+        Geometries not already cached are decoded together with shapely.from_wkb
+        """
+        missing = [wkb for wkb in dict.fromkeys(wkbs) if wkb not in self._lines]
+        if missing:
+            geometries = shapely.from_wkb(np.array(missing, dtype=object))
+            for wkb, geometry in zip(missing, geometries):
+                self._lines[wkb] = get_line_coordinates(geometry)
+        for wkb in wkbs:
+            self._lines.move_to_end(wkb)
+        lines = [self._lines[wkb] for wkb in wkbs]
+        while len(self._lines) > self._max_size:
+            self._lines.popitem(last=False)
+        return lines
+
+
+def get_line_coordinates(geometry: BaseGeometry) -> tuple[NDArray[np.float64], ...]:
+    """
+    Coordinates of each LineString in a LineString or MultiLineString
+    """
+    if isinstance(geometry, LineString):
+        return (shapely.get_coordinates(geometry),)
+    if isinstance(geometry, MultiLineString):
+        return tuple(shapely.get_coordinates(line) for line in geometry.geoms)
+    return ()
+
+
+TRACK_COORDINATES = TrackCoordinatesCache()
+
+
 def has_sufficient_track_data(
     tracks: TrackLookup,
     stop_sequence: list[NaptanStopPoint],
@@ -37,10 +98,8 @@ def has_sufficient_track_data(
     - A track exists between every stop in sequence
     - Each track has a geometry with at least 3 points
     """
-    expected_track_count = len(stop_sequence) - 1
-    for i in range(expected_track_count):
-        from_stop = stop_sequence[i]
-        to_stop = stop_sequence[i + 1]
+    stop_tracks: list[TransmodelTracks] = []
+    for from_stop, to_stop in zip(stop_sequence, stop_sequence[1:]):
         track = tracks.get((from_stop.atco_code, to_stop.atco_code))
 
         if not track:
@@ -57,64 +116,64 @@ def has_sufficient_track_data(
                 track_id=track.id,
             )
             return False
+        stop_tracks.append(track)
 
-        shapely_geom = to_shape(track.geometry)
-        coords = list(shapely_geom.coords)
-        if len(coords) < 3:
-            log.debug(f"Track has insufficient points: {len(coords)}")
+    track_lines = TRACK_COORDINATES.get_many(
+        [get_wkb_bytes(track.geometry) for track in stop_tracks]
+    )
+    for lines in track_lines:
+        point_count = sum(len(line) for line in lines)
+        if point_count < 3:
+            log.debug(f"Track has insufficient points: {point_count}")
             return False
 
     return True
 
 
-def haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+def haversine(
+    lon1: ArrayLike, lat1: ArrayLike, lon2: ArrayLike, lat2: ArrayLike
+) -> NDArray[np.float64]:
     """
-    Calculate the great-circle distance in meters between two points (lon/lat).
+    Calculate the great-circle distance in meters between points (lon/lat).
+    Accepts scalars or arrays of points
     """
     earth_radius = 6371000  # Earth radius in meters
-    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
     dlon = lon2 - lon1
     dlat = lat2 - lat1
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    c = 2 * asin(sqrt(a))
-    return earth_radius * c
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return earth_radius * 2 * np.arcsin(np.sqrt(a))
 
 
 def snap_linestrings(
-    lines: list[LineString], tolerance: float | None = 15.0
-) -> list[LineString]:
+    lines: list[NDArray[np.float64]], tolerance: float | None = 15.0
+) -> NDArray[np.float64]:
     """
-    Snap the end of each linestring to the start of the next.
+    Join line coordinates into one buffer, snapping the start of each line to the
+    end of the previous one. Repeated points, including snapped starts, are dropped.
     If tolerance is None, always snap regardless of distance.
     Otherwise, snap only when distance <= tolerance (meters).
     """
     if not lines:
-        return []
-
-    snapped: list[LineString] = [LineString(lines[0].coords)]
-    for _idx, curr in enumerate(lines[1:], start=1):
-        prev: LineString = snapped[-1]
-        prev_end = prev.coords[-1]
-        curr_start = curr.coords[0]
-
-        curr_coords = list(curr.coords)
-
-        if tolerance is None:
-            # Always snap, skip distance check
-            curr_coords[0] = tuple(prev_end)
-        else:
-            dist: float = haversine(
-                prev_end[0],
-                prev_end[1],
-                curr_start[0],
-                curr_start[1],
-            )
-            if dist <= tolerance:
-                curr_coords[0] = tuple(prev_end)
+        return np.empty((0, 2))
 
-        snapped.append(LineString(curr_coords))
+    starts = np.cumsum([0] + [len(line) for line in lines[:-1]])
+    coords = np.concatenate(lines)
+    prev_ends = coords[starts[1:] - 1]
+    if tolerance is None:
+        snapped = starts[1:]
+    else:
+        distances = haversine(
+            prev_ends[:, 0],
+            prev_ends[:, 1],
+            coords[starts[1:], 0],
+            coords[starts[1:], 1],
+        )
+        snapped = starts[1:][distances <= tolerance]
+    coords[snapped] = coords[snapped - 1]
 
-    return snapped
+    repeated = np.all(coords[1:] == coords[:-1], axis=1)
+    return coords[np.concatenate(([True], ~repeated))]
 
 
 def get_geometry_and_distance_from_tracks(
@@ -123,14 +182,11 @@ def get_geometry_and_distance_from_tracks(
 ) -> tuple[WKBElement | None, int, int]:
     """
     Calculate the full service geometry and distance using track data,
-    snapping endpoints together within 15 meters.
+    snapping the end of each track to the start of the next.
     """
     total_distance = 0
     total_coord_distance = 0
-    track_linestrings: list[LineString] = []
-    snapped_lines: list[LineString] = []
-
-    # Define a projection transformer if your data is in lat/lon (WGS84)
+    stop_tracks: list[TransmodelTracks] = []
 
     for i, (from_stop, to_stop) in enumerate(zip(stop_sequence, stop_sequence[1:])):
         track = tracks.get((from_stop.atco_code, to_stop.atco_code))
@@ -143,34 +199,29 @@ def get_geometry_and_distance_from_tracks(
             total_distance += track.distance
         if track.coord_distance:
             total_coord_distance += track.coord_distance
+        stop_tracks.append(track)
 
-        shapely_geom = to_shape(track.geometry)
-        if isinstance(shapely_geom, LineString):
-            track_linestrings.append(shapely_geom)
-        elif isinstance(shapely_geom, MultiLineString):
-            track_linestrings.extend(shapely_geom.geoms)
-        else:
+    track_lines = TRACK_COORDINATES.get_many(
+        [get_wkb_bytes(track.geometry) for track in stop_tracks]
+    )
+    for track, lines in zip(stop_tracks, track_lines):
+        if not lines:
             log.warning(
                 "Track has unexpected geometry type",
                 track_id=track.id,
-                geom_type=shapely_geom.geom_type,
             )
+    if not track_lines or not track_lines[0]:
+        log.warning("No valid track geometries found for stop sequence.")
+        return None, 0, 0
 
-        if not track_linestrings:
-            log.warning("No valid track geometries found for stop sequence.")
-            return None, 0, 0
-
-    # Snap endpoints before merging
-    snapped_lines = snap_linestrings(track_linestrings, tolerance=None)
-    merged = linemerge(snapped_lines)
-    if isinstance(merged, MultiLineString):
-        # Flatten all coordinates into a single LineString
-        coords: list[tuple[float, float]] = []
-        for line in merged.geoms:
-            coords.extend(list(line.coords))  # type: ignore
-        merged = LineString(coords)
-
-    geometry = from_shape(merged, srid=SRID)
+    coords = snap_linestrings(
+        [line for lines in track_lines for line in lines], tolerance=None
+    )
+    if len(coords) < 2:
+        # Tracks that are all one point can't form a LineString
+        log.warning("Tracks have fewer than 2 distinct points", point_count=len(coords))
+        return None, total_coord_distance, total_distance
+    geometry = to_wkb_element(shapely.linestrings(coords))
     return geometry, total_coord_distance, total_distance
 
 
@@ -2,23 +2,87 @@
 Tracks Generation
 """
 
+import numpy as np
+import shapely
+from common_layer.database.client import SqlDB
+from common_layer.database.models import TransmodelTracks
+from common_layer.database.repos import TransmodelTrackRepo
 from common_layer.xml.txc.models import TXCRouteSection
 from structlog.stdlib import get_logger
 
 from ..helpers import TrackLookup
-from ..transform.tracks import create_new_tracks
+from ..transform.tracks import (
+    create_tracks,
+    get_route_link_coordinates,
+    get_track_geometry_hash,
+)
+from .servicepatterns_distance import get_wkb_bytes
 
 log = get_logger()
 
+ExistingTrackKey = tuple[str, str, str]
 
-def build_track_lookup(route_sections: list[TXCRouteSection]) -> TrackLookup:
+
+def get_existing_tracks(
+    stop_pairs: list[tuple[str, str]], db: SqlDB
+) -> dict[ExistingTrackKey, TransmodelTracks]:
+    """
+    Tracks already in the DB for the stop pairs in one query
+    Keyed by (from_atco_code, to_atco_code, geometry hash)
+    Where duplicates have not been consolidated yet the first created track is used
+    """
+    existing_tracks = [
+        track
+        for track in TransmodelTrackRepo(db).get_by_stop_pairs(stop_pairs)
+        if track.geometry is not None
+    ]
+    if not existing_tracks:
+        return {}
+
+    geometries = shapely.from_wkb(
+        np.array(
+            [get_wkb_bytes(track.geometry) for track in existing_tracks], dtype=object
+        )
+    )
+    lookup: dict[ExistingTrackKey, TransmodelTracks] = {}
+    for track, geometry in sorted(
+        zip(existing_tracks, geometries), key=lambda item: item[0].id
+    ):
+        geometry_hash = get_track_geometry_hash(shapely.get_coordinates(geometry))
+        lookup.setdefault(
+            (track.from_atco_code, track.to_atco_code, geometry_hash), track
+        )
+    return lookup
+
+
+def build_track_lookup(route_sections: list[TXCRouteSection], db: SqlDB) -> TrackLookup:
     """
     Process tracks from route sections
     Returns a lookup dictionary mapping (from_atco, to_atco) to TransmodelTracks
+    Tracks with the same stop pair and geometry as one in the DB reuse it,
+    so only new tracks are built and inserted
     """
     log_ctx = log.bind()
-    all_tracks = create_new_tracks(route_sections)
+    route_link_coords = get_route_link_coordinates(route_sections)
+    existing_tracks = get_existing_tracks(
+        list(dict.fromkeys((link.From, link.To) for link, _ in route_link_coords)), db
+    )
+
+    tracks: list[TransmodelTracks | None] = []
+    new_route_link_coords = []
+    for route_link, coords in route_link_coords:
+        existing_track = existing_tracks.get(
+            (route_link.From, route_link.To, get_track_geometry_hash(coords))
+        )
+        if existing_track is None:
+            new_route_link_coords.append((route_link, coords))
+        tracks.append(existing_track)
+
+    new_tracks = iter(create_tracks(new_route_link_coords))
+    all_tracks = [track if track is not None else next(new_tracks) for track in tracks]
     log_ctx.info(
-        "Built track lookup from route sections", tracks_in_txc=len(all_tracks)
+        "Built track lookup from route sections",
+        tracks_in_txc=len(all_tracks),
+        existing_tracks_reused=len(all_tracks) - len(new_route_link_coords),
     )
     return {(track.from_atco_code, track.to_atco_code): track for track in all_tracks}
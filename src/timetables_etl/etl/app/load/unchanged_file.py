@@ -0,0 +1,61 @@
+"""
+Load a TXC File unchanged since the live revision by cloning its Transmodel data
+"""
+
+from common_layer.database.client import SqlDB
+from common_layer.database.models import (
+    TransmodelBookingArrangements,
+    TransmodelService,
+    TransmodelServicePattern,
+    TransmodelServicePatternAdminAreas,
+    TransmodelServicePatternLocality,
+    TransmodelServicePatternStop,
+    TransmodelServicePatternTracks,
+    TransmodelVehicleJourney,
+)
+from common_layer.database.repos import TransmodelFileCloneRepo
+from structlog.stdlib import get_logger
+
+from ..models import ETLProcessStats, PatternCommonStats, TaskData
+
+log = get_logger()
+
+
+def clone_unchanged_file(
+    live_file_attributes_id: int, task_data: TaskData, db: SqlDB
+) -> ETLProcessStats | None:
+    """
+    Clone the live file's Services, Service Patterns and Vehicle Journeys
+    into the new revision in a single transaction
+    Returns None when the live file has no Service Patterns to clone
+    (it was superseded in the live revision) so the full ETL should run
+    Bank holiday date exceptions are copied as they were when the live file loaded
+    """
+    repo = TransmodelFileCloneRepo(db)
+    if not repo.count_service_patterns(live_file_attributes_id):
+        log.info(
+            "Live file has no service patterns, running full ETL",
+            live_file_attributes_id=live_file_attributes_id,
+        )
+        return None
+
+    with db.unit_of_work():
+        counts = repo.clone_file(
+            live_file_attributes_id,
+            task_data.revision.id,
+            task_data.file_attributes.id,
+        )
+    return ETLProcessStats(
+        services=counts[TransmodelService.__tablename__],
+        service_patterns=counts[TransmodelServicePattern.__tablename__],
+        booking_arrangements=counts[TransmodelBookingArrangements.__tablename__],
+        cloned_files=1,
+        pattern_stats=PatternCommonStats(
+            localities=counts[TransmodelServicePatternLocality.__tablename__],
+            admin_areas=counts[TransmodelServicePatternAdminAreas.__tablename__],
+            vehicle_journeys=counts[TransmodelVehicleJourney.__tablename__],
+            pattern_stops=counts[TransmodelServicePatternStop.__tablename__],
+            tracks=counts[TransmodelServicePatternTracks.__tablename__],
+        ),
+        cloned_rows=counts,
+    )
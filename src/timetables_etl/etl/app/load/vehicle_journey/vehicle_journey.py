@@ -5,6 +5,7 @@ Transmodel Vehicle Journeys
 from typing import TypeGuard
 
 from common_layer.database.models import (
+    TransmodelFlexibleServiceOperationPeriod,
     TransmodelServicePatternStop,
     TransmodelVehicleJourney,
 )
@@ -37,7 +38,7 @@ from ..models_context import (
     ServicePatternVehicleJourneyContext,
     VehicleJourneyProcessingContext,
 )
-from .vehicle_journey_operating_profile import process_operating_profile
+from .vehicle_journey_operating_profile import process_operating_profiles
 
 log = get_logger()
 
@@ -79,21 +80,26 @@ def process_vehicle_journey_operations(
     log.debug(
         "Journey Operations processing started", journey_results=len(journey_results)
     )
+    standard_journeys: list[tuple[TransmodelVehicleJourney, TXCVehicleJourney]] = []
+    flexible_operating_periods: list[TransmodelFlexibleServiceOperationPeriod] = []
     for tm_vj, txc_vj in journey_results:
         match txc_vj:
             case TXCVehicleJourney():
-                process_operating_profile(tm_vj, txc_vj, operating_profile_context)
+                standard_journeys.append((tm_vj, txc_vj))
             case TXCFlexibleVehicleJourney():
-                flexible_operating_periods = generate_flexible_service_operation_period(
-                    tm_vj, txc_vj
+                flexible_operating_periods.extend(
+                    generate_flexible_service_operation_period(tm_vj, txc_vj)
                 )
-                if flexible_operating_periods:
-                    TransmodelFlexibleServiceOperationPeriodRepo(
-                        context.db
-                    ).bulk_insert(flexible_operating_periods)
             case _:
                 raise ValueError(f"Unknown vehicle journey type: {type(txc_vj)}")
 
+    if standard_journeys:
+        process_operating_profiles(standard_journeys, operating_profile_context)
+    if flexible_operating_periods:
+        TransmodelFlexibleServiceOperationPeriodRepo(context.db).bulk_insert(
+            flexible_operating_periods
+        )
+
 
 def process_vehicle_journeys(
     txc_vjs: list[TXCVehicleJourney | TXCFlexibleVehicleJourney],
@@ -2,6 +2,7 @@
 transmodel_vehiclejourny Operating profiles generation
 """
 
+from common_layer.database import SqlDB
 from common_layer.database.models import (
     TransmodelServicedOrganisationWorkingDays,
     TransmodelVehicleJourney,
@@ -16,7 +17,10 @@ from common_layer.database.repos import (
 from common_layer.xml.txc.models import TXCVehicleJourney
 from structlog.stdlib import get_logger
 
-from ...transform.vehicle_journey_operations import create_vehicle_journey_operations
+from ...transform.vehicle_journey_operations import (
+    VehicleJourneyOperations,
+    create_vehicle_journeys_operations,
+)
 from ...transform.vehicle_journey_operations_serviced_org import (
     create_serviced_organisation_working_days,
 )
@@ -25,64 +29,62 @@ from ..models_context import OperatingProfileProcessingContext
 log = get_logger()
 
 
-def process_operating_profile(
-    tm_vj: TransmodelVehicleJourney,
-    txc_vj: TXCVehicleJourney,
-    context: OperatingProfileProcessingContext,
-):
+def insert_vehicle_journey_operations(
+    operations: VehicleJourneyOperations, db: SqlDB
+) -> None:
     """
-    Process a single Operating Profile
+    Insert operations with one statement per table
+    Serviced organisation working days are linked using the IDs set by bulk_insert
     """
-    operations = create_vehicle_journey_operations(
-        txc_vj=txc_vj,
-        tm_vj=tm_vj,
-        context=context,
-    )
-
     if operations.operating_profiles:
-        TransmodelOperatingProfileRepo(context.db).bulk_insert(
+        TransmodelOperatingProfileRepo(db).bulk_insert_copy(
             operations.operating_profiles
         )
 
     if operations.operating_dates:
-        TransmodelOperatingDatesExceptionsRepo(context.db).bulk_insert(
+        TransmodelOperatingDatesExceptionsRepo(db).bulk_insert_copy(
             operations.operating_dates
         )
 
     if operations.non_operating_dates:
-        TransmodelNonOperatingDatesExceptionsRepo(context.db).bulk_insert(
+        TransmodelNonOperatingDatesExceptionsRepo(db).bulk_insert_copy(
             operations.non_operating_dates
         )
 
     if operations.serviced_organisation_vehicle_journeys:
-        saved_so_vjs = TransmodelServicedOrganisationVehicleJourneyRepo(
-            context.db
-        ).bulk_insert(operations.serviced_organisation_vehicle_journeys)
-
-        saved_map = {
-            orig.id: saved
-            for orig, saved in zip(
-                operations.serviced_organisation_vehicle_journeys, saved_so_vjs
-            )
-        }
+        TransmodelServicedOrganisationVehicleJourneyRepo(db).bulk_insert(
+            operations.serviced_organisation_vehicle_journeys
+        )
 
         working_days: list[TransmodelServicedOrganisationWorkingDays] = []
-        for orig_vj, patterns in operations.working_days_patterns:
-            saved_vj = saved_map[orig_vj.id]
+        for so_vj, patterns in operations.working_days_patterns:
             working_days.extend(
-                create_serviced_organisation_working_days(saved_vj, patterns)
+                create_serviced_organisation_working_days(so_vj, patterns)
             )
 
         if working_days:
-            TransmodelServicedOrganisationWorkingDaysRepo(context.db).bulk_insert(
+            TransmodelServicedOrganisationWorkingDaysRepo(db).bulk_insert_copy(
                 working_days
             )
 
+
+def process_operating_profiles(
+    journeys: list[tuple[TransmodelVehicleJourney, TXCVehicleJourney]],
+    context: OperatingProfileProcessingContext,
+) -> VehicleJourneyOperations:
+    """
+    Process the Operating Profiles of several vehicle journeys
+    Journeys sharing a profile reuse its expansion and all records are inserted together
+    """
+    operations = create_vehicle_journeys_operations(journeys, context)
+    insert_vehicle_journey_operations(operations, context.db)
+
     log.info(
         "Processed journey operations",
-        journey_id=tm_vj.id,
+        journeys=len(journeys),
         profiles=len(operations.operating_profiles),
         op_dates=len(operations.operating_dates),
         non_op_dates=len(operations.non_operating_dates),
         serviced_org_vjs=len(operations.serviced_organisation_vehicle_journeys),
     )
+    return operations
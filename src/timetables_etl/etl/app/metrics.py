@@ -5,6 +5,11 @@ Datadog Metrics for Serverless ETL
 from aws_lambda_powertools import Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from common_layer.aws.metrics import get_metric_name
+from common_layer.database.client import PoolStats
+from common_layer.dynamodb.client.naptan_stop_points import (
+    RequestStats,
+    StopPointCacheStats,
+)
 
 from .models import ETLProcessStats
 
@@ -57,3 +62,80 @@ def create_datadog_metrics(metrics: Metrics, stats: ETLProcessStats) -> None:
         unit=MetricUnit.Count,
         value=stats.superseded_timetables,
     )
+    metrics.add_metric(
+        name=get_metric_name("cloned_files"),
+        unit=MetricUnit.Count,
+        value=stats.cloned_files,
+    )
+    for table_name, rows in stats.cloned_rows.items():
+        metrics.add_metric(
+            name=get_metric_name(f"cloned_rows.{table_name}"),
+            unit=MetricUnit.Count,
+            value=rows,
+        )
+
+
+def create_stop_point_client_metrics(
+    metrics: Metrics,
+    cache_stats: StopPointCacheStats,
+    request_stats: RequestStats,
+) -> None:
+    """
+    Send metrics for the NaPTAN StopPoint cache and DynamoDB retries
+    """
+    metrics.add_metric(
+        name=get_metric_name("naptan_cache_hits"),
+        unit=MetricUnit.Count,
+        value=cache_stats.hits,
+    )
+    metrics.add_metric(
+        name=get_metric_name("naptan_cache_misses"),
+        unit=MetricUnit.Count,
+        value=cache_stats.misses,
+    )
+    metrics.add_metric(
+        name=get_metric_name("naptan_throttled_requests"),
+        unit=MetricUnit.Count,
+        value=request_stats.throttled_requests,
+    )
+    metrics.add_metric(
+        name=get_metric_name("naptan_retried_keys"),
+        unit=MetricUnit.Count,
+        value=request_stats.retried_keys,
+    )
+    metrics.add_metric(
+        name=get_metric_name("naptan_unprocessed_keys"),
+        unit=MetricUnit.Count,
+        value=request_stats.unprocessed_keys,
+    )
+
+
+def create_db_pool_metrics(metrics: Metrics, pool_stats: PoolStats) -> None:
+    """
+    Send metrics for database connection pool usage
+    """
+    metrics.add_metric(
+        name=get_metric_name("db_pool_checkouts"),
+        unit=MetricUnit.Count,
+        value=pool_stats.checkouts,
+    )
+    metrics.add_metric(
+        name=get_metric_name("db_pool_checkout_wait"),
+        unit=MetricUnit.Milliseconds,
+        value=pool_stats.checkout_wait_seconds * 1000,
+    )
+    metrics.add_metric(
+        name=get_metric_name("db_pool_max_checkout_wait"),
+        unit=MetricUnit.Milliseconds,
+        value=pool_stats.max_checkout_wait_seconds * 1000,
+    )
+    metrics.add_metric(
+        name=get_metric_name("db_connections"),
+        unit=MetricUnit.Count,
+        value=pool_stats.connects,
+    )
+    metrics.add_metric(
+        name=get_metric_name("db_token_refreshes"),
+        unit=MetricUnit.Count,
+        value=pool_stats.token_refreshes,
+    )
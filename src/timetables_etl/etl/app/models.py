@@ -11,10 +11,8 @@ from common_layer.database.models import (
     OrganisationDatasetRevision,
     OrganisationTXCFileAttributes,
 )
-from common_layer.dynamodb.client.naptan_stop_points import (
-    NaptanStopPointDynamoDBClient,
-)
 from common_layer.dynamodb.data_manager import FileProcessingDataManager
+from common_layer.naptan_snapshot import StopPointClient
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -40,6 +38,14 @@ class ETLInputData(BaseModel):
             description="Skip the insertion of tracks data (used for reprocessing)",
         ),
     ]
+    live_file_attributes_id: Annotated[
+        int | None,
+        Field(
+            alias="LiveTxcFileAttributesId",
+            default=None,
+            description="Unchanged file in the live revision to clone the data of",
+        ),
+    ]
 
 
 class TaskData(BaseModel):
@@ -62,7 +68,7 @@ class ETLTaskClients:
     """
 
     db: SqlDB
-    stop_point_client: NaptanStopPointDynamoDBClient
+    stop_point_client: StopPointClient
     dynamo_data_manager: FileProcessingDataManager
 
 
@@ -105,6 +111,8 @@ class ETLProcessStats(BaseModel):
 
     services: int = 0
     superseded_timetables: int = 0
+    cloned_files: int = 0
     booking_arrangements: int = 0
     service_patterns: int = 0
     pattern_stats: PatternCommonStats = PatternCommonStats()
+    cloned_rows: dict[str, int] = {}
@@ -13,6 +13,7 @@ from .load import (
     load_transmodel_service,
     process_booking_arrangements,
 )
+from .load.models_context import ServicePatternFileContext
 from .load.servicepatterns import load_transmodel_service_patterns
 from .models import ETLProcessStats, ETLTaskClients, TaskData
 from .transform.stop_points import (
@@ -50,7 +51,7 @@ def build_lookup_data(
     serviced_orgs = load_serviced_organizations(
         txc.ServicedOrganisations, task_clients.db
     )
-    track_lookup = build_track_lookup(txc.RouteSections)
+    track_lookup = build_track_lookup(txc.RouteSections, task_clients.db)
 
     return ReferenceDataLookups(
         stops=stop_mapping,
@@ -68,29 +69,36 @@ def transform_data(
 ) -> ETLProcessStats:
     """
     Transform Parsed TXC XML Data into SQLAlchmeny Database Models to apply
+    The whole file is loaded in a single transaction so a failure leaves no rows
     """
     stats = ETLProcessStats()
-    reference_data = build_lookup_data(txc, task_clients)
     db = task_clients.db
-    for service in txc.Services:
-        tm_service = load_transmodel_service(service, task_data, db)
-        stats.services += 1
-        if not task_data.input_data.superseded_timetable:
-            booking_arrangements = process_booking_arrangements(service, tm_service, db)
-            service_patterns, pattern_stats = load_transmodel_service_patterns(
-                service, txc, task_data, reference_data, db
-            )
-            link_service_to_service_patterns(tm_service, service_patterns, db)
-            stats.booking_arrangements += len(booking_arrangements)
-            stats.service_patterns += len(service_patterns)
-            stats.pattern_stats += pattern_stats
-        else:
-            log.info(
-                "Timetable is superceded. Only adding TransmodelService to DB",
-                tm_service_id=tm_service.id,
-                service_code=tm_service.service_code,
-                service_name=tm_service.name,
-            )
-            stats.superseded_timetables += 1
+    with db.unit_of_work():
+        reference_data = build_lookup_data(txc, task_clients)
+        file_context = ServicePatternFileContext(
+            txc=txc, task_data=task_data, lookups=reference_data, db=db
+        )
+        for service in txc.Services:
+            tm_service = load_transmodel_service(service, task_data, db)
+            stats.services += 1
+            if not task_data.input_data.superseded_timetable:
+                booking_arrangements = process_booking_arrangements(
+                    service, tm_service, db
+                )
+                service_patterns, pattern_stats = load_transmodel_service_patterns(
+                    service, file_context
+                )
+                link_service_to_service_patterns(tm_service, service_patterns, db)
+                stats.booking_arrangements += len(booking_arrangements)
+                stats.service_patterns += len(service_patterns)
+                stats.pattern_stats += pattern_stats
+            else:
+                log.info(
+                    "Timetable is superceded. Only adding TransmodelService to DB",
+                    tm_service_id=tm_service.id,
+                    service_code=tm_service.service_code,
+                    service_name=tm_service.name,
+                )
+                stats.superseded_timetables += 1
     log.info("ETL Process Completed", stats=stats)
     return stats
@@ -24,6 +24,7 @@ from structlog.stdlib import get_logger
 
 from ..helpers.dataclasses.lookups import ReferenceDataLookups
 from ..helpers.types import StopsLookup
+from .utils_hash import create_stop_sequence_hash
 from .utils_stops import get_pattern_stops
 from .utils_stops_flexible import get_flexible_pattern_stops
 
@@ -269,7 +270,7 @@ def generate_service_pattern_id(
     """
     Generate a deterministic service pattern ID based on service code and stop sequence
     """
-    return f"SP-{service_code}-{hash(stop_sequence_key) % 1000000:06d}"
+    return f"SP-{service_code}-{create_stop_sequence_hash(stop_sequence_key)}"
 
 
 def create_service_pattern_id_for_stops(
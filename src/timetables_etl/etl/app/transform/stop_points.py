@@ -3,9 +3,7 @@ Stop Point Information
 """
 
 from common_layer.database.models import NaptanStopPoint
-from common_layer.dynamodb.client.naptan_stop_points import (
-    NaptanStopPointDynamoDBClient,
-)
+from common_layer.naptan_snapshot import StopPointClient
 from common_layer.utils_location import osgrid_to_lonlat
 from common_layer.xml.txc.models import (
     AnnotatedStopPointRef,
@@ -136,7 +134,7 @@ def create_stop_point_lookups(
 
 def get_naptan_stops_from_dynamo(
     stop_points: list[AnnotatedStopPointRef | TXCStopPoint],
-    stop_point_client: NaptanStopPointDynamoDBClient,
+    stop_point_client: StopPointClient,
 ) -> tuple[list[TXCStopPoint], list[str]]:
     """
     Filter the TXC Stop Points for AnnotatedStopPointRef and query the DB for them
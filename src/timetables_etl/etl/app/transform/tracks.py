@@ -2,16 +2,19 @@
 Transmodel Tracks Generation
 """
 
+import hashlib
 from dataclasses import dataclass
-from typing import NamedTuple
+from typing import Any, NamedTuple, Sequence
 
+import numpy as np
 import pyproj
+import shapely
 from common_layer.database.models.model_transmodel import TransmodelTracks
 from common_layer.xml.txc.models import TXCTrack
-from common_layer.xml.txc.models.txc_route import TXCRouteSection
+from common_layer.xml.txc.models.txc_route import TXCRouteLink, TXCRouteSection
 from geoalchemy2 import WKBElement
-from geoalchemy2.shape import from_shape  # type: ignore
-from shapely import LineString, Point
+from numpy.typing import NDArray
+from shapely import LineString
 from structlog.stdlib import get_logger
 
 log = get_logger()
@@ -56,6 +59,12 @@ def analyze_track_pairs(
     )
 
 
+GEOD = pyproj.Geod(ellps="WGS84")
+
+# Decimal places of lon / lat kept when hashing, roughly 0.1m
+TRACK_HASH_PRECISION = 6
+
+
 class TrackGeometry(NamedTuple):
     """Contains processed geometry and distance for a track"""
 
@@ -64,29 +73,35 @@ class TrackGeometry(NamedTuple):
     distance: int | None
 
 
-def calculate_distance_from_geometry(line: LineString) -> int | None:
+def calculate_line_distances(lines: Sequence[LineString] | NDArray[Any]) -> list[int]:
     """
-    Calculate PyProj geodesic distance in meters from a LineString geometry.
-    Gets list of coodinates of line string and then adding the distances between points
+    Calculate PyProj geodesic distances in meters for many LineStrings at once
+    The coordinates of every line are flattened into one array so a single
+    line_lengths call covers them, segments joining two lines are dropped
     """
-    geod = pyproj.Geod(ellps="WGS84")
-
-    coords = list(line.coords)
-    total_distance = 0
-
-    for i in range(len(coords) - 1):
-        lon1, lat1 = coords[i]
-        lon2, lat2 = coords[i + 1]
+    if len(lines) == 0:
+        return []
+    coords, line_index = shapely.get_coordinates(lines, return_index=True)
+    segment_lengths = np.asarray(GEOD.line_lengths(coords[:, 0], coords[:, 1]))
+    same_line = line_index[1:] == line_index[:-1]
+    totals = np.bincount(
+        line_index[:-1][same_line],
+        weights=segment_lengths[same_line],
+        minlength=len(lines),
+    )
+    return [int(total) for total in totals]
 
-        _, _, distance = geod.inv(lons1=lon1, lats1=lat1, lons2=lon2, lats2=lat2)
-        total_distance += distance
 
-    return int(total_distance)
+def calculate_distance_from_geometry(line: LineString) -> int | None:
+    """
+    Calculate PyProj geodesic distance in meters from a LineString geometry.
+    """
+    return calculate_line_distances([line])[0]
 
 
-def process_track_geometry(track: TXCTrack) -> TrackGeometry | None:
+def get_track_coordinates(track: TXCTrack) -> NDArray[np.float64] | None:
     """
-    Process a TXC track to extract geometry.
+    Longitude / Latitude array of a TXC track
     Returns None if track has no valid mapping data.
     """
     if not track or not track.Mapping or not track.Mapping.Location:
@@ -102,17 +117,10 @@ def process_track_geometry(track: TXCTrack) -> TrackGeometry | None:
         return None
 
     try:
-        points = [
-            Point(float(loc.Longitude), float(loc.Latitude))
-            for loc in track.Mapping.Location
-        ]
-
-        line = LineString(points)
-
-        geometry = from_shape(line, srid=4326)
-
-        return TrackGeometry(geometry=geometry, line=line, distance=None)
-
+        return np.array(
+            [(loc.Longitude, loc.Latitude) for loc in track.Mapping.Location],
+            dtype=np.float64,
+        )
     except (ValueError, TypeError) as e:
         log.warning(
             "Failed to process track geometry",
@@ -122,6 +130,25 @@ def process_track_geometry(track: TXCTrack) -> TrackGeometry | None:
         return None
 
 
+def to_wkb_element(line: LineString) -> WKBElement:
+    """
+    Same output as geoalchemy2 from_shape with srid 4326
+    """
+    return WKBElement(memoryview(shapely.to_wkb(line)), srid=4326)
+
+
+def process_track_geometry(track: TXCTrack) -> TrackGeometry | None:
+    """
+    Process a TXC track to extract geometry.
+    Returns None if track has no valid mapping data.
+    """
+    coords = get_track_coordinates(track)
+    if coords is None:
+        return None
+    line = shapely.linestrings(coords)
+    return TrackGeometry(geometry=to_wkb_element(line), line=line, distance=None)
+
+
 def create_track_mapping(
     route_sections: list[TXCRouteSection],
 ) -> dict[tuple[str, str], tuple[TXCTrack, int | None]]:
@@ -151,39 +178,75 @@ def create_track_mapping(
     return track_mapping
 
 
-def create_new_tracks(route_sections: list[TXCRouteSection]) -> list[TransmodelTracks]:
+def get_track_geometry_hash(coords: NDArray[np.float64]) -> str:
     """
-    Create new TransmodelTrack objects with geometry and distance where available.
+    Hash of track coordinates rounded to TRACK_HASH_PRECISION
+    Repeated points are dropped so equivalent geometries share a hash
     """
-    log.debug("Creating New Tracks")
-    new_tracks: list[TransmodelTracks] = []
+    rounded = np.round(coords[:, :2], TRACK_HASH_PRECISION) + 0.0
+    changed = np.any(rounded[1:] != rounded[:-1], axis=1)
+    normalized = rounded[np.concatenate(([True], changed))]
+    return hashlib.sha256(normalized.astype("<f8").tobytes()).hexdigest()
+
+
+def get_route_link_coordinates(
+    route_sections: list[TXCRouteSection],
+) -> list[tuple[TXCRouteLink, NDArray[np.float64]]]:
+    """
+    Route links with valid track data and their track coordinates
+    """
+    route_link_coords: list[tuple[TXCRouteLink, NDArray[np.float64]]] = []
     for section in route_sections:
         for route_link in section.RouteLink:
             if not route_link.Track:
                 continue
+            coords = get_track_coordinates(route_link.Track)
+            if coords is None:
+                continue
+            route_link_coords.append((route_link, coords))
+    return route_link_coords
 
-            from_code = route_link.From
-            to_code = route_link.To
-            txc_track = route_link.Track
-            provided_distance = route_link.Distance
 
-            track_geom = process_track_geometry(txc_track)
-            if not track_geom:
-                continue
+def create_new_tracks(route_sections: list[TXCRouteSection]) -> list[TransmodelTracks]:
+    """
+    Create new TransmodelTrack objects with geometry and distance where available.
+    """
+    log.debug("Creating New Tracks")
+    return create_tracks(get_route_link_coordinates(route_sections))
 
-            distance = (
-                provided_distance
-                if provided_distance is not None
-                else calculate_distance_from_geometry(track_geom.line)
-            )
-            coord_distance = calculate_distance_from_geometry(track_geom.line)
 
+def create_tracks(
+    route_link_coords: list[tuple[TXCRouteLink, NDArray[np.float64]]],
+) -> list[TransmodelTracks]:
+    """
+    Create a TransmodelTrack for each route link from its track coordinates
+    Every track's LineString and distance is built in one vectorised pass
+    """
+    route_links = [route_link for route_link, _ in route_link_coords]
+    track_coords = [coords for _, coords in route_link_coords]
+
+    new_tracks: list[TransmodelTracks] = []
+    if track_coords:
+        lines = shapely.linestrings(
+            np.concatenate(track_coords),
+            indices=np.repeat(
+                np.arange(len(track_coords)), [len(c) for c in track_coords]
+            ),
+        )
+        coord_distances = calculate_line_distances(lines)
+        for route_link, line, coord_distance in zip(
+            route_links, lines, coord_distances
+        ):
             new_tracks.append(
                 TransmodelTracks(
-                    from_atco_code=from_code,
-                    to_atco_code=to_code,
-                    geometry=track_geom.geometry,
-                    distance=distance,
+                    from_atco_code=route_link.From,
+                    to_atco_code=route_link.To,
+                    geometry=to_wkb_element(line),
+                    distance=(
+                        route_link.Distance
+                        if route_link.Distance is not None
+                        else coord_distance
+                    ),
                     coord_distance=coord_distance,
                 )
             )
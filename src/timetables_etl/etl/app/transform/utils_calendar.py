@@ -0,0 +1,49 @@
+"""
+Vectorised calendar calculations for Operating Profiles
+"""
+
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+from common_layer.xml.txc.models import TXCDaysOfWeek
+
+WeekdayMask = tuple[bool, bool, bool, bool, bool, bool, bool]
+
+# numpy's day 0 (1970-01-01) was a Thursday, offset so Monday is 0
+EPOCH_WEEKDAY_OFFSET = 3
+
+
+def get_weekday_mask(days: TXCDaysOfWeek) -> WeekdayMask:
+    """
+    Days of operation as a Monday first mask, usable as a cache key
+    """
+    return (
+        days.Monday,
+        days.Tuesday,
+        days.Wednesday,
+        days.Thursday,
+        days.Friday,
+        days.Saturday,
+        days.Sunday,
+    )
+
+
+@lru_cache(maxsize=4096)
+def get_dates_by_weekday(
+    start_date: date, end_date: date, weekday_mask: WeekdayMask, operating: bool
+) -> tuple[date, ...]:
+    """
+    Dates between start and end inclusive that fall on (or off) the masked weekdays
+    Memoised so journeys sharing a profile and date range reuse the result
+    """
+    days = np.arange(
+        np.datetime64(start_date, "D"),
+        np.datetime64(end_date, "D") + 1,
+        dtype="datetime64[D]",
+    )
+    weekdays = (days.astype(np.int64) + EPOCH_WEEKDAY_OFFSET) % 7
+    selected = np.asarray(weekday_mask, dtype=bool)[weekdays]
+    if not operating:
+        selected = ~selected
+    return tuple(days[selected].tolist())
@@ -1,21 +1,27 @@
 """
 Hash Functions used by the ETL Pipeline
+Hashes are content addressed and stable across processes so they can be persisted
 """
 
+import hashlib
+from typing import Iterable
+
 from common_layer.xml.txc.models import TXCJourneyPattern, TXCJourneyPatternSection
-from structlog.stdlib import get_logger
 
-log = get_logger()
+HASH_DIGEST_SIZE = 16
 
 
-def create_hash(values: list[str]) -> str:
+def create_hash(values: Iterable[str]) -> str:
     """
-    Create a hash value based on the given sequence of values.
+    Create a BLAKE2b hash of the given sequence of values.
+    Each value is length prefixed so ["ab", "c"] and ["a", "bc"] differ
     """
-    log.info("The hashes", types=type(values[0]))
-
-    print(values)
-    return str(hash(tuple(values)))
+    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    for value in values:
+        encoded = value.encode()
+        hasher.update(len(encoded).to_bytes(4, "big"))
+        hasher.update(encoded)
+    return hasher.hexdigest()
 
 
 def create_route_section_hashes(
@@ -54,3 +60,10 @@ def create_route_hashes(
         routes[pattern.id] = route_hash
 
     return routes
+
+
+def create_stop_sequence_hash(atco_codes: Iterable[str]) -> str:
+    """
+    Hash of a service pattern's stop sequence by ATCO code
+    """
+    return create_hash(atco_codes)
@@ -3,7 +3,7 @@ Functions to Calculate the Operating and Non Operating days for a Vehicle Journe
 """
 
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
 from typing import Sequence
 
 from common_layer.database.models import (
@@ -28,6 +28,7 @@ from common_layer.xml.txc.models import (
 from structlog.stdlib import get_logger
 
 from ..load.models_context import OperatingProfileProcessingContext
+from .utils_calendar import get_dates_by_weekday, get_weekday_mask
 from .vehicle_journey_operations_serviced_org import (
     create_serviced_organisation_vehicle_journeys,
 )
@@ -82,15 +83,6 @@ def create_operating_profiles(
     ]
 
 
-def generate_dates(start_date: date, end_date: date) -> list[date]:
-    """
-    Generate a list of dates between start and end dates inclusive
-
-    """
-    days_between = (end_date - start_date).days + 1
-    return [start_date + timedelta(days=x) for x in range(days_between)]
-
-
 def create_operating_dates(
     date_ranges: Sequence[TXCDateRange],
     vehicle_journey_id: int,
@@ -99,23 +91,18 @@ def create_operating_dates(
     """
     Create operating dates exceptions from date ranges
     """
-    operating_dates: list[TransmodelOperatingDatesExceptions] = []
-
-    for date_range in date_ranges:
-        for current_date in generate_dates(date_range.StartDate, date_range.EndDate):
-            day_of_week = current_date.strftime("%A")  # Get day name (e.g., "Monday")
-
-            # Check if the current date's day of the week is an operating days, and if \
-            # it is not then insert in TransmodelOperatingDatesExceptions
-            if not getattr(days_of_operation, day_of_week, False):
-                operating_dates.append(
-                    TransmodelOperatingDatesExceptions(
-                        operating_date=current_date,
-                        vehicle_journey_id=vehicle_journey_id,
-                    )
-                )
-
-    return operating_dates
+    weekday_mask = get_weekday_mask(days_of_operation)
+    # Dates falling outside the regular days of operation are exceptions
+    return [
+        TransmodelOperatingDatesExceptions(
+            operating_date=current_date,
+            vehicle_journey_id=vehicle_journey_id,
+        )
+        for date_range in date_ranges
+        for current_date in get_dates_by_weekday(
+            date_range.StartDate, date_range.EndDate, weekday_mask, operating=False
+        )
+    ]
 
 
 def create_non_operating_dates(
@@ -126,23 +113,18 @@ def create_non_operating_dates(
     """
     Create non-operating dates exceptions from date ranges
     """
-    non_operating_dates: list[TransmodelNonOperatingDatesExceptions] = []
-
-    for date_range in date_ranges:
-        for current_date in generate_dates(date_range.StartDate, date_range.EndDate):
-            day_of_week = current_date.strftime("%A")  # Get day name (e.g., "Monday")
-
-            # Check if the current date's day of the week is an operating days, and if \
-            # it is then insert in TransmodelNonOperatingDatesExceptions
-            if getattr(days_of_operation, day_of_week, False):
-                non_operating_dates.append(
-                    TransmodelNonOperatingDatesExceptions(
-                        non_operating_date=current_date,
-                        vehicle_journey_id=vehicle_journey_id,
-                    )
-                )
-
-    return non_operating_dates
+    weekday_mask = get_weekday_mask(days_of_operation)
+    # Dates falling on the regular days of operation are exceptions
+    return [
+        TransmodelNonOperatingDatesExceptions(
+            non_operating_date=current_date,
+            vehicle_journey_id=vehicle_journey_id,
+        )
+        for date_range in date_ranges
+        for current_date in get_dates_by_weekday(
+            date_range.StartDate, date_range.EndDate, weekday_mask, operating=True
+        )
+    ]
 
 
 def get_bank_holiday_non_operating_dates(
@@ -153,14 +135,14 @@ def get_bank_holiday_non_operating_dates(
     """
     Get list of dates for enabled bank holidays
     """
+    weekday_mask = get_weekday_mask(days_of_operation)
     unique_dates: set[date] = set()
     for holiday_name in holiday_days.model_fields.keys():
         is_active: bool = getattr(holiday_days, holiday_name)
         if is_active and holiday_name in bank_holidays:
             dates_list = bank_holidays[holiday_name]
             for holiday_date in dates_list:
-                day_of_week = holiday_date.strftime("%A")
-                if getattr(days_of_operation, day_of_week, False):
+                if weekday_mask[holiday_date.weekday()]:
                     unique_dates.update([holiday_date])
 
     return sorted(unique_dates)
@@ -174,14 +156,14 @@ def get_bank_holiday_operating_dates(
     """
     Get list of dates for enabled bank holidays
     """
+    weekday_mask = get_weekday_mask(days_of_operation)
     unique_dates: set[date] = set()
     for holiday_name in holiday_days.model_fields.keys():
         is_active: bool = getattr(holiday_days, holiday_name)
         if is_active and holiday_name in bank_holidays:
             dates_list = bank_holidays[holiday_name]
             for holiday_date in dates_list:
-                day_of_week = holiday_date.strftime("%A")
-                if not getattr(days_of_operation, day_of_week, False):
+                if not weekday_mask[holiday_date.weekday()]:
                     unique_dates.update([holiday_date])
 
     return sorted(unique_dates)
@@ -312,7 +294,17 @@ def create_vehicle_journey_operations(
             tm_vj_id=tm_vj,
         )
         return VehicleJourneyOperations([], [], [], [], [])
+    return create_operating_profile_operations(operating_profile, tm_vj, context)
+
 
+def create_operating_profile_operations(
+    operating_profile: TXCOperatingProfile,
+    tm_vj: TransmodelVehicleJourney,
+    context: OperatingProfileProcessingContext,
+) -> VehicleJourneyOperations:
+    """
+    Expand an OperatingProfile into the operations of a vehicle journey
+    """
     special_operating_dates, special_non_operating_dates = (
         process_special_operating_days(
             operating_profile.SpecialDaysOperation,
@@ -375,3 +367,106 @@ def create_vehicle_journey_operations(
         vehicle_journey_id=tm_vj.id,
     )
     return result
+
+
+def get_operating_profile_key(operating_profile: TXCOperatingProfile) -> str:
+    """
+    Canonical key for an OperatingProfile, equal profiles give equal keys
+    """
+    return operating_profile.model_dump_json()
+
+
+def copy_vehicle_journey_operations(
+    operations: VehicleJourneyOperations, vehicle_journey_id: int
+) -> VehicleJourneyOperations:
+    """
+    New records for another vehicle journey with the same operations
+    """
+    so_vjs = {
+        id(so_vj): TransmodelServicedOrganisationVehicleJourney(
+            operating_on_working_days=so_vj.operating_on_working_days,
+            serviced_organisation_id=so_vj.serviced_organisation_id,
+            vehicle_journey_id=vehicle_journey_id,
+        )
+        for so_vj in operations.serviced_organisation_vehicle_journeys
+    }
+    return VehicleJourneyOperations(
+        operating_profiles=[
+            TransmodelOperatingProfile(
+                day_of_week=profile.day_of_week, vehicle_journey_id=vehicle_journey_id
+            )
+            for profile in operations.operating_profiles
+        ],
+        operating_dates=[
+            TransmodelOperatingDatesExceptions(
+                operating_date=operating_date.operating_date,
+                vehicle_journey_id=vehicle_journey_id,
+            )
+            for operating_date in operations.operating_dates
+        ],
+        non_operating_dates=[
+            TransmodelNonOperatingDatesExceptions(
+                non_operating_date=non_operating_date.non_operating_date,
+                vehicle_journey_id=vehicle_journey_id,
+            )
+            for non_operating_date in operations.non_operating_dates
+        ],
+        serviced_organisation_vehicle_journeys=list(so_vjs.values()),
+        working_days_patterns=[
+            (so_vjs[id(so_vj)], patterns)
+            for so_vj, patterns in operations.working_days_patterns
+        ],
+    )
+
+
+def create_vehicle_journeys_operations(
+    journeys: Sequence[tuple[TransmodelVehicleJourney, TXCVehicleJourney]],
+    context: OperatingProfileProcessingContext,
+) -> VehicleJourneyOperations:
+    """
+    Create the operations for several vehicle journeys
+    Each distinct OperatingProfile is expanded once and copied to the other
+    journeys sharing it
+    """
+    operations: list[VehicleJourneyOperations] = []
+    for tm_vj, txc_vj in journeys:
+        operating_profile = get_operating_profile(txc_vj, context.txc_services)
+        if not operating_profile:
+            operations.append(create_vehicle_journey_operations(txc_vj, tm_vj, context))
+            continue
+
+        profile_key = get_operating_profile_key(operating_profile)
+        expanded = context.expanded_profiles.get(profile_key)
+        if expanded is None:
+            expanded = create_operating_profile_operations(
+                operating_profile, tm_vj, context
+            )
+            context.expanded_profiles[profile_key] = expanded
+            operations.append(expanded)
+        else:
+            operations.append(copy_vehicle_journey_operations(expanded, tm_vj.id))
+
+    log.info(
+        "Created Vehicle Journey Operations",
+        vehicle_journeys=len(journeys),
+        distinct_profiles=len(context.expanded_profiles),
+    )
+    return merge_vehicle_journey_operations(operations)
+
+
+def merge_vehicle_journey_operations(
+    operations: Sequence[VehicleJourneyOperations],
+) -> VehicleJourneyOperations:
+    """
+    Combine the operations of several vehicle journeys so they can be inserted together
+    """
+    merged = VehicleJourneyOperations([], [], [], [], [])
+    for journey_operations in operations:
+        merged.operating_profiles.extend(journey_operations.operating_profiles)
+        merged.operating_dates.extend(journey_operations.operating_dates)
+        merged.non_operating_dates.extend(journey_operations.non_operating_dates)
+        merged.serviced_organisation_vehicle_journeys.extend(
+            journey_operations.serviced_organisation_vehicle_journeys
+        )
+        merged.working_days_patterns.extend(journey_operations.working_days_patterns)
+    return merged
@@ -8,10 +8,8 @@ from attr import dataclass
 from common_layer.database.client import SqlDB
 from common_layer.database.models import OrganisationDatasetRevision
 from common_layer.dynamodb.client.cache import DynamoDBCache
-from common_layer.dynamodb.client.naptan_stop_points import (
-    NaptanStopPointDynamoDBClient,
-)
 from common_layer.dynamodb.models import TXCFileAttributes
+from common_layer.naptan_snapshot import StopPointClient
 from common_layer.xml.txc.models import TXCData
 from pydantic import BaseModel, ConfigDict
 
@@ -38,4 +36,4 @@ class DbClients:
 
     sql_db: SqlDB
     dynamodb: DynamoDBCache
-    stop_point_client: NaptanStopPointDynamoDBClient
+    stop_point_client: StopPointClient
@@ -15,18 +15,18 @@ from common_layer.database.repos import (
 from common_layer.db.constants import StepName
 from common_layer.db.file_processing_result import file_processing_result_to_db
 from common_layer.dynamodb.client.cache import DynamoDBCache
-from common_layer.dynamodb.client.naptan_stop_points import (
-    NaptanStopPointDynamoDBClient,
-)
 from common_layer.dynamodb.data_manager import FileProcessingDataManager
 from common_layer.dynamodb.models import TXCFileAttributes
+from common_layer.naptan_snapshot import create_stop_point_client
 from common_layer.s3 import S3
+from common_layer.txc_artifact import TXCArtifactSettings, get_txc_data_from_artifact
 from common_layer.xml.txc.models import TXCData
 from common_layer.xml.txc.parser.parser_txc import (
     TXCParserConfig,
     load_xml_data,
     parse_txc_from_element,
 )
+from common_layer.xml.utils.hashing import get_bytes_hash
 from pydantic import BaseModel
 from structlog.stdlib import get_logger
 
@@ -61,7 +61,7 @@ def get_txc_data(xml_file_object: BytesIO) -> TXCData:
     """
     Parse given xml_file_object to TXCData
     """
-    parsed_xml = load_xml_data(xml_file_object)
+    parsed_xml = load_xml_data(xml_file_object, strip_namespaces=False)
     config = TXCParserConfig.parse_stops_only()
     txc_data = parse_txc_from_element(parsed_xml, config)
     return txc_data
@@ -85,7 +85,16 @@ def get_task_data(
     cached_live_txc_file_attributes = (
         data_manager.get_cached_live_txc_file_attributes(revision.id) or []
     )
-    txc_data = get_txc_data(xml_file_object)
+    if TXCArtifactSettings().TXC_ARTIFACT_CACHE_ENABLED:
+        txc_data = get_txc_data_from_artifact(
+            S3(event.Bucket),
+            event.ObjectKey,
+            xml_file_object,
+            get_bytes_hash(xml_file_object),
+            TXCParserConfig.parse_stops_only(),
+        )
+    else:
+        txc_data = get_txc_data(xml_file_object)
 
     return PTITaskData(
         revision=revision,
@@ -121,7 +130,7 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
     db_clients = DbClients(
         sql_db=SqlDB(),
         dynamodb=DynamoDBCache(),
-        stop_point_client=NaptanStopPointDynamoDBClient(),
+        stop_point_client=create_stop_point_client(),
     )
     task_data = get_task_data(parsed_event, xml_file_object, db_clients)
     run_validation(task_data, db_clients)
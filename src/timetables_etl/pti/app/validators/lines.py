@@ -6,7 +6,7 @@ import itertools
 from collections import defaultdict
 
 from attr import dataclass
-from common_layer.dynamodb.client import NaptanStopPointDynamoDBClient
+from common_layer.naptan_snapshot import StopPointClient
 from common_layer.xml.txc.models import TXCData, TXCStopPoint
 from common_layer.xml.txc.models.txc_stoppoint.txc_stoppoint import (
     AnnotatedStopPointRef,
@@ -133,7 +133,7 @@ class LinesValidator(BaseValidator):
 
 
 def get_stop_info_map(
-    naptan_client: NaptanStopPointDynamoDBClient, txc_data: TXCData
+    naptan_client: StopPointClient, txc_data: TXCData
 ) -> dict[str, StopInfo]:
     """
     Build a map between atco codes and StopInfo required for line validation
@@ -169,9 +169,7 @@ def get_stop_info_map(
     return stop_info_map
 
 
-def get_lines_validator(
-    naptan_client: NaptanStopPointDynamoDBClient, txc_data: TXCData
-):
+def get_lines_validator(naptan_client: StopPointClient, txc_data: TXCData):
     """
     Creates and returns a validator function for NAPTAN lines XML elements.
     """
@@ -1,7 +1,17 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+import pytest
 from common_layer.database.client import SqlDB
 from common_layer.database.models import NaptanAdminArea
 from common_layer.database.models.common import BaseSQLModel
-from common_layer.database.repos.repo_common import BaseRepositoryWithId
+from common_layer.database.repos.repo_common import (
+    COPY_NULL,
+    BaseRepositoryWithId,
+    format_copy_value,
+    get_copy_column_keys,
+)
 
 
 def assert_attributes(expected_attributes: dict, record: BaseSQLModel):
@@ -104,3 +114,123 @@ def test_bulk_delete_by_ids(test_db: SqlDB) -> None:
     with test_db.session_scope() as session:
         remaining = session.query(model).filter(model.id.in_([id_1, id_2])).all()
         assert len(remaining) == 0, "Both records should be deleted"
+
+
+def test_bulk_insert(test_db: SqlDB) -> None:
+    model = NaptanAdminArea
+    repo = BaseRepositoryWithId(test_db, model=model)
+    records = [
+        NaptanAdminArea(
+            name=f"AdminArea{i}",
+            traveline_region_id="NE",
+            atco_code=f"ATCO-BULK-{i}",
+            ui_lta_id=None,
+        )
+        for i in range(3)
+    ]
+
+    inserted = repo.bulk_insert(records)
+
+    assert inserted == records
+    assert all(record.id is not None for record in records)
+    with test_db.session_scope() as session:
+        fetched = {
+            record.id: record.atco_code
+            for record in session.query(model).filter(
+                model.id.in_([record.id for record in records])
+            )
+        }
+    assert fetched == {record.id: record.atco_code for record in records}
+
+
+def test_bulk_insert_copy(test_db: SqlDB) -> None:
+    model = NaptanAdminArea
+    repo = BaseRepositoryWithId(test_db, model=model)
+    records = [
+        NaptanAdminArea(
+            name='Admin, "Area"',
+            traveline_region_id="NE",
+            atco_code=f"ATCO-COPY-{i}",
+            ui_lta_id=None if i else 7,
+        )
+        for i in range(3)
+    ]
+
+    assert repo.bulk_insert_copy(records) == 3
+
+    with test_db.session_scope() as session:
+        fetched = (
+            session.query(model)
+            .filter(model.atco_code.like("ATCO-COPY-%"))
+            .order_by(model.atco_code)
+            .all()
+        )
+        assert [record.ui_lta_id for record in fetched] == [7, None, None]
+        assert {record.name for record in fetched} == {'Admin, "Area"'}
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        pytest.param([7, None], id="Only the first record has an id"),
+        pytest.param([None, 7], id="Only a later record has an id"),
+    ],
+)
+def test_get_copy_column_keys_mixed_primary_keys(ids: list[int | None]) -> None:
+    records: list[BaseSQLModel] = []
+    for i, record_id in enumerate(ids):
+        record = NaptanAdminArea(
+            name="AdminArea",
+            traveline_region_id="NE",
+            atco_code=f"ATCO-COPY-{i}",
+            ui_lta_id=None,
+        )
+        record.id = record_id
+        records.append(record)
+
+    with pytest.raises(ValueError, match="'id'"):
+        get_copy_column_keys(records)
+
+
+def test_get_copy_column_keys() -> None:
+    records = [
+        NaptanAdminArea(
+            name="AdminArea",
+            traveline_region_id="NE",
+            atco_code=f"ATCO-COPY-{i}",
+            ui_lta_id=None,
+        )
+        for i in range(2)
+    ]
+
+    assert get_copy_column_keys(records) == {
+        "name",
+        "traveline_region_id",
+        "atco_code",
+        "ui_lta_id",
+    }
+
+
+class CopyEnum(Enum):
+    """Enum stored by value"""
+
+    VALUE = "value"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param(None, COPY_NULL, id="None is NULL"),
+        pytest.param("", "", id="Empty string is not NULL"),
+        pytest.param(True, "t", id="Bool"),
+        pytest.param(12, "12", id="Int"),
+        pytest.param(CopyEnum.VALUE, "value", id="Enum value"),
+        pytest.param(date(2024, 1, 2), "2024-01-02", id="Date"),
+        pytest.param(
+            datetime(2024, 1, 2, 3, 4, 5), "2024-01-02T03:04:05", id="Datetime"
+        ),
+        pytest.param(["a", None, 'b"c'], '{"a",NULL,"b\\"c"}', id="Array with quotes"),
+    ],
+)
+def test_format_copy_value(value: Any, expected: str) -> None:
+    assert format_copy_value(value) == expected
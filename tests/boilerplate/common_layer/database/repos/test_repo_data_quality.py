@@ -124,8 +124,8 @@ def test_create_observations_handles_error(
     """Tests error handling during PTI observation creation."""
     repo = DataQualityPTIObservationRepo(test_db)
     mock_session = MagicMock()
-    mock_session.return_value.__enter__.return_value.add.side_effect = SQLAlchemyError(
-        "Test error"
+    mock_session.return_value.__enter__.return_value.execute.side_effect = (
+        SQLAlchemyError("Test error")
     )
 
     with (
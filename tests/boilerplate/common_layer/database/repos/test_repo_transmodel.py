@@ -1,10 +1,20 @@
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from typing import Any, Generator
+from unittest.mock import MagicMock, patch
 
+import pytest
 from common_layer.database.client import SqlDB
 from common_layer.database.dataclasses import ServiceStats
-from common_layer.database.repos import TransmodelServiceRepo, TransmodelTrackRepo
+from common_layer.database.models import TransmodelBankHolidays
+from common_layer.database.repos import (
+    BankHolidayIndex,
+    BankHolidayIndexCache,
+    TransmodelBankHolidaysRepo,
+    TransmodelServiceRepo,
+    TransmodelTrackRepo,
+)
+from common_layer.database.repos.repo_transmodel import BankHolidayDivision
 from sqlalchemy import bindparam, text
 
 from tests.factories.database import TransmodelServiceFactory
@@ -169,3 +179,108 @@ def test_transmodel_tracks_stream_similar_track_pairs_by_stop_points(
         assert len(track_pairs) == 1
         assert track1_id in track_pairs[0]
         assert similar_track_id in track_pairs[0]
+
+
+def create_bank_holiday(
+    txc_element: str, holiday_date: date, division: str | None = "england-and-wales"
+) -> TransmodelBankHolidays:
+    """
+    Bank Holiday row without a DB
+    """
+    return TransmodelBankHolidays(
+        txc_element=txc_element,
+        title=None,
+        date=holiday_date,
+        notes=None,
+        division=division,
+    )
+
+
+BANK_HOLIDAYS = [
+    create_bank_holiday("ChristmasDay", date(2025, 12, 25)),
+    create_bank_holiday("ChristmasDay", date(2025, 12, 25), "scotland"),
+    create_bank_holiday("Jan2ndScotland", date(2026, 1, 2), "scotland"),
+    create_bank_holiday("ChristmasDay", date(2024, 12, 25)),
+    create_bank_holiday("NewYearsDay", date(2026, 1, 1)),
+]
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date, divisions, expected",
+    [
+        pytest.param(
+            date(2025, 1, 1),
+            None,
+            None,
+            {
+                "ChristmasDay": [date(2025, 12, 25), date(2025, 12, 25)],
+                "NewYearsDay": [date(2026, 1, 1)],
+                "Jan2ndScotland": [date(2026, 1, 2)],
+            },
+            id="Open ended range",
+        ),
+        pytest.param(
+            date(2024, 12, 25),
+            date(2025, 12, 25),
+            ["england-and-wales"],
+            {"ChristmasDay": [date(2024, 12, 25), date(2025, 12, 25)]},
+            id="Inclusive range for a division",
+        ),
+        pytest.param(
+            date(2026, 1, 3),
+            None,
+            None,
+            {},
+            id="No holidays in range",
+        ),
+    ],
+)
+def test_bank_holiday_index_lookup(
+    start_date: date,
+    end_date: date | None,
+    divisions: list[BankHolidayDivision] | None,
+    expected: dict[str, list[date]],
+):
+    """
+    Lookup matches the repo query grouped by txc_element
+    """
+    index = BankHolidayIndex(BANK_HOLIDAYS)
+
+    result = index.get_bank_holidays_lookup(start_date, end_date, divisions)
+
+    assert result == expected
+    assert index.get_bank_holidays_lookup(start_date, end_date, divisions) is result
+
+
+def test_bank_holiday_index_len():
+    """
+    Every holiday is indexed
+    """
+    assert len(BankHolidayIndex(BANK_HOLIDAYS)) == 5
+
+
+def test_bank_holiday_index_cache_ttl():
+    """
+    The table is loaded once and reloaded after the TTL expires
+    """
+    cache = BankHolidayIndexCache(ttl_seconds=60)
+    db = MagicMock()
+    with (
+        patch.object(
+            TransmodelBankHolidaysRepo, "get_all", return_value=BANK_HOLIDAYS
+        ) as get_all,
+        patch("common_layer.database.repos.repo_transmodel.time.monotonic") as clock,
+    ):
+        clock.return_value = 100.0
+        first = cache.get(db)
+        clock.return_value = 159.0
+        assert cache.get(db) is first
+        assert get_all.call_count == 1
+
+        clock.return_value = 160.0
+        assert cache.get(db) is not first
+        assert get_all.call_count == 2
+
+        cache.clear()
+        cache.get(db)
+        assert get_all.call_count == 3
@@ -0,0 +1,152 @@
+"""
+Test cloning a TXC File's Transmodel data
+"""
+
+from common_layer.database import SqlDB
+from common_layer.database.models import (
+    NaptanStopPoint,
+    TMDayOfWeek,
+    TransmodelOperatingProfile,
+    TransmodelService,
+    TransmodelServicePattern,
+    TransmodelServicePatternLocality,
+    TransmodelServicePatternStop,
+    TransmodelServiceServicePattern,
+    TransmodelVehicleJourney,
+)
+from common_layer.database.repos import TransmodelFileCloneRepo
+from sqlalchemy import select
+
+from tests.factories.database.naptan import NaptanStopPointFactory
+from tests.factories.database.transmodel import (
+    TransmodelServiceFactory,
+    TransmodelServicePatternStopFactory,
+    TransmodelVehicleJourneyFactory,
+)
+
+LIVE_FILE_ID = 1
+NEW_FILE_ID = 2
+NEW_REVISION_ID = 20
+
+
+def add_live_file(db: SqlDB) -> None:
+    """
+    A Service with one Service Pattern and Vehicle Journey loaded from the live file
+    """
+    with db.session_scope() as session:
+        service = TransmodelServiceFactory.create(
+            revision_id=10, txcfileattributes_id=LIVE_FILE_ID
+        )
+        pattern = TransmodelServicePattern(
+            service_pattern_id="SP-TEST",
+            origin="Origin",
+            destination="Destination",
+            description=None,
+            geom=None,
+            revision_id=10,
+            line_name="1",
+        )
+        session.add_all([service, pattern])
+        session.flush()
+        journey = TransmodelVehicleJourneyFactory.create(service_pattern_id=pattern.id)
+        session.add_all(
+            [
+                TransmodelServiceServicePattern(
+                    service_id=service.id, servicepattern_id=pattern.id
+                ),
+                journey,
+            ]
+        )
+        session.flush()
+        session.add_all(
+            [
+                TransmodelServicePatternStopFactory.create(
+                    atco_code="ATCO001",
+                    naptan_stop_id=None,
+                    service_pattern_id=pattern.id,
+                    vehicle_journey_id=journey.id,
+                ),
+                TransmodelServicePatternLocality(
+                    servicepattern_id=pattern.id, locality_id="OLD"
+                ),
+                TransmodelOperatingProfile(
+                    day_of_week=TMDayOfWeek.MONDAY, vehicle_journey_id=journey.id
+                ),
+            ]
+        )
+
+
+def add_current_naptan_stop(db: SqlDB) -> int:
+    """
+    ATCO001 added to NaPTAN after the live file was loaded
+    """
+    with db.session_scope() as session:
+        stop = NaptanStopPointFactory.create(atco_code="ATCO001", locality_id="NEW")
+        session.add(stop)
+        session.flush()
+        return stop.id
+
+
+def test_clone_file(test_db: SqlDB):
+    """
+    Rows are copied to the new revision and file with new linked IDs
+    Rows from NaPTAN are derived from the current NaPTAN data
+    """
+    add_live_file(test_db)
+    naptan_stop_id = add_current_naptan_stop(test_db)
+    repo = TransmodelFileCloneRepo(test_db)
+
+    assert repo.count_service_patterns(LIVE_FILE_ID) == 1
+    assert repo.count_service_patterns(NEW_FILE_ID) == 0
+
+    counts = repo.clone_file(LIVE_FILE_ID, NEW_REVISION_ID, NEW_FILE_ID)
+
+    assert counts["transmodel_service"] == 1
+    assert counts["transmodel_servicepattern"] == 1
+    assert counts["transmodel_vehiclejourney"] == 1
+    assert counts["transmodel_servicepatternstop"] == 1
+    assert counts["transmodel_operatingprofile"] == 1
+    assert counts["transmodel_servicepattern_localities"] == 1
+    assert counts["transmodel_servicepattern_admin_areas"] == 0
+
+    with test_db.session_scope() as session:
+        service = session.execute(
+            select(TransmodelService).where(
+                TransmodelService.txcfileattributes_id == NEW_FILE_ID
+            )
+        ).scalar_one()
+        assert service.revision_id == NEW_REVISION_ID
+        pattern_id = session.execute(
+            select(TransmodelServiceServicePattern.servicepattern_id).where(
+                TransmodelServiceServicePattern.service_id == service.id
+            )
+        ).scalar_one()
+        pattern = session.get(TransmodelServicePattern, pattern_id)
+        assert pattern is not None
+        assert pattern.revision_id == NEW_REVISION_ID
+        journey = session.execute(
+            select(TransmodelVehicleJourney).where(
+                TransmodelVehicleJourney.service_pattern_id == pattern_id
+            )
+        ).scalar_one()
+        stop = session.execute(
+            select(TransmodelServicePatternStop).where(
+                TransmodelServicePatternStop.service_pattern_id == pattern_id
+            )
+        ).scalar_one()
+        assert stop.vehicle_journey_id == journey.id
+        assert stop.naptan_stop_id == naptan_stop_id
+        locality_id = session.execute(
+            select(TransmodelServicePatternLocality.locality_id).where(
+                TransmodelServicePatternLocality.servicepattern_id == pattern_id
+            )
+        ).scalar_one()
+        assert locality_id == "NEW"
+        profile = session.execute(
+            select(TransmodelOperatingProfile).where(
+                TransmodelOperatingProfile.vehicle_journey_id == journey.id
+            )
+        ).scalar_one()
+        assert profile.day_of_week == TMDayOfWeek.MONDAY
+
+    assert repo.count_service_patterns(LIVE_FILE_ID) == 1
@@ -0,0 +1,182 @@
+"""
+Test SqlDB session handling
+"""
+
+# pylint: disable=protected-access
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common_layer.database.client import (
+    DatabaseSettings,
+    PostgresSettings,
+    ProjectEnvironment,
+    SqlDB,
+)
+
+
+@pytest.fixture(name="db")
+def db_fixture() -> SqlDB:
+    """
+    SqlDB with a mocked session factory
+    """
+    db = SqlDB()
+    db._session_factory = MagicMock(side_effect=lambda: MagicMock())
+    return db
+
+
+def test_session_scope_commits_each_scope(db: SqlDB):
+    """
+    Outside a unit of work every scope gets its own committed session
+    """
+    with db.session_scope() as first:
+        pass
+    with db.session_scope() as second:
+        pass
+
+    assert first is not second
+    first.commit.assert_called_once()
+    second.commit.assert_called_once()
+    first.close.assert_called_once()
+
+
+def test_unit_of_work_shares_one_session(db: SqlDB):
+    """
+    Scopes inside a unit of work join its session and it commits once
+    """
+    with db.unit_of_work() as session:
+        with db.session_scope() as first:
+            pass
+        with db.session_scope() as second:
+            pass
+        with db.unit_of_work() as nested:
+            pass
+        session.commit.assert_not_called()
+
+    assert first is session
+    assert second is session
+    assert nested is session
+    assert session.flush.call_count == 2
+    session.commit.assert_called_once()
+    session.close.assert_called_once()
+
+    with db.session_scope() as after:
+        pass
+    assert after is not session
+
+
+def test_unit_of_work_rolls_back_on_error(db: SqlDB):
+    """
+    An error in any scope rolls back the whole unit of work
+    """
+    with pytest.raises(ValueError):
+        with db.unit_of_work() as session:
+            with db.session_scope():
+                pass
+            with db.session_scope():
+                raise ValueError("Insert failed")
+
+    session.commit.assert_not_called()
+    session.rollback.assert_called_once()
+    session.close.assert_called_once()
+
+
+def test_session_scope_records_checkout(db: SqlDB):
+    """
+    Each new session records a pool checkout
+    """
+    with db.session_scope():
+        pass
+    with db.unit_of_work():
+        with db.session_scope():
+            pass
+
+    assert db.pool_stats.checkouts == 2
+    assert db.pool_stats.max_checkout_wait_seconds >= 0
+
+
+def make_settings(project_env: ProjectEnvironment) -> DatabaseSettings:
+    """
+    Postgres settings with a small pool
+    """
+    return DatabaseSettings(
+        postgres=PostgresSettings(
+            POSTGRES_HOST="localhost",
+            POSTGRES_DB="bods",
+            POSTGRES_USER="bods",
+            POSTGRES_PORT=5432,
+            POSTGRES_PASSWORD="password",
+            PROJECT_ENV=project_env,
+            AWS_REGION="eu-west-2",
+            POSTGRES_POOL_SIZE=2,
+            POSTGRES_MAX_OVERFLOW=1,
+            POSTGRES_POOL_RECYCLE_SECONDS=600,
+            POSTGRES_POOL_PRE_PING=False,
+        )
+    )
+
+
+def test_engine_uses_pool_settings():
+    """
+    Pool configuration is passed through to the engine, which is created once
+    """
+    db = SqlDB(settings=make_settings(ProjectEnvironment.LOCAL))
+
+    with (
+        patch("common_layer.database.client.create_engine") as m_create_engine,
+        patch("common_layer.database.client.event") as m_event,
+    ):
+        assert db.engine is db.engine
+
+    m_create_engine.assert_called_once()
+    assert m_create_engine.call_args.kwargs == {
+        "pool_size": 2,
+        "max_overflow": 1,
+        "pool_timeout": 30,
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+    }
+    m_event.listen.assert_called_once_with(
+        m_create_engine.return_value,
+        "do_connect",
+        db._on_connect,
+    )
+
+
+def test_on_connect_refreshes_iam_token():
+    """
+    New connections get the cached IAM token until it nears expiry
+    """
+    db = SqlDB(settings=make_settings(ProjectEnvironment.DEVELOPMENT))
+    first_params: dict[str, str] = {}
+    second_params: dict[str, str] = {}
+    third_params: dict[str, str] = {}
+
+    with patch.object(
+        db, "_generate_rds_iam_token", side_effect=["token-1", "token-2"]
+    ) as m_generate:
+        db._on_connect(None, None, (), first_params)
+        db._on_connect(None, None, (), second_params)
+        db._token_expiration = datetime.now()
+        db._on_connect(None, None, (), third_params)
+
+    assert first_params["password"] == "token-1"
+    assert second_params["password"] == "token-1"
+    assert third_params["password"] == "token-2"
+    assert m_generate.call_count == 2
+    assert db.pool_stats.connects == 3
+    assert db.pool_stats.token_refreshes == 2
+
+
+def test_on_connect_local_keeps_password():
+    """
+    Local connections use the password from the URL
+    """
+    db = SqlDB(settings=make_settings(ProjectEnvironment.LOCAL))
+    params: dict[str, str] = {}
+
+    db._on_connect(None, None, (), params)
+
+    assert not params
+    assert db.pool_stats.token_refreshes == 0
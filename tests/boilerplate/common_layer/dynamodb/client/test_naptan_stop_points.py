@@ -6,8 +6,12 @@ from typing import Any, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 from common_layer.dynamodb.client import NaptanStopPointDynamoDBClient
-from common_layer.dynamodb.client.naptan_stop_points import NaptanDynamoDBSettings
+from common_layer.dynamodb.client.naptan_stop_points import (
+    NaptanDynamoDBSettings,
+    StopPointLRUCache,
+)
 from common_layer.xml.txc.models import TXCStopPoint
 
 
@@ -118,6 +122,223 @@ def test_get_by_atco_codes(m_boto3_client):
     )
 
 
+@pytest.mark.parametrize(
+    "cache_size,expected_hits,expected_second_keys",
+    [
+        pytest.param(100, 2, ["ATCO003"], id="Cached StopPoints not refetched"),
+        pytest.param(
+            0, 0, ["ATCO001", "ATCO002", "ATCO003"], id="Cache disabled refetches all"
+        ),
+    ],
+)
+def test_get_by_atco_codes_cache(
+    m_boto3_client,
+    cache_size: int,
+    expected_hits: int,
+    expected_second_keys: list[str],
+):
+    """
+    Only AtcoCodes missing from the in memory cache are sent to BatchGetItem
+    and the cache is shared between client instances
+    """
+    table_name = "naptan-stop-point-table"
+    m_boto3_client.return_value.batch_get_item.side_effect = lambda RequestItems: {
+        "Responses": {
+            table_name: [
+                get_stop_point_stored_document(key["AtcoCode"]["S"])
+                for key in RequestItems[table_name]["Keys"]
+            ]
+        }
+    }
+    settings = NaptanDynamoDBSettings(
+        DYNAMODB_NAPTAN_STOP_POINT_TABLE_NAME=table_name,
+        NAPTAN_STOP_POINT_CACHE_SIZE=cache_size,
+    )
+
+    NaptanStopPointDynamoDBClient(settings).get_by_atco_codes(["ATCO001", "ATCO002"])
+    client = NaptanStopPointDynamoDBClient(settings)
+    stop_points, missing_codes = client.get_by_atco_codes(
+        ["ATCO001", "ATCO002", "ATCO003"]
+    )
+
+    assert [stop.AtcoCode for stop in stop_points] == ["ATCO001", "ATCO002", "ATCO003"]
+    assert not missing_codes
+    assert client.cache_stats.hits == expected_hits
+    m_boto3_client.return_value.batch_get_item.assert_called_with(
+        RequestItems={
+            table_name: {
+                "Keys": [{"AtcoCode": {"S": code}} for code in expected_second_keys]
+            }
+        }
+    )
+
+
+def test_get_by_atco_codes_duplicates_on_cold_cache(m_boto3_client):
+    """
+    Repeated AtcoCodes are fetched once and not logged as cache hits
+    """
+    table_name = "naptan-stop-point-duplicates-table"
+    m_boto3_client.return_value.batch_get_item.return_value = {
+        "Responses": {table_name: [get_stop_point_stored_document("ATCO001")]}
+    }
+    settings = NaptanDynamoDBSettings(DYNAMODB_NAPTAN_STOP_POINT_TABLE_NAME=table_name)
+
+    with patch("common_layer.dynamodb.client.naptan_stop_points.log") as m_log:
+        stop_points, missing_codes = NaptanStopPointDynamoDBClient(
+            settings
+        ).get_by_atco_codes(["ATCO001", "ATCO001", "ATCO001"])
+
+    assert [stop.AtcoCode for stop in stop_points] == ["ATCO001"]
+    assert not missing_codes
+    completed = m_log.info.call_args_list[-1].kwargs
+    assert completed["cache_hits"] == 0
+    assert completed["cache_misses"] == 1
+
+
+@patch("common_layer.dynamodb.client.naptan_stop_points.time.sleep")
+def test_get_by_atco_codes_retries_unprocessed_and_throttled(m_sleep, m_boto3_client):
+    """
+    Throttled requests and UnprocessedKeys are retried and counted
+    """
+    table_name = "naptan-stop-point-table"
+    m_boto3_client.return_value.batch_get_item.side_effect = [
+        ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+            "BatchGetItem",
+        ),
+        {
+            "Responses": {table_name: [get_stop_point_stored_document("ATCO002")]},
+            "UnprocessedKeys": {table_name: {"Keys": [{"AtcoCode": {"S": "ATCO001"}}]}},
+        },
+        {"Responses": {table_name: [get_stop_point_stored_document("ATCO001")]}},
+    ]
+    settings = NaptanDynamoDBSettings(DYNAMODB_NAPTAN_STOP_POINT_TABLE_NAME=table_name)
+    client = NaptanStopPointDynamoDBClient(settings)
+
+    stop_points, missing_codes = client.get_by_atco_codes(["ATCO001", "ATCO002"])
+
+    assert [stop.AtcoCode for stop in stop_points] == ["ATCO001", "ATCO002"]
+    assert not missing_codes
+    assert m_sleep.call_count == 2
+    assert client.request_stats.requests == 3
+    assert client.request_stats.throttled_requests == 1
+    assert client.request_stats.retried_keys == 3
+    assert client.request_stats.unprocessed_keys == 0
+
+
+@patch("common_layer.dynamodb.client.naptan_stop_points.time.sleep")
+def test_get_by_atco_codes_retries_exhausted(m_sleep, m_boto3_client):
+    """
+    Keys still unprocessed after the max retries are reported as missing
+    """
+    table_name = "naptan-stop-point-table"
+    m_boto3_client.return_value.batch_get_item.return_value = {
+        "Responses": {table_name: []},
+        "UnprocessedKeys": {table_name: {"Keys": [{"AtcoCode": {"S": "ATCO001"}}]}},
+    }
+    settings = NaptanDynamoDBSettings(
+        DYNAMODB_NAPTAN_STOP_POINT_TABLE_NAME=table_name,
+        NAPTAN_BATCH_GET_MAX_RETRIES=2,
+    )
+    client = NaptanStopPointDynamoDBClient(settings)
+
+    stop_points, missing_codes = client.get_by_atco_codes(["ATCO001"])
+
+    assert not stop_points
+    assert missing_codes == ["ATCO001"]
+    assert m_sleep.call_count == 2
+    assert client.request_stats.requests == 3
+    assert client.request_stats.unprocessed_keys == 1
+
+
+def test_get_by_atco_codes_raises_other_client_errors(m_boto3_client):
+    """
+    Errors other than throttling are not retried
+    """
+    m_boto3_client.return_value.batch_get_item.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException"}}, "BatchGetItem"
+    )
+    client = NaptanStopPointDynamoDBClient()
+
+    with pytest.raises(ClientError):
+        client.get_by_atco_codes(["ATCO001"])
+
+    assert m_boto3_client.return_value.batch_get_item.call_count == 1
+
+
+def test_get_by_naptan_codes(m_boto3_client):
+    """
+    NaptanCodes are queried concurrently once each and results keep the input order
+    """
+
+    def query(ExpressionAttributeValues, **_kwargs):
+        naptan_code = ExpressionAttributeValues[":NaptanCode"]["S"]
+        match naptan_code:
+            case "missing":
+                return {"Items": []}
+            case "duplicated":
+                return {"Items": [{}, {}]}
+        item = get_stop_point_stored_document(f"ATCO-{naptan_code}")
+        item["NaptanCode"] = {"S": naptan_code}
+        return {"Items": [item]}
+
+    m_boto3_client.return_value.query.side_effect = query
+    settings = NaptanDynamoDBSettings(NAPTAN_BATCH_GET_MAX_WORKERS=4)
+    client = NaptanStopPointDynamoDBClient(settings)
+    naptan_codes = ["bst3", "missing", "bst1", "duplicated", "bst2", "bst1"]
+
+    stop_points, missing_codes = client.get_by_naptan_codes(naptan_codes)
+
+    assert [stop.NaptanCode for stop in stop_points] == ["bst3", "bst1", "bst2"]
+    assert missing_codes == ["missing", "duplicated"]
+    assert m_boto3_client.return_value.query.call_count == 5
+    assert client.request_stats.requests == 5
+
+
+@patch("common_layer.dynamodb.client.naptan_stop_points.time.sleep")
+def test_get_by_naptan_codes_retries_throttled(m_sleep, m_boto3_client):
+    """
+    Throttled NaptanCode queries are retried
+    """
+    item = get_stop_point_stored_document("ATCO001")
+    m_boto3_client.return_value.query.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "Query"),
+        {"Items": [item]},
+    ]
+    client = NaptanStopPointDynamoDBClient()
+
+    stop_points, missing_codes = client.get_by_naptan_codes(["bstjaja"])
+
+    assert [stop.AtcoCode for stop in stop_points] == ["ATCO001"]
+    assert not missing_codes
+    assert m_sleep.call_count == 1
+    assert client.request_stats.throttled_requests == 1
+
+
+def test_stop_point_lru_cache_eviction_and_ttl():
+    """
+    Least recently used StopPoints are evicted and expired StopPoints are dropped
+    """
+    cache = StopPointLRUCache(max_size=2, ttl_seconds=60)
+    stops = [TXCStopPoint.model_construct(AtcoCode=f"ATCO00{i}") for i in range(3)]
+    with patch(
+        "common_layer.dynamodb.client.naptan_stop_points.time.monotonic"
+    ) as m_monotonic:
+        m_monotonic.return_value = 0
+        cache.put(stops[0])
+        cache.put(stops[1])
+        assert cache.get("ATCO000") is stops[0]
+
+        cache.put(stops[2])
+        assert cache.get("ATCO001") is None
+        assert len(cache) == 2
+
+        m_monotonic.return_value = 60
+        assert cache.get("ATCO000") is None
+        assert cache.get("ATCO002") is None
+        assert len(cache) == 0
+
+
 def test_get_stop_area_map(m_boto3_client):
     """
     Test that get_stop_area_map returns the expected mapping
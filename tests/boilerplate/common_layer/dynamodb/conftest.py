@@ -6,9 +6,20 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+from common_layer.dynamodb.client.naptan_stop_points import get_stop_point_cache
 from freezegun import freeze_time
 
 
+@pytest.fixture(autouse=True)
+def clear_stop_point_cache():
+    """
+    Stop the module level StopPoint cache leaking between tests
+    """
+    get_stop_point_cache.cache_clear()
+    yield
+    get_stop_point_cache.cache_clear()
+
+
 @pytest.fixture()
 def m_boto_client():
     """
@@ -0,0 +1,275 @@
+"""
+Test NaPTAN Snapshot File and Client
+"""
+
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common_layer.naptan_snapshot import (
+    NaptanSnapshot,
+    NaptanSnapshotSettings,
+    NaptanSnapshotWriter,
+    NaptanStopPointSnapshotClient,
+)
+from common_layer.naptan_snapshot.client import SNAPSHOT_CACHE, load_snapshot
+from common_layer.xml.txc.models import TXCStopPoint
+
+
+def make_stop_point(
+    atco_code: str, naptan_code: str | None = None, stop_areas: list[str] | None = None
+) -> TXCStopPoint:
+    """
+    Minimal StopPoint
+    """
+    return TXCStopPoint.model_validate(
+        {
+            "AtcoCode": atco_code,
+            "NaptanCode": naptan_code,
+            "StopAreas": stop_areas,
+            "Descriptor": {"CommonName": f"Stop {atco_code}"},
+            "Place": {
+                "NptgLocalityRef": "N0077020",
+                "Location": {"Longitude": "-2.58262", "Latitude": "51.44898"},
+            },
+            "StopClassification": {"StopType": "busCoachTrolleyStationBay"},
+            "AdministrativeAreaRef": "009",
+        }
+    )
+
+
+STOP_POINTS = [
+    make_stop_point("0100BRP90312", "bstgaja", ["010G0005"]),
+    make_stop_point("0100BRP90310", "bstjaja"),
+    make_stop_point("490000001A", "shared"),
+    make_stop_point("0100BRP90311"),
+    make_stop_point("490000001B", "shared"),
+]
+
+
+@pytest.fixture(name="snapshot_path")
+def snapshot_path_fixture(tmp_path: Path) -> Path:
+    """
+    Snapshot written from unsorted StopPoints
+    """
+    path = tmp_path / "stop_points.snapshot"
+    with NaptanSnapshotWriter(path) as writer:
+        for stop_point in STOP_POINTS:
+            writer.add(stop_point)
+    return path
+
+
+@pytest.mark.parametrize(
+    "atco_code,expected",
+    [
+        pytest.param("0100BRP90310", STOP_POINTS[1], id="Found"),
+        pytest.param("0100BRP90312", STOP_POINTS[0], id="Found with StopAreas"),
+        pytest.param("490000001B", STOP_POINTS[4], id="Last key"),
+        pytest.param("0100BRP9031", None, id="Prefix of a key"),
+        pytest.param("9999", None, id="Missing"),
+        pytest.param("0100BRP903100000000", None, id="Longer than key width"),
+    ],
+)
+def test_snapshot_get_by_atco_code(
+    snapshot_path: Path, atco_code: str, expected: TXCStopPoint | None
+):
+    """
+    AtcoCode lookups binary search the sorted index
+    """
+    with NaptanSnapshot(snapshot_path) as snapshot:
+        assert snapshot.get_by_atco_code(atco_code) == expected
+        assert len(snapshot.atco_index) == len(STOP_POINTS)
+
+
+@pytest.mark.parametrize(
+    "naptan_code,expected",
+    [
+        pytest.param("bstjaja", STOP_POINTS[1], id="Found"),
+        pytest.param("shared", None, id="Shared NaptanCode is not resolved"),
+        pytest.param("missing", None, id="Missing"),
+    ],
+)
+def test_snapshot_get_by_naptan_code(
+    snapshot_path: Path, naptan_code: str, expected: TXCStopPoint | None
+):
+    """
+    NaptanCode lookups only resolve unique NaptanCodes
+    """
+    with NaptanSnapshot(snapshot_path) as snapshot:
+        assert snapshot.get_by_naptan_code(naptan_code) == expected
+
+
+def test_snapshot_rejects_other_files(tmp_path: Path):
+    """
+    Files without the snapshot header are rejected
+    """
+    path = tmp_path / "not_a_snapshot"
+    path.write_bytes(b"0" * 128)
+
+    with pytest.raises(ValueError):
+        NaptanSnapshot(path)
+
+
+def test_snapshot_client(snapshot_path: Path):
+    """
+    The snapshot client matches the DynamoDB client interface
+    """
+    with NaptanSnapshot(snapshot_path) as snapshot:
+        client = NaptanStopPointSnapshotClient(snapshot=snapshot)
+
+        stop_points, missing = client.get_by_atco_codes(
+            ["0100BRP90312", "missing", "0100BRP90310", "0100BRP90312"]
+        )
+        assert stop_points == [STOP_POINTS[0], STOP_POINTS[1]]
+        assert missing == ["missing"]
+
+        stop_points, missing = client.get_by_naptan_codes(["shared", "bstgaja"])
+        assert stop_points == [STOP_POINTS[0]]
+        assert missing == ["shared"]
+
+        assert client.get_stop_area_map(["0100BRP90312", "0100BRP90310"]) == {
+            "0100BRP90312": ["010G0005"],
+            "0100BRP90310": [],
+        }
+
+
+def test_snapshot_writer_removes_records_on_error(tmp_path: Path):
+    """
+    The temporary records file is removed if writing fails
+    """
+    path = tmp_path / "stop_points.snapshot"
+    with pytest.raises(RuntimeError):
+        with NaptanSnapshotWriter(path) as writer:
+            writer.add(STOP_POINTS[0])
+            raise RuntimeError("Parsing failed")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_writer_closed_before_exit(tmp_path: Path):
+    """
+    Closing inside the block writes the snapshot once
+    """
+    path = tmp_path / "stop_points.snapshot"
+    with NaptanSnapshotWriter(path) as writer:
+        writer.add(STOP_POINTS[0])
+        assert writer.close() == 1
+
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.fixture(name="snapshot_settings")
+def snapshot_settings_fixture(tmp_path: Path) -> Iterator[NaptanSnapshotSettings]:
+    """
+    Snapshot settings downloading to an empty directory
+    """
+    settings = NaptanSnapshotSettings(
+        NAPTAN_SNAPSHOT_BUCKET="naptan-bucket",
+        NAPTAN_SNAPSHOT_KEY="naptan/stop_points.snapshot",
+        NAPTAN_SNAPSHOT_DIR=tmp_path / "download",
+        NAPTAN_SNAPSHOT_TTL_SECONDS=60,
+    )
+    settings.NAPTAN_SNAPSHOT_DIR.mkdir()
+    SNAPSHOT_CACHE.clear()
+    yield settings
+    SNAPSHOT_CACHE.clear()
+
+
+def create_s3_mock(snapshot_path: Path, etag: str) -> MagicMock:
+    """
+    S3 holding the snapshot at an ETag
+    """
+
+    def download_file(_key: str, local_path: Path) -> Path:
+        local_path.write_bytes(snapshot_path.read_bytes())
+        return local_path
+
+    m_s3 = MagicMock()
+    m_s3.return_value.get_etag.return_value = etag
+    m_s3.return_value.download_file.side_effect = download_file
+    return m_s3
+
+
+def test_load_snapshot_downloads_once(
+    snapshot_settings: NaptanSnapshotSettings, snapshot_path: Path
+):
+    """
+    The snapshot is downloaded once and reused until the TTL expires
+    """
+    m_s3 = create_s3_mock(snapshot_path, '"v1"')
+    with patch("common_layer.naptan_snapshot.client.S3", m_s3):
+        first = NaptanStopPointSnapshotClient(snapshot_settings)
+        second = NaptanStopPointSnapshotClient(snapshot_settings)
+
+    assert first.get_by_atco_code("0100BRP90311") == STOP_POINTS[3]
+    assert second.get_by_atco_code("0100BRP90311") == STOP_POINTS[3]
+    m_s3.assert_called_once_with("naptan-bucket")
+    m_s3.return_value.download_file.assert_called_once()
+    assert load_snapshot(snapshot_settings) is load_snapshot(snapshot_settings)
+
+
+@pytest.mark.parametrize(
+    "new_etag, expected_downloads",
+    [
+        pytest.param('"v1"', 1, id="Unchanged snapshot is kept"),
+        pytest.param('"v2"', 2, id="Changed snapshot is downloaded"),
+    ],
+)
+def test_load_snapshot_after_ttl(
+    snapshot_settings: NaptanSnapshotSettings,
+    snapshot_path: Path,
+    new_etag: str,
+    expected_downloads: int,
+):
+    """
+    Once the TTL expires the ETag is checked and a changed snapshot downloaded
+    """
+    m_s3 = create_s3_mock(snapshot_path, '"v1"')
+    with (
+        patch("common_layer.naptan_snapshot.client.S3", m_s3),
+        patch("common_layer.naptan_snapshot.client.time.monotonic") as m_monotonic,
+    ):
+        m_monotonic.return_value = 1000.0
+        first = load_snapshot(snapshot_settings)
+        m_s3.return_value.get_etag.return_value = new_etag
+        m_monotonic.return_value = 1030.0
+        assert load_snapshot(snapshot_settings) is first
+        m_monotonic.return_value = 1061.0
+        refreshed = load_snapshot(snapshot_settings)
+
+    assert (refreshed is first) == (expected_downloads == 1)
+    assert m_s3.return_value.get_etag.call_count == 2
+    assert m_s3.return_value.download_file.call_count == expected_downloads
+    etag_path = snapshot_settings.NAPTAN_SNAPSHOT_DIR / "stop_points.etag"
+    assert etag_path.read_text(encoding="utf-8") == new_etag
+
+
+@pytest.mark.parametrize(
+    "stored_etag, expected_downloads",
+    [
+        pytest.param('"v1"', 0, id="Matching download is reused"),
+        pytest.param('"v0"', 1, id="Stale download is replaced"),
+        pytest.param(None, 1, id="Download without an ETag is replaced"),
+    ],
+)
+def test_load_snapshot_left_by_earlier_process(
+    snapshot_settings: NaptanSnapshotSettings,
+    snapshot_path: Path,
+    stored_etag: str | None,
+    expected_downloads: int,
+):
+    """
+    A snapshot already in the directory is only reused if its ETag matches
+    """
+    local_path = snapshot_settings.NAPTAN_SNAPSHOT_DIR / "stop_points.snapshot"
+    local_path.write_bytes(snapshot_path.read_bytes())
+    if stored_etag:
+        local_path.with_suffix(".etag").write_text(stored_etag, encoding="utf-8")
+
+    m_s3 = create_s3_mock(snapshot_path, '"v1"')
+    with patch("common_layer.naptan_snapshot.client.S3", m_s3):
+        snapshot = load_snapshot(snapshot_settings)
+
+    assert snapshot.get_by_atco_code("0100BRP90311") == STOP_POINTS[3]
+    assert m_s3.return_value.download_file.call_count == expected_downloads
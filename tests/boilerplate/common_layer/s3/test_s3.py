@@ -306,3 +306,65 @@ def test_get_object(s3_client, mock_file_content, test_file_path):
     mock_client.get_object.assert_called_once_with(
         Bucket=bucket_name, Key=test_file_path
     )
+
+
+def test_get_optional_object(s3_client, mock_file_content, test_file_path):
+    """Test getting object bytes from S3"""
+    s3, _, mock_client = s3_client
+    mock_client.get_object.return_value = {"Body": BytesIO(mock_file_content)}
+
+    assert s3.get_optional_object(test_file_path) == mock_file_content
+
+
+@pytest.mark.parametrize(
+    "error_code, raises",
+    [
+        pytest.param("NoSuchKey", False, id="Missing key returns None"),
+        pytest.param("AccessDenied", True, id="Other errors are raised"),
+    ],
+)
+def test_get_optional_object_errors(s3_client, test_file_path, error_code, raises):
+    """Test a missing object returns None"""
+    s3, _, mock_client = s3_client
+    mock_client.get_object.side_effect = ClientError(
+        {"Error": {"Code": error_code, "Message": "Error"}}, "GetObject"
+    )
+
+    if raises:
+        with pytest.raises(ClientError):
+            s3.get_optional_object(test_file_path)
+    else:
+        assert s3.get_optional_object(test_file_path) is None
+
+
+def test_upload_stream(s3_client, test_file_path):
+    """Test streaming a file-like object to S3 with tags"""
+    s3, bucket_name, mock_client = s3_client
+    stream = BytesIO(b"<xml/>")
+
+    s3.upload_stream(stream, test_file_path, tags={"Lifecycle": "temporary"})
+
+    kwargs = mock_client.upload_fileobj.call_args.kwargs
+    assert kwargs["Fileobj"] is stream
+    assert kwargs["Bucket"] == bucket_name
+    assert kwargs["Key"] == test_file_path
+    assert kwargs["ExtraArgs"] == {
+        "ContentType": "text/plain",
+        "Tagging": "Lifecycle=temporary",
+    }
+    assert kwargs["Config"].use_threads is False
+
+
+def test_delete_prefix(s3_client):
+    """Test deleting every object under a prefix"""
+    s3, bucket_name, mock_client = s3_client
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "ext/a.xml"}, {"Key": "ext/b.xml"}]},
+        {},
+    ]
+
+    assert s3.delete_prefix("ext/") == 2
+    mock_client.delete_objects.assert_called_once_with(
+        Bucket=bucket_name,
+        Delete={"Objects": [{"Key": "ext/a.xml"}, {"Key": "ext/b.xml"}], "Quiet": True},
+    )
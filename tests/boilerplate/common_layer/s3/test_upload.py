@@ -0,0 +1,126 @@
+"""
+Zip Extract and Upload Tests
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from threading import Lock
+from typing import IO
+from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+from common_layer.s3 import S3, process_zip_to_s3_async
+from common_layer.s3.upload import ZipMemberReader
+
+ZIP_CONTENTS = {
+    "a.xml": b"<a/>" * 1000,
+    "folder/b.xml": b"<b/>" * 50_000,
+    "readme.txt": b"not uploaded",
+    "c.xml": b"",
+}
+
+
+@pytest.fixture(name="zip_path")
+def fixture_zip_path(tmp_path: Path) -> Path:
+    """
+    Compressed zip with XML and non XML files
+    """
+    zip_path = tmp_path / "dataset.zip"
+    with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zip_obj:
+        for name, data in ZIP_CONTENTS.items():
+            zip_obj.writestr(name, data)
+    return zip_path
+
+
+def test_process_zip_to_s3_async(zip_path: Path, tmp_path: Path):
+    """
+    XML members are streamed to S3 without being written to disk
+    """
+    uploaded: dict[str, bytes] = {}
+    upload_lock = Lock()
+
+    def upload_stream(stream: IO[bytes], file_path: str, tags=None):
+        with upload_lock:
+            uploaded[file_path] = stream.read()
+
+    with patch("common_layer.s3.client.boto3.client"):
+        s3_client = S3("test-bucket", max_workers=4)
+
+    with (
+        patch.object(s3_client, "upload_stream", side_effect=upload_stream),
+        patch("tempfile.TemporaryDirectory") as temp_dir,
+    ):
+        prefix, stats = asyncio.run(
+            process_zip_to_s3_async(s3_client, zip_path, "extracted/")
+        )
+
+    temp_dir.assert_not_called()
+    assert prefix == "extracted/"
+    assert (stats.success_count, stats.fail_count, stats.skip_count) == (3, 0, 1)
+    assert uploaded == {
+        f"extracted/{name}": data
+        for name, data in ZIP_CONTENTS.items()
+        if name.endswith(".xml")
+    }
+    assert list(tmp_path.iterdir()) == [zip_path]
+
+
+def test_process_zip_to_s3_async_upload_failure(zip_path: Path):
+    """
+    A failed upload is counted without stopping the other files
+    """
+
+    def upload_stream(stream: IO[bytes], file_path: str, tags=None):
+        if file_path.endswith("a.xml"):
+            raise OSError("Upload failed")
+
+    with patch("common_layer.s3.client.boto3.client"):
+        s3_client = S3("test-bucket", max_workers=2)
+
+    with patch.object(s3_client, "upload_stream", side_effect=upload_stream):
+        _, stats = asyncio.run(
+            process_zip_to_s3_async(s3_client, zip_path, "extracted/")
+        )
+
+    assert (stats.success_count, stats.fail_count) == (2, 1)
+
+
+def test_zip_member_reader(zip_path: Path):
+    """
+    Each thread reads members through its own ZipFile handle
+    """
+    with ZipMemberReader(zip_path) as reader:
+        with reader.open("a.xml") as source:
+            assert source.read() == ZIP_CONTENTS["a.xml"]
+        with reader.open("folder/b.xml") as source:
+            assert source.read() == ZIP_CONTENTS["folder/b.xml"]
+        assert len(reader._zip_objs) == 1  # pylint: disable=protected-access
+
+        thread_result = asyncio.run(
+            asyncio.to_thread(lambda: reader.open("c.xml").read())
+        )
+        assert thread_result == b""
+        assert len(reader._zip_objs) == 2  # pylint: disable=protected-access
+
+
+def test_process_zip_to_s3_async_cancelled(zip_path: Path):
+    """
+    No files are uploaded once extraction is cancelled
+    """
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with patch("common_layer.s3.client.boto3.client"):
+        s3_client = S3("test-bucket", max_workers=2)
+
+    with patch.object(s3_client, "upload_stream") as upload_stream:
+        _, stats = asyncio.run(
+            process_zip_to_s3_async(
+                s3_client, zip_path, "extracted/", cancel_event=cancel_event
+            )
+        )
+
+    upload_stream.assert_not_called()
+    assert (stats.success_count, stats.fail_count) == (0, 3)
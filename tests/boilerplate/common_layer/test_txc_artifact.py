@@ -0,0 +1,149 @@
+"""
+Test the parsed TXC artifact cache
+"""
+
+import gzip
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from common_layer.txc_artifact import (
+    ARTIFACT_PARSER_CONFIG,
+    deserialize_artifact,
+    get_artifact_key,
+    get_txc_data_from_artifact,
+    parse_txc_bytes,
+    serialize_artifact,
+)
+from common_layer.xml.txc.parser.parser_txc import TXCParserConfig
+
+SAMPLE_FILE = Path(__file__).parent / "data" / "sample.xml"
+FILE_HASH = "abc123"
+
+
+@pytest.fixture(name="file_data")
+def fixture_file_data() -> BytesIO:
+    """
+    Sample TXC file bytes
+    """
+    return BytesIO(SAMPLE_FILE.read_bytes())
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(TXCParserConfig.parse_stops_only(), id="Stops Only"),
+        pytest.param(
+            TXCParserConfig(
+                services=True,
+                metadata=True,
+                operators=True,
+                file_hash=True,
+                serviced_organisations=False,
+                stop_points=False,
+                route_sections=False,
+                routes=False,
+                journey_pattern_sections=False,
+                vehicle_journeys=False,
+            ),
+            id="File Attributes",
+        ),
+        pytest.param(TXCParserConfig(), id="Default Without Tracks"),
+        pytest.param(TXCParserConfig.parse_all(), id="All Sections"),
+    ],
+)
+def test_artifact_matches_parse(file_data: BytesIO, config: TXCParserConfig):
+    """
+    A stage gets the same TXCData from the artifact as from parsing the file
+    """
+    full_txc_data = parse_txc_bytes(file_data, FILE_HASH, ARTIFACT_PARSER_CONFIG)
+    artifact = serialize_artifact(full_txc_data, ARTIFACT_PARSER_CONFIG)
+
+    assert deserialize_artifact(artifact, config) == parse_txc_bytes(
+        file_data, FILE_HASH, config
+    )
+
+
+def test_artifact_missing_section(file_data: BytesIO):
+    """
+    An artifact without a requested section is not used
+    """
+    stops_config = TXCParserConfig.parse_stops_only()
+    artifact = serialize_artifact(
+        parse_txc_bytes(file_data, FILE_HASH, stops_config), stops_config
+    )
+
+    assert deserialize_artifact(artifact, TXCParserConfig()) is None
+
+
+def test_get_txc_data_from_artifact_miss(file_data: BytesIO):
+    """
+    Without an artifact the file is parsed and the artifact saved
+    """
+    s3_client = MagicMock()
+    s3_client.get_optional_object.return_value = None
+    config = TXCParserConfig.parse_stops_only()
+
+    result = get_txc_data_from_artifact(
+        s3_client, "ext/sample.xml", file_data, FILE_HASH, config
+    )
+
+    assert result == parse_txc_bytes(file_data, FILE_HASH, config)
+    assert file_data.tell() == 0
+    artifact_key, artifact = s3_client.put_object.call_args.args
+    assert artifact_key == get_artifact_key("ext/sample.xml", FILE_HASH)
+    assert deserialize_artifact(artifact, TXCParserConfig.parse_all()) is not None
+
+
+def test_get_txc_data_from_artifact_hit(file_data: BytesIO):
+    """
+    An existing artifact is used without parsing the file
+    """
+    full_txc_data = parse_txc_bytes(file_data, FILE_HASH, ARTIFACT_PARSER_CONFIG)
+    s3_client = MagicMock()
+    s3_client.get_optional_object.return_value = serialize_artifact(
+        full_txc_data, ARTIFACT_PARSER_CONFIG
+    )
+
+    result = get_txc_data_from_artifact(
+        s3_client, "ext/sample.xml", BytesIO(b"not xml"), FILE_HASH
+    )
+
+    assert result.Services == full_txc_data.Services
+    s3_client.get_optional_object.assert_called_once_with(
+        "txc-artifacts/ext/sample.xml.abc123.json.gz"
+    )
+    s3_client.put_object.assert_not_called()
+
+
+def test_get_txc_data_from_artifact_unreadable(file_data: BytesIO):
+    """
+    An unreadable artifact falls back to parsing and is replaced
+    """
+    s3_client = MagicMock()
+    s3_client.get_optional_object.return_value = b"not gzip"
+
+    result = get_txc_data_from_artifact(
+        s3_client, "ext/sample.xml", file_data, FILE_HASH
+    )
+
+    assert result == parse_txc_bytes(file_data, FILE_HASH, TXCParserConfig())
+    s3_client.put_object.assert_called_once()
+
+
+def test_get_txc_data_from_artifact_stale_model(file_data: BytesIO):
+    """
+    An artifact that no longer validates against the models is replaced
+    """
+    s3_client = MagicMock()
+    s3_client.get_optional_object.return_value = gzip.compress(
+        b'{"version": 2, "sections": {}, "txc_data": {"Services": "changed"}}'
+    )
+
+    result = get_txc_data_from_artifact(
+        s3_client, "ext/sample.xml", file_data, FILE_HASH
+    )
+
+    assert result == parse_txc_bytes(file_data, FILE_HASH, TXCParserConfig())
+    s3_client.put_object.assert_called_once()
@@ -0,0 +1,192 @@
+"""
+Tests for the single read hash, scan and extract pipeline
+"""
+
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common_layer.exceptions import ClamConnectionError, SuspiciousFile
+from common_layer.s3 import ProcessingStats
+from common_layer.xml.utils import get_file_hash
+
+from common_lambdas.clamav_scanner.app.models import (
+    ClamAVConfig,
+    ClamAVScannerInputData,
+)
+from common_lambdas.clamav_scanner.app.scan_pipeline import (
+    hash_and_scan_file,
+    scan_verify_and_extract,
+)
+
+MODULE = "common_lambdas.clamav_scanner.app.scan_pipeline"
+CLAMAV_CONFIG = ClamAVConfig(host="localhost", port=3310)
+
+
+@pytest.fixture(name="zip_path")
+def fixture_zip_path(tmp_path: Path) -> Path:
+    """
+    Zip larger than the ClamAV chunk size
+    """
+    zip_path = tmp_path / "dataset.zip"
+    with zipfile.ZipFile(zip_path, "w") as zip_obj:
+        zip_obj.writestr("data.xml", b"<XML></XML>" * 10_000)
+    return zip_path
+
+
+@pytest.fixture(name="input_data")
+def fixture_input_data() -> ClamAVScannerInputData:
+    """
+    Lambda input for a dataset revision
+    """
+    return ClamAVScannerInputData(
+        Bucket="bucket",
+        ObjectKey="dataset.zip",
+        DatasetRevisionId=1,
+        DatasetEtlTaskResultId=2,
+    )
+
+
+def create_clamav_mock(scan_result: tuple[str, str | None]) -> MagicMock:
+    """
+    ClamAV socket that reads the whole stream like clamd's instream
+    """
+    mock_clamav = MagicMock()
+
+    def instream(buff):
+        while buff.read(1024):
+            pass
+        return {"stream": scan_result}
+
+    mock_clamav.instream.side_effect = instream
+    return mock_clamav
+
+
+def test_hash_and_scan_file(zip_path: Path):
+    """
+    The scan read produces the same hash as hashing the file separately
+    """
+    scan_failed = threading.Event()
+    with patch(
+        "common_lambdas.clamav_scanner.app.av_scan.ClamdNetworkSocket",
+        return_value=create_clamav_mock(("OK", None)),
+    ):
+        outcome = hash_and_scan_file(CLAMAV_CONFIG, zip_path, False, scan_failed)
+
+    assert outcome.file_hash == get_file_hash(zip_path)
+    assert outcome.error is None
+    assert not scan_failed.is_set()
+
+
+def test_hash_and_scan_file_threat_found(zip_path: Path):
+    """
+    A failed scan is returned and signalled but the hash is still complete
+    """
+    scan_failed = threading.Event()
+    mock_clamav = MagicMock()
+    mock_clamav.instream.return_value = {"stream": ("FOUND", "Eicar-Test-Signature")}
+    with patch(
+        "common_lambdas.clamav_scanner.app.av_scan.ClamdNetworkSocket",
+        return_value=mock_clamav,
+    ):
+        outcome = hash_and_scan_file(CLAMAV_CONFIG, zip_path, False, scan_failed)
+
+    assert outcome.file_hash == get_file_hash(zip_path)
+    assert isinstance(outcome.error, SuspiciousFile)
+    assert scan_failed.is_set()
+
+
+@pytest.mark.parametrize(
+    "skip_virus_scan, scan_result, expected_error",
+    [
+        pytest.param(False, ("OK", None), None, id="Clean file is extracted"),
+        pytest.param(True, ("FOUND", "Virus"), None, id="Skipped scan"),
+        pytest.param(
+            False, ("FOUND", "Virus"), SuspiciousFile, id="Extraction is removed"
+        ),
+    ],
+)
+def test_scan_verify_and_extract(
+    zip_path: Path,
+    input_data: ClamAVScannerInputData,
+    skip_virus_scan: bool,
+    scan_result: tuple[str, str | None],
+    expected_error: type[Exception] | None,
+):
+    """
+    Extraction runs alongside the scan and is removed if the scan fails
+    """
+    input_data.skip_virus_scan = skip_virus_scan
+    s3_handler = MagicMock()
+    extract_result = ("extracted/", ProcessingStats(success_count=1))
+    with (
+        patch(
+            "common_lambdas.clamav_scanner.app.av_scan.ClamdNetworkSocket",
+            return_value=create_clamav_mock(scan_result),
+        ),
+        patch(f"{MODULE}.verify_and_extract", return_value=extract_result) as extract,
+        patch(f"{MODULE}.update_file_hash") as update_file_hash,
+    ):
+        if expected_error:
+            with pytest.raises(expected_error):
+                scan_verify_and_extract(
+                    s3_handler,
+                    MagicMock(),
+                    input_data,
+                    CLAMAV_CONFIG,
+                    zip_path,
+                    "dataset.zip",
+                    "request",
+                )
+            s3_handler.delete_prefix.assert_called_once()
+        else:
+            assert (
+                scan_verify_and_extract(
+                    s3_handler,
+                    MagicMock(),
+                    input_data,
+                    CLAMAV_CONFIG,
+                    zip_path,
+                    "dataset.zip",
+                    "request",
+                )
+                == extract_result
+            )
+            s3_handler.delete_prefix.assert_not_called()
+
+    assert update_file_hash.call_args.args[2] == get_file_hash(zip_path)
+    assert isinstance(extract.call_args.args[4], threading.Event)
+
+
+def test_scan_verify_and_extract_unreadable_file(
+    zip_path: Path, input_data: ClamAVScannerInputData
+):
+    """
+    Extracted files are removed when the file can't be read to scan it
+    """
+    s3_handler = MagicMock()
+    extract_result = ("extracted/", ProcessingStats(success_count=1))
+    with (
+        patch(f"{MODULE}.av_scan_stream"),
+        patch(
+            f"{MODULE}.HashingReader.read_remaining",
+            side_effect=OSError("Read failed"),
+        ),
+        patch(f"{MODULE}.verify_and_extract", return_value=extract_result),
+        patch(f"{MODULE}.update_file_hash") as update_file_hash,
+        pytest.raises(ClamConnectionError),
+    ):
+        scan_verify_and_extract(
+            s3_handler,
+            MagicMock(),
+            input_data,
+            CLAMAV_CONFIG,
+            zip_path,
+            "dataset.zip",
+            "request",
+        )
+
+    s3_handler.delete_prefix.assert_called_once()
+    update_file_hash.assert_not_called()
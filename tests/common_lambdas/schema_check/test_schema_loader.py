@@ -11,11 +11,26 @@ from common_layer.exceptions import SchemaUnknown
 from lxml.etree import _ElementTree  # type: ignore
 
 from common_lambdas.schema_check.app.constants import XMLSchemaType
-from common_lambdas.schema_check.app.schema_loader import load_schema
+from common_lambdas.schema_check.app.schema_loader import (
+    SCHEMA_CACHE,
+    SchemaLoadStats,
+    XMLSchemaCache,
+    load_schema,
+)
 
 MODULE_PATH = Path(inspect.getfile(load_schema)).parent
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    """
+    Compiled schemas are cached at module level so clear them between tests
+    """
+    SCHEMA_CACHE.clear()
+    yield
+    SCHEMA_CACHE.clear()
+
+
 @pytest.fixture
 def m_valid_schema_file():
     """
@@ -102,3 +117,38 @@ def test_load_schema_missing_file():
     ):
         with pytest.raises(FileNotFoundError, match="Schema file not found at:"):
             load_schema(schema_type, version)
+
+
+def test_load_schema_cached(setup_mocks):
+    """
+    Test that the schema is compiled once and reused by later loads
+    """
+    m_open, m_xml_schema = setup_mocks
+    cold_stats = SchemaLoadStats()
+    warm_stats = SchemaLoadStats()
+
+    first = load_schema(XMLSchemaType.TRANSXCHANGE, "2.4", cold_stats)
+    second = load_schema(XMLSchemaType.TRANSXCHANGE, "2.4", warm_stats)
+
+    assert first is second
+    m_open.assert_called_once()
+    m_xml_schema.assert_called_once()
+    assert not cold_stats.cache_hit
+    assert warm_stats.cache_hit
+    assert warm_stats.compile_seconds == 0.0
+
+
+def test_schema_cache_prewarm(setup_mocks):
+    """
+    Test that pre-warming compiles every schema in SCHEMA_SPECS
+    """
+    m_open, _ = setup_mocks
+    cache = XMLSchemaCache()
+
+    cache.prewarm()
+
+    assert len(cache) == 2
+    assert m_open.call_count == 2
+    stats = SchemaLoadStats()
+    cache.get(XMLSchemaType.NETEX, "1.1", stats)
+    assert stats.cache_hit
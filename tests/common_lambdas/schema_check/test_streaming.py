@@ -0,0 +1,251 @@
+"""
+Tests for streaming schema validation
+"""
+
+from io import BytesIO
+
+import pytest
+from common_layer.exceptions import XMLSyntaxError as ETLXMLSyntaxError
+from lxml import etree
+
+from common_lambdas.schema_check.app.schema_check import get_schema_violations
+from common_lambdas.schema_check.app.streaming import (
+    iter_chunks,
+    iter_lines,
+    read_xml_root,
+    stream_schema_violations,
+)
+
+REVISION_ID: int = 123
+
+PEOPLE_SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="people">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="person" maxOccurs="unbounded">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="name" type="xs:string"/>
+                            <xs:element name="age" type="xs:integer"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>"""
+
+
+FRIENDS_SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="people">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="person" maxOccurs="unbounded">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="name" type="xs:string"/>
+                            <xs:element name="friend" type="xs:string"
+                                minOccurs="0" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+        <xs:key name="personKey">
+            <xs:selector xpath="person"/>
+            <xs:field xpath="name"/>
+        </xs:key>
+        <xs:keyref name="friendKeyRef" refer="personKey">
+            <xs:selector xpath="person/friend"/>
+            <xs:field xpath="."/>
+        </xs:keyref>
+    </xs:element>
+</xs:schema>"""
+
+
+@pytest.fixture(name="schema")
+def schema_fixture() -> etree.XMLSchema:
+    """Fixture to provide parsed XML schema"""
+    return etree.XMLSchema(etree.fromstring(PEOPLE_SCHEMA.encode()))
+
+
+def split_chunks(xml: bytes, size: int) -> list[bytes]:
+    """
+    Split the XML into chunks that don't line up with the lines
+    """
+    return [xml[i : i + size] for i in range(0, len(xml), size)]
+
+
+@pytest.mark.parametrize(
+    "test_xml,expected_violations",
+    [
+        pytest.param(
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<people>
+    <person><name>John Doe</name><age>25</age></person>
+    <person><name>Jane Doe</name><age>27</age></person>
+</people>""",
+            [],
+            id="Valid XML",
+        ),
+        pytest.param(
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<people>
+    <person><name>John Doe</name><age>old</age></person>
+    <person><name>Jane Doe</name><age>27</age></person>
+    <person><age>27</age></person>
+</people>""",
+            [
+                (
+                    3,
+                    "Element 'age': 'old' is not a valid value of the atomic type "
+                    "'xs:integer'.",
+                ),
+                (
+                    5,
+                    "Element 'age': This element is not expected. Expected is ( name ).",
+                ),
+            ],
+            id="Violations Keep Their Line",
+        ),
+        pytest.param(
+            b'<?xml version="1.0" encoding="UTF-8"?>\r\n<people>\r\n'
+            b"<person><name>John Doe</name></person>\r\n</people>",
+            [
+                (
+                    3,
+                    "Element 'person': Missing child element(s). Expected is ( age ).",
+                ),
+            ],
+            id="Windows Line Endings",
+        ),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_stream_schema_violations(
+    schema: etree.XMLSchema,
+    test_xml: bytes,
+    expected_violations: list[tuple[int, str]],
+    chunk_size: int,
+):
+    """
+    Test streaming validation finds the same violations as validating the tree
+    """
+    violations = stream_schema_violations(
+        schema, split_chunks(test_xml, chunk_size), REVISION_ID, "filename.xml"
+    )
+    tree_violations = get_schema_violations(
+        schema, etree.fromstring(test_xml), REVISION_ID, "filename.xml"
+    )
+
+    assert [(v.line, v.details) for v in violations] == expected_violations
+    assert [v.details for v in violations] == [v.details for v in tree_violations]
+    assert all(v.revision_id == REVISION_ID for v in violations)
+
+
+@pytest.mark.parametrize(
+    "test_xml",
+    [
+        pytest.param(
+            b"<people><person><name>John</nam><age>1</age></person></people>",
+            id="Mismatched Tag",
+        ),
+        pytest.param(
+            b"<people><person><name>John</name><age>1</age></person>",
+            id="Truncated",
+        ),
+        pytest.param(
+            b"<people><person><name>John</name><age>old</age></person>",
+            id="Truncated With Violations",
+        ),
+        pytest.param(
+            b"<people><person><name>John</name><age>1</age></person></people><x/>",
+            id="Extra Content",
+        ),
+    ],
+)
+def test_stream_schema_violations_malformed(schema: etree.XMLSchema, test_xml: bytes):
+    """
+    Test malformed XML raises a syntax error rather than returning violations
+    """
+    with pytest.raises(ETLXMLSyntaxError):
+        stream_schema_violations(schema, [test_xml], REVISION_ID, "filename.xml")
+
+
+def test_read_xml_root():
+    """
+    Test the root is found and the chunks read are returned to be replayed
+    """
+    xml = b'<?xml version="1.0"?>\n<TransXChange SchemaVersion="2.4">' + (
+        b"<a/>" * 50_000
+    )
+    stream = BytesIO(xml + b"</TransXChange>")
+
+    xml_root, head_chunks = read_xml_root(stream)
+
+    assert xml_root.tag == "TransXChange"
+    assert xml_root.get("SchemaVersion") == "2.4"
+    assert len(head_chunks) == 1
+    assert b"".join([*head_chunks, *iter_chunks(stream)]) == stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "test_xml",
+    [
+        pytest.param(b"", id="Empty"),
+        pytest.param(b'<?xml version="1.0"?>\n', id="No Root"),
+        pytest.param(b"not xml", id="Not XML"),
+    ],
+)
+def test_read_xml_root_invalid(test_xml: bytes):
+    """
+    Test a file without a root element raises a syntax error
+    """
+    with pytest.raises(ETLXMLSyntaxError):
+        read_xml_root(BytesIO(test_xml))
+
+
+def test_iter_lines():
+    """
+    Test pieces are numbered by line across chunk boundaries
+    """
+    chunks = [b"<a>\r", b"\n<b/>", b"\n</a>"]
+
+    assert list(iter_lines(chunks)) == [
+        (1, b"<a>\r"),
+        (1, b"\n"),
+        (2, b"<b/>"),
+        (2, b"\n"),
+        (3, b"</a>"),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_stream_schema_violations_line_offsets(chunk_size: int):
+    """
+    Test the lines streaming reports where they differ from the tree
+    Content errors are on the closing tag and keyref errors on the root's
+    """
+    schema = etree.XMLSchema(etree.fromstring(FRIENDS_SCHEMA.encode()))
+    test_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<people>
+    <person>
+        <name>John Doe</name>
+        <friend>Jane Doe</friend>
+    </person>
+    <person>
+    </person>
+</people>"""
+
+    violations = stream_schema_violations(
+        schema, split_chunks(test_xml, chunk_size), REVISION_ID, "filename.xml"
+    )
+    tree_violations = get_schema_violations(
+        schema, etree.fromstring(test_xml), REVISION_ID, "filename.xml"
+    )
+
+    assert [v.details for v in violations] == [v.details for v in tree_violations]
+    assert [v.line for v in tree_violations] == [7, 7, 5]
+    assert [v.line for v in violations] == [8, 8, 9]
@@ -10,9 +10,11 @@ from collate_files.app.txc_filtering import (
     filter_txc_files_by_service_code,
     find_highest_revision_in_group,
     get_earlier_start_date_files,
+    get_unchanged_files,
     group_files_by_service_code,
 )
 from common_layer.database.models import OrganisationTXCFileAttributes
+from common_layer.dynamodb.models import TXCFileAttributes
 
 
 def create_txc_file_attrs(
@@ -306,3 +308,33 @@ def test_deduplicate_file_attributes_by_filename(
     # Check that the returned files have the expected IDs
     result_ids = [file.id for file in result]
     assert sorted(result_ids) == sorted(expected_ids)
+
+
+def test_get_unchanged_files():
+    """
+    Files are matched to live revision files with the same hash
+    """
+    files = [create_txc_file_attrs(1, "SC1", 1), create_txc_file_attrs(2, "SC2", 1)]
+    live_attributes = [
+        TXCFileAttributes(
+            id=101,
+            revision_number=1,
+            service_code="SC1",
+            line_names=["Test Line"],
+            modification_datetime=datetime.now(),
+            hash="hash1",
+            filename="file.xml",
+        ),
+        TXCFileAttributes(
+            id=102,
+            revision_number=1,
+            service_code="SC3",
+            line_names=["Test Line"],
+            modification_datetime=datetime.now(),
+            hash="hash3",
+            filename="other.xml",
+        ),
+    ]
+
+    assert get_unchanged_files(files, live_attributes) == {1: 101}
+    assert not get_unchanged_files(files, [])
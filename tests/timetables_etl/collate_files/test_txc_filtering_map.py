@@ -7,7 +7,7 @@ from datetime import datetime
 
 import pytest
 from collate_files.app.collate_files import ETLMapInputData
-from collate_files.app.txc_filtering import build_filename_map
+from collate_files.app.txc_filtering import build_filename_map, create_etl_map_inputs
 from common_layer.aws.step import (
     MapExecutionFailed,
     MapExecutionSucceeded,
@@ -16,6 +16,8 @@ from common_layer.aws.step import (
     MapRunExecutionStatus,
 )
 
+from tests.timetables_etl.collate_files.test_txc_filtering import create_txc_file_attrs
+
 
 def create_map_input(
     bucket: str | None = None, key: str | None = None, revision_id: int | None = None
@@ -179,3 +181,32 @@ def test_build_filename_map(
     for filename, execution in result.items():
         assert execution.parsed_input and execution.parsed_input.Key
         assert execution.parsed_input.Key.endswith(filename)
+
+
+def test_create_etl_map_inputs_unchanged_files():
+    """
+    Only active files unchanged since the live revision reference the live file
+    """
+    active = create_txc_file_attrs(1, "SC1", 2, filename="active.xml")
+    superseded = create_txc_file_attrs(2, "SC1", 1, filename="superseded.xml")
+    filename_map = {
+        "active.xml": create_map_execution_succeeded(
+            bucket="test-bucket", key="folder/active.xml", revision_id=100
+        ),
+        "superseded.xml": create_map_execution_succeeded(
+            bucket="test-bucket", key="folder/superseded.xml", revision_id=100
+        ),
+    }
+
+    result = create_etl_map_inputs(
+        [active, superseded], [active], filename_map, {1: 101, 2: 102}
+    )
+
+    assert [
+        (
+            item.file_attributes_id,
+            item.superseded_timetable,
+            item.live_file_attributes_id,
+        )
+        for item in result
+    ] == [(1, False, 101), (2, True, None)]
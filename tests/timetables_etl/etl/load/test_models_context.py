@@ -0,0 +1,27 @@
+"""
+Test Load Context Dataclasses
+"""
+
+from unittest.mock import MagicMock, patch
+
+from timetables_etl.etl.app.load.models_context import ServicePatternFileContext
+
+
+def test_service_pattern_file_context_maps_once():
+    """
+    The journey pattern mapping is built on first use and reused for every service
+    """
+    txc = MagicMock()
+    lookups = MagicMock()
+    context = ServicePatternFileContext(
+        txc=txc, task_data=MagicMock(), lookups=lookups, db=MagicMock()
+    )
+
+    with patch(
+        "timetables_etl.etl.app.load.models_context.map_unique_journey_patterns"
+    ) as m_map:
+        first = context.service_pattern_mapping
+        second = context.service_pattern_mapping
+
+    assert first is second
+    m_map.assert_called_once_with(txc, lookups)
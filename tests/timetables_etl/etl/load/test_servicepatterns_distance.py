@@ -1,10 +1,12 @@
 from unittest.mock import MagicMock, create_autospec, patch
 
+import numpy as np
 import pytest
+import shapely
 from common_layer.database import SqlDB
 from common_layer.database.models import NaptanStopPoint, TransmodelTracks
 from geoalchemy2 import WKBElement
-from geoalchemy2.shape import from_shape  # type: ignore
+from geoalchemy2.shape import from_shape, to_shape  # type: ignore
 from shapely import Point
 from shapely.geometry import LineString
 
@@ -12,9 +14,13 @@ from tests.factories.database.naptan import NaptanStopPointFactory
 from tests.factories.database.transmodel import TransmodelTracksFactory
 from timetables_etl.etl.app.helpers import TrackLookup
 from timetables_etl.etl.app.load.servicepatterns_distance import (
+    TrackCoordinatesCache,
     get_geometry_and_distance_from_tracks,
+    get_wkb_bytes,
     has_sufficient_track_data,
+    haversine,
     process_service_pattern_distance,
+    snap_linestrings,
 )
 
 
@@ -137,6 +143,160 @@ def test_get_geometry_and_distance_from_tracks(
     assert isinstance(geom, WKBElement)
     assert distance == 250, "total distance = 100 + 150"
     assert total_coord_distance == 210
+    assert list(to_shape(geom).coords) == [
+        (0, 0),
+        (0.005, 0.005),
+        (0.01, 0.01),
+        (0.015, 0.015),
+        (0.02, 0.02),
+    ]
+
+
+def create_track(
+    from_atco_code: str, to_atco_code: str, coords: list[tuple[float, float]]
+) -> TransmodelTracks:
+    """
+    Track between two stops with distances of 10
+    """
+    return TransmodelTracksFactory.create(
+        from_atco_code=from_atco_code,
+        to_atco_code=to_atco_code,
+        geometry=from_shape(LineString(coords), srid=4326),
+        distance=10,
+        coord_distance=10,
+    )
+
+
+def test_get_geometry_and_distance_from_tracks_revisited_stop() -> None:
+    """
+    A stop chain that revisits a stop follows the track order
+    linemerge used to return these tracks as a MultiLineString out of order
+    """
+    stops = [
+        NaptanStopPointFactory.create(atco_code=atco_code)
+        for atco_code in ["A", "B", "C", "B", "D"]
+    ]
+    tracks: TrackLookup = {
+        ("A", "B"): create_track("A", "B", [(0, 0), (0.5, 0), (1, 0)]),
+        ("B", "C"): create_track("B", "C", [(1, 0), (1, 0.5), (1, 1)]),
+        ("C", "B"): create_track("C", "B", [(1, 1), (0.5, 0.5), (1, 0)]),
+        ("B", "D"): create_track("B", "D", [(1, 0), (1.5, 0), (2, 0)]),
+    }
+
+    geom, total_coord_distance, distance = get_geometry_and_distance_from_tracks(
+        tracks, stops
+    )
+
+    assert geom is not None
+    assert (total_coord_distance, distance) == (40, 40)
+    assert list(to_shape(geom).coords) == [
+        (0, 0),
+        (0.5, 0),
+        (1, 0),
+        (1, 0.5),
+        (1, 1),
+        (0.5, 0.5),
+        (1, 0),
+        (1.5, 0),
+        (2, 0),
+    ]
+
+
+def test_get_geometry_and_distance_from_tracks_single_point() -> None:
+    """
+    Tracks that are all one point give no geometry but keep their distances
+    """
+    stops = [
+        NaptanStopPointFactory.create(atco_code=atco_code) for atco_code in ["A", "B"]
+    ]
+    tracks: TrackLookup = {
+        ("A", "B"): create_track("A", "B", [(-1.5, 53.0)] * 3),
+    }
+
+    assert has_sufficient_track_data(tracks, stops) is True
+    assert get_geometry_and_distance_from_tracks(tracks, stops) == (None, 10, 10)
+
+
+def test_haversine_arrays() -> None:
+    """
+    Distances are calculated elementwise for arrays of points
+    """
+    distances = haversine(
+        np.array([0.0, 0.0]),
+        np.array([0.0, 0.0]),
+        np.array([0.0, 1.0]),
+        np.array([0.0, 0.0]),
+    )
+    assert distances[0] == 0
+    assert round(distances[1]) == 111195
+    assert haversine(0.0, 0.0, 1.0, 0.0) == distances[1]
+
+
+@pytest.mark.parametrize(
+    "tolerance,expected",
+    [
+        pytest.param(
+            None,
+            [(0, 0), (1, 0), (2, 0), (3, 0)],
+            id="Always snap",
+        ),
+        pytest.param(
+            15.0,
+            [(0, 0), (1, 0), (1.001, 0), (2, 0), (3, 0)],
+            id="Gap over tolerance is kept",
+        ),
+        pytest.param(
+            200.0,
+            [(0, 0), (1, 0), (2, 0), (3, 0)],
+            id="Gap within tolerance is snapped",
+        ),
+    ],
+)
+def test_snap_linestrings(
+    tolerance: float | None, expected: list[tuple[float, float]]
+) -> None:
+    """
+    Line starts are snapped to the previous end and repeated points dropped
+    """
+    lines = [
+        np.array([[0, 0], [1, 0]], dtype=float),
+        np.array([[1.001, 0], [2, 0], [2, 0]], dtype=float),
+        np.array([[2, 0], [3, 0]], dtype=float),
+    ]
+    assert snap_linestrings(lines, tolerance).tolist() == [
+        list(coord) for coord in expected
+    ]
+
+
+def test_snap_linestrings_single_point() -> None:
+    """
+    A line of one repeated point collapses to that point
+    """
+    assert snap_linestrings([np.array([[-1.5, 53.0]] * 3)], None).tolist() == [
+        [-1.5, 53.0]
+    ]
+
+
+def test_track_coordinates_cache(sufficient_tracks: TrackLookup) -> None:
+    """
+    Tracks are decoded once and the least recently used are evicted
+    """
+    cache = TrackCoordinatesCache(max_size=2)
+    wkbs = [get_wkb_bytes(track.geometry) for track in sufficient_tracks.values()]
+
+    with patch(
+        "timetables_etl.etl.app.load.servicepatterns_distance.shapely.from_wkb",
+        wraps=shapely.from_wkb,
+    ) as m_from_wkb:
+        first = cache.get_many(wkbs[:2])
+        second = cache.get_many([wkbs[1], wkbs[0]])
+
+    m_from_wkb.assert_called_once()
+    assert second[0] is first[1]
+    assert first[0][0].tolist() == [[0, 0], [0.005, 0.005], [0.01, 0.01]]
+
+    cache.get_many([wkbs[2]])
+    assert len(cache) == 2
 
 
 @patch(
@@ -0,0 +1,95 @@
+"""
+Test building the Track lookup
+"""
+
+from unittest.mock import MagicMock, patch
+
+from common_layer.database.models import TransmodelTracks
+from common_layer.xml.txc.models.txc_route import (
+    TXCLocation,
+    TXCMapping,
+    TXCRouteLink,
+    TXCRouteSection,
+    TXCTrack,
+)
+from geoalchemy2.shape import from_shape  # type: ignore
+from shapely import LineString
+
+from tests.factories.database.transmodel import TransmodelTracksFactory
+from timetables_etl.etl.app.load.tracks import build_track_lookup
+
+MODULE = "timetables_etl.etl.app.load.tracks"
+
+COORDS_AB = [(-0.1, 51.5), (-0.11, 51.51)]
+COORDS_BC = [(-0.11, 51.51), (-0.12, 51.52)]
+
+
+def make_route_link(
+    from_code: str, to_code: str, coords: list[tuple[float, float]]
+) -> TXCRouteLink:
+    """
+    RouteLink with a Track through the coordinates
+    """
+    return TXCRouteLink(
+        id=f"RL-{from_code}-{to_code}",
+        From=from_code,
+        To=to_code,
+        Track=TXCTrack(
+            Mapping=TXCMapping(
+                Location=[
+                    TXCLocation(id=f"L{i}", Longitude=str(lon), Latitude=str(lat))
+                    for i, (lon, lat) in enumerate(coords)
+                ]
+            )
+        ),
+    )
+
+
+def make_db_track(
+    track_id: int, from_code: str, to_code: str, coords: list[tuple[float, float]]
+) -> TransmodelTracks:
+    """
+    Track as loaded from the DB
+    """
+    track = TransmodelTracksFactory.create(
+        from_atco_code=from_code,
+        to_atco_code=to_code,
+        geometry=from_shape(LineString(coords), srid=4326),
+    )
+    track.id = track_id
+    return track
+
+
+def test_build_track_lookup_reuses_existing_tracks():
+    """
+    Tracks matching a DB track's stop pair and geometry reuse the first created one
+    Tracks with a new geometry are built for insert
+    """
+    route_sections = [
+        TXCRouteSection(
+            id="RS1",
+            RouteLink=[
+                make_route_link("A", "B", COORDS_AB),
+                make_route_link("B", "C", COORDS_BC),
+            ],
+        )
+    ]
+    existing_ab = make_db_track(20, "A", "B", COORDS_AB)
+    duplicate_ab = make_db_track(30, "A", "B", COORDS_AB)
+    other_bc = make_db_track(40, "B", "C", [(-0.11, 51.51), (-0.13, 51.52)])
+
+    with patch(f"{MODULE}.TransmodelTrackRepo") as m_repo:
+        m_repo.return_value.get_by_stop_pairs.return_value = [
+            duplicate_ab,
+            existing_ab,
+            other_bc,
+        ]
+        lookup = build_track_lookup(route_sections, MagicMock())
+
+    m_repo.return_value.get_by_stop_pairs.assert_called_once_with(
+        [("A", "B"), ("B", "C")]
+    )
+    assert lookup[("A", "B")] is existing_ab
+    assert lookup[("B", "C")] is not other_bc
+    assert not getattr(lookup[("B", "C")], "id", None)
+    assert lookup[("B", "C")].coord_distance
@@ -0,0 +1,57 @@
+"""
+Test cloning a TXC File unchanged since the live revision
+"""
+
+from unittest.mock import MagicMock, patch
+
+from timetables_etl.etl.app.load.unchanged_file import clone_unchanged_file
+
+MODULE = "timetables_etl.etl.app.load.unchanged_file"
+
+CLONE_COUNTS = {
+    "transmodel_service": 2,
+    "transmodel_bookingarrangements": 1,
+    "transmodel_servicepattern": 3,
+    "transmodel_servicepattern_admin_areas": 4,
+    "transmodel_servicepattern_localities": 5,
+    "transmodel_servicepatterndistance": 3,
+    "transmodel_servicepatterntracks": 6,
+    "transmodel_vehiclejourney": 7,
+    "transmodel_servicepatternstop": 8,
+    "transmodel_operatingprofile": 9,
+    "transmodel_servicedorganisationvehiclejourney": 10,
+}
+
+
+@patch(f"{MODULE}.TransmodelFileCloneRepo")
+def test_clone_unchanged_file_stats(m_repo: MagicMock):
+    """
+    Every count from the clone is reported in the stats
+    """
+    m_repo.return_value.count_service_patterns.return_value = 3
+    m_repo.return_value.clone_file.return_value = CLONE_COUNTS
+
+    stats = clone_unchanged_file(1, MagicMock(), MagicMock())
+
+    assert stats is not None
+    assert stats.cloned_files == 1
+    assert stats.services == 2
+    assert stats.booking_arrangements == 1
+    assert stats.service_patterns == 3
+    assert stats.pattern_stats.admin_areas == 4
+    assert stats.pattern_stats.localities == 5
+    assert stats.pattern_stats.tracks == 6
+    assert stats.pattern_stats.vehicle_journeys == 7
+    assert stats.pattern_stats.pattern_stops == 8
+    assert stats.cloned_rows == CLONE_COUNTS
+
+
+@patch(f"{MODULE}.TransmodelFileCloneRepo")
+def test_clone_unchanged_file_superseded(m_repo: MagicMock):
+    """
+    A live file without Service Patterns runs the full ETL
+    """
+    m_repo.return_value.count_service_patterns.return_value = 0
+
+    assert clone_unchanged_file(1, MagicMock(), MagicMock()) is None
+    m_repo.return_value.clone_file.assert_not_called()
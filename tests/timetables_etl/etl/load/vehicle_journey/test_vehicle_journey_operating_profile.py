@@ -0,0 +1,123 @@
+"""
+Test batched insertion of Vehicle Journey Operations
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from common_layer.database.models import (
+    TMDayOfWeek,
+    TransmodelNonOperatingDatesExceptions,
+    TransmodelOperatingDatesExceptions,
+    TransmodelOperatingProfile,
+    TransmodelServicedOrganisationVehicleJourney,
+)
+from common_layer.xml.txc.models import TXCServicedOrganisationDatePattern
+
+from timetables_etl.etl.app.load.vehicle_journey.vehicle_journey_operating_profile import (
+    insert_vehicle_journey_operations,
+)
+from timetables_etl.etl.app.transform.vehicle_journey_operations import (
+    VehicleJourneyOperations,
+    merge_vehicle_journey_operations,
+)
+
+MODULE = "timetables_etl.etl.app.load.vehicle_journey.vehicle_journey_operating_profile"
+
+
+def make_journey_operations(vehicle_journey_id: int) -> VehicleJourneyOperations:
+    """
+    Operations for a single vehicle journey with a serviced organisation
+    """
+    so_vj = TransmodelServicedOrganisationVehicleJourney(
+        operating_on_working_days=True,
+        serviced_organisation_id=1,
+        vehicle_journey_id=vehicle_journey_id,
+    )
+    return VehicleJourneyOperations(
+        operating_profiles=[
+            TransmodelOperatingProfile(
+                day_of_week=TMDayOfWeek.MONDAY, vehicle_journey_id=vehicle_journey_id
+            )
+        ],
+        operating_dates=[
+            TransmodelOperatingDatesExceptions(
+                operating_date=date(2025, 1, 1), vehicle_journey_id=vehicle_journey_id
+            )
+        ],
+        non_operating_dates=[
+            TransmodelNonOperatingDatesExceptions(
+                non_operating_date=date(2025, 1, 2),
+                vehicle_journey_id=vehicle_journey_id,
+            )
+        ],
+        serviced_organisation_vehicle_journeys=[so_vj],
+        working_days_patterns=[
+            (
+                so_vj,
+                [
+                    TXCServicedOrganisationDatePattern(
+                        StartDate=date(2025, 1, 6), EndDate=date(2025, 1, 10)
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def test_merge_vehicle_journey_operations():
+    """
+    Records from every journey are kept in order
+    """
+    first = make_journey_operations(1)
+    second = make_journey_operations(2)
+
+    merged = merge_vehicle_journey_operations([first, second])
+
+    assert merged.operating_profiles == (
+        first.operating_profiles + second.operating_profiles
+    )
+    assert merged.serviced_organisation_vehicle_journeys == (
+        first.serviced_organisation_vehicle_journeys
+        + second.serviced_organisation_vehicle_journeys
+    )
+    assert merged.working_days_patterns == (
+        first.working_days_patterns + second.working_days_patterns
+    )
+    assert first.operating_profiles is not merged.operating_profiles
+
+
+def test_insert_vehicle_journey_operations():
+    """
+    Each table is written once for all journeys
+    Working days use the serviced organisation vehicle journey IDs from the insert
+    """
+    operations = merge_vehicle_journey_operations(
+        [make_journey_operations(vj_id) for vj_id in (1, 2, 3)]
+    )
+
+    def set_ids(
+        records: list[TransmodelServicedOrganisationVehicleJourney],
+    ) -> list[TransmodelServicedOrganisationVehicleJourney]:
+        for record_id, record in enumerate(records, start=100):
+            record.id = record_id
+        return records
+
+    with (
+        patch(f"{MODULE}.TransmodelOperatingProfileRepo") as m_profiles,
+        patch(f"{MODULE}.TransmodelOperatingDatesExceptionsRepo") as m_dates,
+        patch(f"{MODULE}.TransmodelNonOperatingDatesExceptionsRepo") as m_non_dates,
+        patch(f"{MODULE}.TransmodelServicedOrganisationVehicleJourneyRepo") as m_so_vjs,
+        patch(f"{MODULE}.TransmodelServicedOrganisationWorkingDaysRepo") as m_days,
+    ):
+        m_so_vjs.return_value.bulk_insert.side_effect = set_ids
+        insert_vehicle_journey_operations(operations, MagicMock())
+
+    for m_repo in (m_profiles, m_dates, m_non_dates, m_days):
+        m_repo.return_value.bulk_insert_copy.assert_called_once()
+    m_so_vjs.return_value.bulk_insert.assert_called_once()
+
+    assert len(m_profiles.return_value.bulk_insert_copy.call_args.args[0]) == 3
+    working_days = m_days.return_value.bulk_insert_copy.call_args.args[0]
+    so_vj_ids = [day.serviced_organisation_vehicle_journey_id for day in working_days]
+    assert so_vj_ids == [100, 101, 102]
@@ -0,0 +1,103 @@
+"""
+Test Transmodel Tracks Generation
+"""
+
+import numpy as np
+import pytest
+from shapely import LineString
+
+from timetables_etl.etl.app.transform.tracks import (
+    GEOD,
+    calculate_distance_from_geometry,
+    calculate_line_distances,
+    get_track_geometry_hash,
+)
+
+LINES = [
+    LineString([(-2.5826, 51.4489), (-2.5830, 51.4495), (-2.5841, 51.4501)]),
+    LineString([(-0.1276, 51.5072), (-0.1280, 51.5080)]),
+    LineString([(-1.8904, 52.4862), (-1.8910, 52.4870), (-1.8915, 52.4871)]),
+]
+
+
+def pairwise_distance(line: LineString) -> int:
+    """
+    Sum of geod.inv over each pair of coordinates
+    """
+    coords = list(line.coords)
+    total = 0.0
+    for (lon1, lat1), (lon2, lat2) in zip(coords, coords[1:]):
+        _, _, distance = GEOD.inv(lon1, lat1, lon2, lat2)
+        total += distance
+    return int(total)
+
+
+def test_calculate_line_distances_matches_pairwise():
+    """
+    Batched distances match summing each coordinate pair per line
+    """
+    assert calculate_line_distances(LINES) == [
+        pairwise_distance(line) for line in LINES
+    ]
+
+
+@pytest.mark.parametrize(
+    "lines,expected",
+    [
+        pytest.param([], [], id="No lines"),
+        pytest.param(
+            [LineString([(-2.5826, 51.4489), (-2.5826, 51.4489)])],
+            [0],
+            id="Zero length line",
+        ),
+    ],
+)
+def test_calculate_line_distances_edge_cases(
+    lines: list[LineString], expected: list[int]
+):
+    """
+    Empty input and repeated points
+    """
+    assert calculate_line_distances(lines) == expected
+
+
+def test_calculate_distance_from_geometry():
+    """
+    Single line wrapper
+    """
+    assert calculate_distance_from_geometry(LINES[1]) == pairwise_distance(LINES[1])
+
+
+@pytest.mark.parametrize(
+    "other,same_hash",
+    [
+        pytest.param(
+            [[-2.58260001, 51.4489], [-2.583, 51.4495]],
+            True,
+            id="Difference below precision",
+        ),
+        pytest.param(
+            [[-2.5826, 51.4489], [-2.5826, 51.4489], [-2.583, 51.4495]],
+            True,
+            id="Repeated point",
+        ),
+        pytest.param(
+            [[-2.5827, 51.4489], [-2.583, 51.4495]],
+            False,
+            id="Different point",
+        ),
+        pytest.param(
+            [[-2.583, 51.4495], [-2.5826, 51.4489]],
+            False,
+            id="Reversed",
+        ),
+    ],
+)
+def test_get_track_geometry_hash(other: list[list[float]], same_hash: bool):
+    """
+    Geometry hashes ignore differences below the rounding precision
+    """
+    coords = np.array([[-2.5826, 51.4489], [-2.583, 51.4495]])
+    assert (
+        get_track_geometry_hash(coords) == get_track_geometry_hash(np.array(other))
+    ) is same_hash
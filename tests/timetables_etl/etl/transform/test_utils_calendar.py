@@ -0,0 +1,123 @@
+"""
+Test Vectorised Calendar Calculations
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from common_layer.xml.txc.models.txc_operating_profile import TXCDaysOfWeek
+
+from timetables_etl.etl.app.transform.utils_calendar import (
+    WeekdayMask,
+    get_dates_by_weekday,
+    get_weekday_mask,
+)
+
+WEEKDAYS: WeekdayMask = (True, True, True, True, True, False, False)
+
+
+def test_get_weekday_mask():
+    """
+    Mask is Monday first and ignores HolidaysOnly
+    """
+    days = TXCDaysOfWeek(
+        Monday=True,
+        Tuesday=False,
+        Wednesday=False,
+        Thursday=False,
+        Friday=False,
+        Saturday=False,
+        Sunday=True,
+        HolidaysOnly=False,
+    )
+    assert get_weekday_mask(days) == (True, False, False, False, False, False, True)
+
+
+@pytest.mark.parametrize(
+    "start_date,end_date,weekday_mask,operating,expected",
+    [
+        pytest.param(
+            date(2025, 1, 4),
+            date(2025, 1, 7),
+            WEEKDAYS,
+            True,
+            (date(2025, 1, 6), date(2025, 1, 7)),
+            id="Weekdays in range",
+        ),
+        pytest.param(
+            date(2025, 1, 4),
+            date(2025, 1, 7),
+            WEEKDAYS,
+            False,
+            (date(2025, 1, 4), date(2025, 1, 5)),
+            id="Weekend in range",
+        ),
+        pytest.param(
+            date(2025, 1, 1),
+            date(2025, 1, 1),
+            WEEKDAYS,
+            True,
+            (date(2025, 1, 1),),
+            id="Single day",
+        ),
+        pytest.param(
+            date(2025, 1, 7),
+            date(2025, 1, 6),
+            WEEKDAYS,
+            True,
+            (),
+            id="End before start",
+        ),
+        pytest.param(
+            date(1969, 12, 29),
+            date(1969, 12, 29),
+            (True, False, False, False, False, False, False),
+            True,
+            (date(1969, 12, 29),),
+            id="Monday before numpy epoch",
+        ),
+    ],
+)
+def test_get_dates_by_weekday(
+    start_date: date,
+    end_date: date,
+    weekday_mask: WeekdayMask,
+    operating: bool,
+    expected: tuple[date, ...],
+):
+    """
+    Dates are selected by weekday within the inclusive range
+    """
+    assert (
+        get_dates_by_weekday(start_date, end_date, weekday_mask, operating) == expected
+    )
+
+
+def test_get_dates_by_weekday_matches_python_weekday():
+    """
+    Every weekday over a leap year matches date.weekday()
+    """
+    start_date = date(2024, 1, 1)
+    for weekday in range(7):
+        weekday_mask = tuple(day == weekday for day in range(7))
+        result = get_dates_by_weekday(
+            start_date, date(2024, 12, 31), weekday_mask, True  # type: ignore
+        )
+        expected = tuple(
+            start_date + timedelta(days=offset)
+            for offset in range(366)
+            if (start_date + timedelta(days=offset)).weekday() == weekday
+        )
+        assert result == expected
+
+
+def test_get_dates_by_weekday_is_memoised():
+    """
+    The same range and mask return the cached result
+    """
+    get_dates_by_weekday.cache_clear()
+    first = get_dates_by_weekday(date(2025, 1, 1), date(2025, 3, 31), WEEKDAYS, True)
+    second = get_dates_by_weekday(date(2025, 1, 1), date(2025, 3, 31), WEEKDAYS, True)
+
+    assert first is second
+    assert get_dates_by_weekday.cache_info().hits == 1
@@ -0,0 +1,59 @@
+"""
+Test Content Hashing
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from timetables_etl.etl.app.transform.utils_hash import (
+    create_hash,
+    create_stop_sequence_hash,
+)
+
+
+def test_create_hash_is_stable_across_processes():
+    """
+    Hashes don't depend on the per process hash seed
+    """
+    code = (
+        "from timetables_etl.etl.app.transform.utils_hash import create_hash;"
+        "print(create_hash(['RL1', 'RL2']))"
+    )
+    results = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": ":".join(sys.path)},
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert results == {create_hash(["RL1", "RL2"])}
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        pytest.param(["ab", "c"], ["a", "bc"], id="Value boundaries"),
+        pytest.param(["a", "b"], ["b", "a"], id="Order"),
+        pytest.param(["a"], ["a", ""], id="Empty value"),
+    ],
+)
+def test_create_hash_distinguishes_sequences(first: list[str], second: list[str]):
+    """
+    Different sequences of values give different hashes
+    """
+    assert create_hash(first) != create_hash(second)
+
+
+def test_create_stop_sequence_hash():
+    """
+    Stop sequence hashes are hex digests of the ATCO codes in order
+    """
+    stop_sequence_hash = create_stop_sequence_hash(("0100BRP90312", "0100BRP90310"))
+
+    assert len(stop_sequence_hash) == 32
+    assert stop_sequence_hash == create_hash(["0100BRP90312", "0100BRP90310"])
@@ -3,20 +3,33 @@ Test Generating Transmodel Operating/NonOperating Days from TXC Operating Profil
 """
 
 from datetime import date
+from unittest.mock import MagicMock
 
 import pytest
 from common_layer.database.models import (
+    TMDayOfWeek,
     TransmodelNonOperatingDatesExceptions,
     TransmodelOperatingDatesExceptions,
 )
 from common_layer.xml.txc.models.txc_operating_profile import (
     TXCBankHolidayDays,
     TXCBankHolidayOperation,
+    TXCDateRange,
     TXCDaysOfWeek,
+    TXCOperatingProfile,
+    TXCSpecialDaysOperation,
 )
 
 from tests.factories.database.transmodel import TransmodelVehicleJourneyFactory
+from tests.timetables_etl.factories.txc.factory_vehicle_journey import (
+    TXCOperatingProfileFactory,
+    TXCVehicleJourneyFactory,
+)
+from timetables_etl.etl.app.load.models_context import (
+    OperatingProfileProcessingContext,
+)
 from timetables_etl.etl.app.transform.vehicle_journey_operations import (
+    create_vehicle_journeys_operations,
     get_bank_holiday_non_operating_dates,
     get_bank_holiday_operating_dates,
     process_bank_holidays,
@@ -432,3 +445,77 @@ def test_process_bank_holidays(
         operating_days,
     )
     assert result == expected
+
+
+def test_create_vehicle_journeys_operations_shares_profiles():
+    """
+    Each distinct OperatingProfile is expanded once and copied to matching journeys
+    """
+    weekdays = TXCOperatingProfileFactory.create(
+        SpecialDaysOperation=TXCSpecialDaysOperation(
+            DaysOfNonOperation=[
+                TXCDateRange(StartDate=date(2025, 1, 1), EndDate=date(2025, 1, 1))
+            ]
+        )
+    )
+    weekends = TXCOperatingProfile.model_validate(
+        {
+            "RegularDayType": {
+                "Monday": False,
+                "Tuesday": False,
+                "Wednesday": False,
+                "Thursday": False,
+                "Friday": False,
+                "Saturday": True,
+                "Sunday": True,
+                "HolidaysOnly": False,
+            }
+        }
+    )
+    journeys = []
+    for vj_id, profile in enumerate([weekdays, weekends, weekdays, weekdays], 1):
+        tm_vj = TransmodelVehicleJourneyFactory.create()
+        tm_vj.id = vj_id
+        journeys.append(
+            (
+                tm_vj,
+                TXCVehicleJourneyFactory.create(
+                    OperatingProfile=profile.model_copy(deep=True)
+                ),
+            )
+        )
+    context = OperatingProfileProcessingContext(
+        bank_holidays={},
+        tm_serviced_orgs={},
+        txc_serviced_orgs_dict={},
+        txc_services=[],
+        db=MagicMock(),
+    )
+
+    operations = create_vehicle_journeys_operations(journeys, context)
+
+    assert len(context.expanded_profiles) == 2
+    assert [
+        (profile.vehicle_journey_id, profile.day_of_week)
+        for profile in operations.operating_profiles
+        if profile.vehicle_journey_id in (2, 4)
+    ] == [
+        (2, TMDayOfWeek.SATURDAY),
+        (2, TMDayOfWeek.SUNDAY),
+        (4, TMDayOfWeek.MONDAY),
+        (4, TMDayOfWeek.TUESDAY),
+        (4, TMDayOfWeek.WEDNESDAY),
+        (4, TMDayOfWeek.THURSDAY),
+        (4, TMDayOfWeek.FRIDAY),
+    ]
+    assert [
+        (non_operating.vehicle_journey_id, non_operating.non_operating_date)
+        for non_operating in operations.non_operating_dates
+    ] == [
+        (1, date(2025, 1, 1)),
+        (3, date(2025, 1, 1)),
+        (4, date(2025, 1, 1)),
+    ]
+    assert len({id(profile) for profile in operations.operating_profiles}) == len(
+        operations.operating_profiles
+    )
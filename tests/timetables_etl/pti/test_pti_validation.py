@@ -35,7 +35,7 @@ class MockImports(Protocol):
 
     S3: MagicMock
     DynamoDBCache: MagicMock
-    NaptanStopPointDynamoDBClient: MagicMock
+    create_stop_point_client: MagicMock
     FileProcessingDataManager: MagicMock
     OrganisationDatasetRevisionRepo: MagicMock
     OrganisationTXCFileAttributesRepo: MagicMock
@@ -58,8 +58,8 @@ def mock_imports() -> Generator[MockImports, None, None]:
     patches = {
         "S3": patch("pti.app.pti_validation.S3"),
         "DynamoDBCache": patch("pti.app.pti_validation.DynamoDBCache"),
-        "NaptanStopPointDynamoDBClient": patch(
-            "pti.app.pti_validation.NaptanStopPointDynamoDBClient"
+        "create_stop_point_client": patch(
+            "pti.app.pti_validation.create_stop_point_client"
         ),
         "FileProcessingDataManager": patch(
             "pti.app.pti_validation.FileProcessingDataManager"
@@ -0,0 +1,112 @@
+"""
+Test Parallel Section Parsing matches the sequential parser
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common_layer.xml.txc.parser.parser_txc import (
+    TXCParserConfig,
+    parse_txc_from_element,
+)
+from common_layer.xml.txc.parser.parser_txc_parallel import parse_section
+from lxml import etree
+
+TXC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TransXChange xmlns="http://www.transxchange.org.uk/"
+    CreationDateTime="2024-01-01T00:00:00" ModificationDateTime="2024-01-01T00:00:00"
+    Modification="new" RevisionNumber="1" FileName="test.xml" SchemaVersion="2.4">
+  <StopPoints>
+    <AnnotatedStopPointRef>
+      <StopPointRef>0100BRP90310</StopPointRef>
+      <CommonName>Temple Meads Stn</CommonName>
+    </AnnotatedStopPointRef>
+    <AnnotatedStopPointRef>
+      <StopPointRef>0100BRP90311</StopPointRef>
+      <CommonName>Redcliffe Hill</CommonName>
+    </AnnotatedStopPointRef>
+  </StopPoints>
+  <RouteSections>
+    <RouteSection id="RS1">
+      <RouteLink id="RL1">
+        <From><StopPointRef>0100BRP90310</StopPointRef></From>
+        <To><StopPointRef>0100BRP90311</StopPointRef></To>
+      </RouteLink>
+    </RouteSection>
+  </RouteSections>
+  <Routes>
+    <Route id="R1">
+      <Description>Temple Meads - Redcliffe</Description>
+      <RouteSectionRef>RS1</RouteSectionRef>
+    </Route>
+  </Routes>
+  <Operators>
+    <Operator id="O1">
+      <NationalOperatorCode>BTST</NationalOperatorCode>
+      <OperatorCode>BT</OperatorCode>
+      <OperatorShortName>Bus Test</OperatorShortName>
+      <LicenceNumber>PB0000001</LicenceNumber>
+    </Operator>
+  </Operators>
+  <VehicleJourneys>
+    <VehicleJourney>
+      <OperatorRef>O1</OperatorRef>
+      <VehicleJourneyCode>VJ1</VehicleJourneyCode>
+      <ServiceRef>S1</ServiceRef>
+      <LineRef>L1</LineRef>
+      <JourneyPatternRef>JP1</JourneyPatternRef>
+      <DepartureTime>08:00:00</DepartureTime>
+    </VehicleJourney>
+  </VehicleJourneys>
+</TransXChange>
+"""
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(TXCParserConfig.parse_all(), id="Parse All"),
+        pytest.param(TXCParserConfig.parse_stops_only(), id="Stops Only"),
+        pytest.param(
+            TXCParserConfig(route_sections=False), id="Routes Without Route Sections"
+        ),
+    ],
+)
+def test_parse_txc_parallel_matches_sequential(config: TXCParserConfig):
+    """
+    Parallel section parsing should return the same TXCData
+    """
+    xml_data = etree.fromstring(TXC_XML)
+    parallel_config = config.model_copy(
+        update={"parallel_sections": True, "max_workers": 2}
+    )
+
+    expected = parse_txc_from_element(xml_data, config)
+    result = parse_txc_from_element(xml_data, parallel_config)
+
+    assert result == expected
+    assert result.Routes == expected.Routes
+
+
+def test_parse_txc_parallel_falls_back_without_process_pool():
+    """
+    Where a process pool can't be created the sections are parsed sequentially
+    """
+    xml_data = etree.fromstring(TXC_XML)
+    config = TXCParserConfig(parallel_sections=True)
+
+    with patch(
+        "common_layer.xml.txc.parser.parser_txc_parallel.ProcessPoolExecutor",
+        MagicMock(side_effect=OSError(38, "Function not implemented")),
+    ):
+        result = parse_txc_from_element(xml_data, config)
+
+    assert result == parse_txc_from_element(xml_data, TXCParserConfig())
+
+
+def test_parse_section_unknown_section():
+    """
+    Sections without a parser raise
+    """
+    with pytest.raises(ValueError):
+        parse_section("Routes", b"<Routes/>", False)
@@ -0,0 +1,175 @@
+"""
+Test Streaming TXC Parser matches the full tree parser
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from common_layer.xml.txc.models import (
+    AnnotatedStopPointRef,
+    TXCFlexibleVehicleJourney,
+    TXCVehicleJourney,
+)
+from common_layer.xml.txc.parser.parser_txc import (
+    TXCParserConfig,
+    load_xml_data,
+    parse_txc_file,
+    parse_txc_from_element,
+    parse_txc_streaming,
+)
+
+TXC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TransXChange xmlns="http://www.transxchange.org.uk/"
+    CreationDateTime="2024-01-01T00:00:00" ModificationDateTime="2024-01-01T00:00:00"
+    Modification="new" RevisionNumber="1" FileName="test.xml" SchemaVersion="2.4">
+  <!-- Comments should be ignored -->
+  <StopPoints>
+    <AnnotatedStopPointRef>
+      <StopPointRef>0100BRP90310</StopPointRef>
+      <CommonName>Temple Meads Stn</CommonName>
+    </AnnotatedStopPointRef>
+    <AnnotatedStopPointRef>
+      <StopPointRef>0100BRP90311</StopPointRef>
+      <CommonName>Redcliffe Hill</CommonName>
+    </AnnotatedStopPointRef>
+    <AnnotatedStopPointRef>
+      <StopPointRef>0100BRP90312</StopPointRef>
+    </AnnotatedStopPointRef>
+  </StopPoints>
+  <RouteSections>
+    <RouteSection id="RS1">
+      <RouteLink id="RL1">
+        <From><StopPointRef>0100BRP90310</StopPointRef></From>
+        <To><StopPointRef>0100BRP90311</StopPointRef></To>
+        <Distance>250</Distance>
+        <Track>
+          <Mapping>
+            <Location id="L1"><Longitude>-2.58</Longitude><Latitude>51.44</Latitude></Location>
+            <Location id="L2"><Longitude>-2.59</Longitude><Latitude>51.45</Latitude></Location>
+          </Mapping>
+        </Track>
+      </RouteLink>
+    </RouteSection>
+  </RouteSections>
+  <Routes>
+    <Route id="R1">
+      <Description>Temple Meads - Redcliffe</Description>
+      <RouteSectionRef>RS1</RouteSectionRef>
+    </Route>
+  </Routes>
+  <JourneyPatternSections>
+    <JourneyPatternSection id="JPS1">
+      <JourneyPatternTimingLink id="JPTL1">
+        <From id="JPSU1" SequenceNumber="1">
+          <StopPointRef>0100BRP90310</StopPointRef>
+          <TimingStatus>principalTimingPoint</TimingStatus>
+        </From>
+        <To id="JPSU2" SequenceNumber="2">
+          <StopPointRef>0100BRP90311</StopPointRef>
+          <TimingStatus>principalTimingPoint</TimingStatus>
+        </To>
+        <RouteLinkRef>RL1</RouteLinkRef>
+        <RunTime>PT5M</RunTime>
+      </JourneyPatternTimingLink>
+    </JourneyPatternSection>
+  </JourneyPatternSections>
+  <Operators>
+    <Operator id="O1">
+      <NationalOperatorCode>BTST</NationalOperatorCode>
+      <OperatorCode>BT</OperatorCode>
+      <OperatorShortName>Bus Test</OperatorShortName>
+      <LicenceNumber>PB0000001</LicenceNumber>
+    </Operator>
+  </Operators>
+  <VehicleJourneys>
+    <FlexibleVehicleJourney>
+      <ServiceRef>S1</ServiceRef>
+      <LineRef>L1</LineRef>
+      <JourneyPatternRef>FJP1</JourneyPatternRef>
+      <VehicleJourneyCode>FVJ1</VehicleJourneyCode>
+      <FlexibleServiceTimes>
+        <AllDayService/>
+      </FlexibleServiceTimes>
+    </FlexibleVehicleJourney>
+    <VehicleJourney>
+      <OperatorRef>O1</OperatorRef>
+      <VehicleJourneyCode>VJ1</VehicleJourneyCode>
+      <ServiceRef>S1</ServiceRef>
+      <LineRef>L1</LineRef>
+      <JourneyPatternRef>JP1</JourneyPatternRef>
+      <DepartureTime>08:00:00</DepartureTime>
+    </VehicleJourney>
+    <VehicleJourney>
+      <OperatorRef>O1</OperatorRef>
+      <VehicleJourneyCode>VJ2</VehicleJourneyCode>
+      <ServiceRef>S1</ServiceRef>
+      <LineRef>L1</LineRef>
+      <JourneyPatternRef>JP1</JourneyPatternRef>
+      <DepartureTime>09:00:00</DepartureTime>
+    </VehicleJourney>
+  </VehicleJourneys>
+</TransXChange>
+"""
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(TXCParserConfig.parse_all(), id="Parse All"),
+        pytest.param(TXCParserConfig(), id="Default Config"),
+        pytest.param(TXCParserConfig.parse_stops_only(), id="Stops Only"),
+        pytest.param(
+            TXCParserConfig(route_sections=False), id="Routes Without Route Sections"
+        ),
+        pytest.param(
+            TXCParserConfig(vehicle_journeys=False, metadata=False),
+            id="Vehicle Journeys and Metadata Disabled",
+        ),
+    ],
+)
+def test_parse_txc_streaming_matches_tree_parser(config: TXCParserConfig):
+    """
+    Streaming parse should return the same TXCData as the full tree parse
+    """
+    expected = parse_txc_from_element(load_xml_data(BytesIO(TXC_XML)), config)
+    result = parse_txc_streaming(BytesIO(TXC_XML), config)
+
+    assert result == expected
+
+
+def test_parse_txc_streaming_sections():
+    """
+    Check the streamed sections are populated and ordered like the tree parser
+    """
+    result = parse_txc_streaming(BytesIO(TXC_XML), TXCParserConfig.parse_all())
+
+    assert result.Metadata is not None
+    assert result.Metadata.FileName == "test.xml"
+    assert [
+        stop.StopPointRef
+        for stop in result.StopPoints
+        if isinstance(stop, AnnotatedStopPointRef)
+    ] == ["0100BRP90310", "0100BRP90311"]
+    assert result.RouteSections[0].RouteLink[0].Track is not None
+    assert result.Routes[0].RouteSectionRef == result.RouteSections
+    assert [type(vj) for vj in result.VehicleJourneys] == [
+        TXCVehicleJourney,
+        TXCVehicleJourney,
+        TXCFlexibleVehicleJourney,
+    ]
+
+
+def test_parse_txc_file_streaming(tmp_path: Path):
+    """
+    parse_txc_file should use the streaming parser when configured
+    """
+    xml_path = tmp_path / "test.xml"
+    xml_path.write_bytes(TXC_XML)
+
+    streamed = parse_txc_file(xml_path, TXCParserConfig(file_hash=True, streaming=True))
+    loaded = parse_txc_file(xml_path, TXCParserConfig(file_hash=True))
+
+    assert streamed == loaded
+    assert streamed.Metadata is not None
+    assert streamed.Metadata.FileHash is not None
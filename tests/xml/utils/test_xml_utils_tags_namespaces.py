@@ -0,0 +1,83 @@
+"""
+Namespace Aware Element Lookups
+"""
+
+import pytest
+from common_layer.xml.utils import (
+    find_element,
+    find_elements,
+    get_element_text,
+    get_namespace,
+    get_namespaced_path,
+)
+from lxml import etree
+from lxml.etree import Element, _Element  # type: ignore
+
+TXC_NS = "http://www.transxchange.org.uk/"
+
+
+@pytest.mark.parametrize(
+    "input_xml,expected",
+    [
+        pytest.param(Element(f"{{{TXC_NS}}}StopPoint"), TXC_NS, id="Namespaced tag"),
+        pytest.param(Element("StopPoint"), None, id="Tag without namespace"),
+    ],
+)
+def test_get_namespace(input_xml: _Element, expected: str | None) -> None:
+    """Test namespace extraction from element tags"""
+    assert get_namespace(input_xml) == expected
+
+
+@pytest.mark.parametrize(
+    "path,namespace,expected",
+    [
+        pytest.param("StopPoint", None, "StopPoint", id="No namespace unchanged"),
+        pytest.param(
+            "From/StopPointRef",
+            TXC_NS,
+            f"{{{TXC_NS}}}From/{{{TXC_NS}}}StopPointRef",
+            id="Each step qualified",
+        ),
+        pytest.param(
+            "StopPointsInSequence/*",
+            TXC_NS,
+            f"{{{TXC_NS}}}StopPointsInSequence/*",
+            id="Wildcard left alone",
+        ),
+        pytest.param(
+            "{urn:other}Tag", TXC_NS, "{urn:other}Tag", id="Qualified step left alone"
+        ),
+    ],
+)
+def test_get_namespaced_path(path: str, namespace: str | None, expected: str) -> None:
+    """Test ElementPath qualification"""
+    assert get_namespaced_path(path, namespace) == expected
+
+
+@pytest.mark.parametrize(
+    "xml_string",
+    [
+        pytest.param(
+            f"""<RouteLink xmlns="{TXC_NS}">
+                <From><StopPointRef>A</StopPointRef></From>
+                <To><StopPointRef>B</StopPointRef></To>
+            </RouteLink>""",
+            id="Namespaced document",
+        ),
+        pytest.param(
+            """<RouteLink>
+                <From><StopPointRef>A</StopPointRef></From>
+                <To><StopPointRef>B</StopPointRef></To>
+            </RouteLink>""",
+            id="Document without namespace",
+        ),
+    ],
+)
+def test_find_elements_namespace_aware(xml_string: str) -> None:
+    """Lookups behave the same with or without a namespace"""
+    xml_data = etree.fromstring(xml_string)
+
+    assert get_element_text(xml_data, "From/StopPointRef") == "A"
+    assert get_element_text(xml_data, "To/StopPointRef") == "B"
+    assert find_element(xml_data, "Missing") is None
+    assert len(find_elements(xml_data, "*/StopPointRef")) == 2
@@ -0,0 +1,475 @@
+"""
+Benchmarks for comparing implementations of hot paths
+"""
+
+import multiprocessing
+import re
+import tempfile
+import time
+import timeit
+from itertools import chain
+from pathlib import Path
+from typing import Callable
+
+import typer
+from common_layer.database.client import SqlDB
+from common_layer.database.models import NaptanAdminArea
+from common_layer.database.repos.repo_common import BaseRepositoryWithId
+from common_layer.json_logging import configure_logging
+from common_layer.xml.txc.models import AnnotatedStopPointRef, TXCData
+from common_layer.xml.txc.parser.parser_txc import (
+    TXCParserConfig,
+    load_xml_data,
+    parse_txc_from_element,
+)
+from lxml.etree import parse
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy.orm import sessionmaker
+from structlog.stdlib import get_logger
+
+from common_lambdas.schema_check.app.schema_check import get_schema_violations
+from common_lambdas.schema_check.app.schema_loader import load_schema
+from common_lambdas.schema_check.app.streaming import (
+    iter_chunks,
+    read_xml_root,
+    stream_schema_violations,
+)
+from common_lambdas.schema_check.app.utils import get_xml_type
+from timetables_etl.etl.app.helpers import ReferenceDataLookups
+from timetables_etl.etl.app.transform.service_pattern_mapping import (
+    map_unique_journey_patterns,
+)
+from timetables_etl.etl.app.transform.stop_points import create_stop_point_lookups
+from tools.common.db_tools import create_db_config, setup_db_instance
+from tools.common.xml_tools import get_xml_paths
+
+app = typer.Typer(help="Benchmark hot paths against local fixtures")
+log = get_logger()
+
+DEFAULT_FIXTURES = [Path("tests")]
+DEFAULT_SCHEMA_FIXTURE = Path(
+    "tests/timetables_etl/pti/validators/data/vehicle_journeys/"
+    "vj_timing_link_w_success.xml"
+)
+
+
+@app.callback()
+def main():
+    """
+    Benchmark hot paths against local fixtures
+    """
+
+
+def parse_stripped(xml_path: Path, config: TXCParserConfig) -> TXCData:
+    """
+    Parse after rewriting every tag to remove the namespace
+    """
+    return parse_txc_from_element(load_xml_data(xml_path), config)
+
+
+def parse_namespaced(xml_path: Path, config: TXCParserConfig) -> TXCData:
+    """
+    Parse the namespaced tree directly
+    """
+    return parse_txc_from_element(
+        load_xml_data(xml_path, strip_namespaces=False), config
+    )
+
+
+def time_parser(
+    parser: Callable[[Path, TXCParserConfig], TXCData],
+    xml_paths: list[Path],
+    config: TXCParserConfig,
+    repeat: int,
+) -> float:
+    """
+    Best total time in seconds to parse all files
+    """
+    return min(
+        timeit.repeat(
+            lambda: [parser(xml_path, config) for xml_path in xml_paths],
+            number=1,
+            repeat=repeat,
+        )
+    )
+
+
+@app.command(name="txc-namespaces")
+def txc_namespaces(
+    paths: list[Path] = typer.Argument(
+        None,
+        help="Paths to XML files or directories, defaults to the test fixtures",
+    ),
+    repeat: int = typer.Option(5, "--repeat", "-r", help="Number of timed runs"),
+    log_json: bool = typer.Option(
+        False,
+        "--log-json",
+        help="Enable Structured logging output",
+    ),
+):
+    """
+    Compare parsing with strip_namespace against the namespace aware parsers
+    """
+    if log_json:
+        configure_logging()
+    xml_paths = get_xml_paths(paths or DEFAULT_FIXTURES)
+    config = TXCParserConfig.parse_all()
+
+    stripped = time_parser(parse_stripped, xml_paths, config, repeat)
+    namespaced = time_parser(parse_namespaced, xml_paths, config, repeat)
+
+    table = Table(title=f"TXC Parse ({len(xml_paths)} files, best of {repeat})")
+    table.add_column("Mode")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Relative", justify="right")
+    table.add_row("strip_namespace", f"{stripped:.4f}", "1.00x")
+    table.add_row(
+        "namespace aware", f"{namespaced:.4f}", f"{stripped / namespaced:.2f}x"
+    )
+    Console().print(table)
+
+
+def create_admin_areas(count: int) -> list[NaptanAdminArea]:
+    """
+    Unsaved rows for a table without foreign keys
+    """
+    return [
+        NaptanAdminArea(
+            name=f"Benchmark Admin Area {i}",
+            traveline_region_id="NE",
+            atco_code=f"BENCH{i}",
+            ui_lta_id=None,
+        )
+        for i in range(count)
+    ]
+
+
+def insert_add_flush(db: SqlDB, records: list[NaptanAdminArea]) -> None:
+    """
+    Previous bulk_insert: session.add per object then flush
+    """
+    with db.session_scope() as session:
+        session.add_all(records)
+        session.flush()
+
+
+def insert_returning(db: SqlDB, records: list[NaptanAdminArea]) -> None:
+    """
+    INSERT .. RETURNING id with insertmanyvalues batching
+    """
+    BaseRepositoryWithId(db, NaptanAdminArea).bulk_insert(records)
+
+
+def insert_copy(db: SqlDB, records: list[NaptanAdminArea]) -> None:
+    """
+    COPY FROM STDIN without returning IDs
+    """
+    BaseRepositoryWithId(db, NaptanAdminArea).bulk_insert_copy(records)
+
+
+def time_insert(
+    db: SqlDB,
+    inserter: Callable[[SqlDB, list[NaptanAdminArea]], None],
+    rows: int,
+    repeat: int,
+) -> float:
+    """
+    Best time in seconds to insert the rows, each run is rolled back
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        records = create_admin_areas(rows)
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        db._session_factory = sessionmaker(  # pylint: disable=protected-access
+            bind=connection
+        )
+        try:
+            start = time.perf_counter()
+            inserter(db, records)
+            timings.append(time.perf_counter() - start)
+        finally:
+            transaction.rollback()
+            connection.close()
+    return min(timings)
+
+
+@app.command(name="bulk-insert")
+def bulk_insert(
+    rows: int = typer.Option(10_000, "--rows", "-n", help="Rows inserted per run"),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Number of timed runs"),
+    use_dotenv: bool = typer.Option(
+        False, "--use-dotenv", help="Read the database config from .env"
+    ),
+    db_host: str = typer.Option("localhost", help="Database host"),
+    db_port: int = typer.Option(5432, help="Database port"),
+    db_name: str = typer.Option("bodds_test", help="Database name"),
+    db_user: str = typer.Option("bodds_test", help="Database user"),
+    db_password: str = typer.Option("password", help="Database password"),
+):
+    """
+    Compare bulk insert strategies against the local Postgres container
+    Every run is rolled back so the database is left unchanged
+    """
+    db = setup_db_instance(
+        create_db_config(use_dotenv, db_host, db_port, db_name, db_user, db_password)
+    )
+
+    add_flush = time_insert(db, insert_add_flush, rows, repeat)
+    returning = time_insert(db, insert_returning, rows, repeat)
+    copy = time_insert(db, insert_copy, rows, repeat)
+
+    table = Table(title=f"Bulk Insert ({rows} rows, best of {repeat})")
+    table.add_column("Mode")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows / s", justify="right")
+    table.add_column("Relative", justify="right")
+    for mode, seconds in [
+        ("session.add + flush", add_flush),
+        ("insert().returning", returning),
+        ("COPY FROM STDIN", copy),
+    ]:
+        table.add_row(
+            mode,
+            f"{seconds:.4f}",
+            f"{rows / seconds:,.0f}",
+            f"{add_flush / seconds:.2f}x",
+        )
+    Console().print(table)
+
+
+def create_offline_lookups(txc: TXCData) -> ReferenceDataLookups:
+    """
+    Lookups without NaPTAN, AnnotatedStopPointRefs are treated as missing stops
+    """
+    missing_atco_codes = [
+        stop.StopPointRef
+        for stop in txc.StopPoints
+        if isinstance(stop, AnnotatedStopPointRef)
+    ]
+    stops, flexible_zone_locations = create_stop_point_lookups(
+        txc.StopPoints, [], missing_atco_codes
+    )
+    return ReferenceDataLookups(
+        stops=stops,
+        flexible_zone_locations=flexible_zone_locations,
+        stop_activity_id_map={},
+        serviced_orgs={},
+        tracks={},
+    )
+
+
+def with_service_copies(txc: TXCData, copies: int) -> TXCData:
+    """
+    Repeat each Service with a new ServiceCode to make a multi service file
+    """
+    services = [
+        service.model_copy(update={"ServiceCode": f"{service.ServiceCode}-{i}"})
+        for service in txc.Services
+        for i in range(copies)
+    ]
+    return txc.model_copy(update={"Services": services})
+
+
+def map_per_service(documents: list[tuple[TXCData, ReferenceDataLookups]]) -> None:
+    """
+    Previous behaviour: the whole file is mapped for every service
+    """
+    for txc, lookups in documents:
+        for _ in txc.Services:
+            map_unique_journey_patterns(txc, lookups)
+
+
+def map_per_file(documents: list[tuple[TXCData, ReferenceDataLookups]]) -> None:
+    """
+    The mapping is built once and shared by every service
+    """
+    for txc, lookups in documents:
+        map_unique_journey_patterns(txc, lookups)
+
+
+@app.command(name="service-pattern-mapping")
+def service_pattern_mapping(
+    paths: list[Path] = typer.Argument(
+        None,
+        help="Paths to XML files or directories, defaults to the test fixtures",
+    ),
+    copies: int = typer.Option(
+        10, "--copies", "-c", help="Copies of each Service in the file"
+    ),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Number of timed runs"),
+):
+    """
+    Compare mapping journey patterns once per service against once per file
+    """
+    xml_paths = get_xml_paths(paths or DEFAULT_FIXTURES)
+    config = TXCParserConfig.parse_all()
+    documents: list[tuple[TXCData, ReferenceDataLookups]] = []
+    for xml_path in xml_paths:
+        try:
+            txc = with_service_copies(parse_namespaced(xml_path, config), copies)
+            lookups = create_offline_lookups(txc)
+            map_unique_journey_patterns(txc, lookups)
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.warning("Skipping file that can't be mapped", path=str(xml_path))
+            continue
+        if txc.Services and txc.VehicleJourneys:
+            documents.append((txc, lookups))
+
+    timings = [
+        (
+            name,
+            min(
+                timeit.repeat(
+                    lambda mapper=mapper: mapper(documents), number=1, repeat=repeat
+                )
+            ),
+        )
+        for name, mapper in [
+            ("once per service", map_per_service),
+            ("once per file", map_per_file),
+        ]
+    ]
+
+    services = sum(len(txc.Services) for txc, _ in documents)
+    table = Table(
+        title=(
+            f"Service Pattern Mapping ({len(documents)} files, "
+            f"{services} services, best of {repeat})"
+        )
+    )
+    table.add_column("Mode")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Relative", justify="right")
+    baseline = timings[0][1]
+    for mode, seconds in timings:
+        table.add_row(mode, f"{seconds:.4f}", f"{baseline / seconds:.2f}x")
+    Console().print(table)
+
+
+def with_route_section_copies(xml_path: Path, copies: int, output: Path) -> None:
+    """
+    Write the TXC file with its RouteSections repeated to make a large file
+    Each copy gets new ids so the file stays valid against the schema
+    """
+    data = xml_path.read_bytes()
+    start = data.index(b"<RouteSections>") + len(b"<RouteSections>")
+    end = data.index(b"</RouteSections>")
+    route_sections = data[start:end]
+    with output.open("wb") as file_:
+        file_.write(data[:end])
+        for i in range(copies):
+            file_.write(re.sub(rb'id="([^"]+)"', rb'id="\1-%d"' % i, route_sections))
+        file_.write(data[end:])
+
+
+def validate_tree(xml_path: Path) -> int:
+    """
+    Current path: parse the whole tree then validate it
+    """
+    with xml_path.open("rb") as file_:
+        xml_root = parse(file_).getroot()
+    schema = load_schema(*get_xml_type(xml_root))
+    return len(get_schema_violations(schema, xml_root, 0, xml_path.name))
+
+
+def validate_streaming(xml_path: Path) -> int:
+    """
+    Streaming path: validate while parsing, dropping elements as they end
+    """
+    with xml_path.open("rb") as file_:
+        xml_root, head_chunks = read_xml_root(file_)
+        schema = load_schema(*get_xml_type(xml_root))
+        return len(
+            stream_schema_violations(
+                schema, chain(head_chunks, iter_chunks(file_)), 0, xml_path.name
+            )
+        )
+
+
+def read_memory_kib(field: str) -> int:
+    """
+    Memory field from /proc/self/status in KiB, e.g. VmRSS or VmHWM
+    """
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1])
+    raise KeyError(field)
+
+
+def run_measured(
+    validator: Callable[[Path], int], xml_path: Path
+) -> tuple[float, int, int]:
+    """
+    Run the validator, returning the seconds, the peak RSS growth in KiB
+    and the number of violations
+    """
+    rss_start = read_memory_kib("VmRSS")
+    start = time.perf_counter()
+    violations = validator(xml_path)
+    seconds = time.perf_counter() - start
+    return seconds, read_memory_kib("VmHWM") - rss_start, violations
+
+
+def measure_validator(
+    validator: Callable[[Path], int], xml_path: Path
+) -> tuple[float, int, int]:
+    """
+    Run the validator in a forked process so each mode starts from the same RSS
+    The schema is compiled before forking so its memory isn't counted
+    """
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(run_measured, (validator, xml_path))
+
+
+@app.command(name="schema-validation")
+def schema_validation(
+    xml_path: Path = typer.Argument(
+        DEFAULT_SCHEMA_FIXTURE, help="TXC or NeTEx file to validate"
+    ),
+    copies: int = typer.Option(
+        20,
+        "--copies",
+        "-c",
+        help="Copies of the RouteSections to add to a TXC file, 0 to use it as is",
+    ),
+):
+    """
+    Compare peak memory of tree and streaming schema validation
+    Linux only, memory is read from /proc/self/status
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if copies:
+            large_path = Path(tmp_dir) / xml_path.name
+            with_route_section_copies(xml_path, copies, large_path)
+            xml_path = large_path
+        validate_tree(DEFAULT_SCHEMA_FIXTURE)
+
+        results = [
+            (mode, *measure_validator(validator, xml_path))
+            for mode, validator in [
+                ("tree", validate_tree),
+                ("streaming", validate_streaming),
+            ]
+        ]
+        size_mib = xml_path.stat().st_size / 1024 / 1024
+
+    table = Table(title=f"Schema Validation ({size_mib:.1f} MiB file)")
+    table.add_column("Mode")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Peak RSS growth (MiB)", justify="right")
+    table.add_column("Violations", justify="right")
+    baseline = results[0][2]
+    for mode, seconds, peak_kib, violations in results:
+        table.add_row(
+            mode,
+            f"{seconds:.2f}",
+            f"{peak_kib / 1024:.1f} ({peak_kib / max(baseline, 1):.2f}x)",
+            str(violations),
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -27,6 +27,7 @@ class TestConfig:
     db_config: DbConfig
     parallel: bool = False
     max_workers: int = 10
+    parallel_sections: bool = False
     create_tables: bool = False
     task_id: int | None = None
     file_attributes_id: int | None = None
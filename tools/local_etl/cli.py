@@ -58,6 +58,11 @@ def main(
         "--max-workers",
         help="Maximum number of parallel workers (only used if --parallel is set)",
     ),
+    parallel_sections: bool = typer.Option(
+        False,
+        "--parallel-sections",
+        help="Parse the sections of each TXC file in a process pool",
+    ),
     log_json: bool = typer.Option(
         False,
         "--log-json",
@@ -114,6 +119,7 @@ def main(
         db_config=db_config,
         parallel=parallel,
         max_workers=max_workers,
+        parallel_sections=parallel_sections,
         create_tables=create_tables,
         task_id=task_id,
         file_attributes_id=file_attributes_id,
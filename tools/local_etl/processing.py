@@ -57,7 +57,14 @@ def process_single_file(config: TestConfig, file_path: Path) -> TimingStats:
     try:
         # Time parsing
         parse_start = time.time()
-        txc = parse_txc_file(file_path, PARSER_CONFIG)
+        parser_config = (
+            PARSER_CONFIG.model_copy(
+                update={"streaming": False, "parallel_sections": True}
+            )
+            if config.parallel_sections
+            else PARSER_CONFIG
+        )
+        txc = parse_txc_file(file_path, parser_config)
         stats.parse_time = time.time() - parse_start
 
         # Time transformation
@@ -53,7 +53,9 @@ def get_txc_object(**kwargs: dict[str, Any]) -> XmlTxcInventory | XmlTxcParserEr
         "Parsing XML File with TxC parser", filename=filename, parent_zip=parent_zip
     )
     try:
-        txc_object = parse_txc_from_element(load_xml_data(xml_file))
+        txc_object = parse_txc_from_element(
+            load_xml_data(xml_file, strip_namespaces=False)
+        )
         return generate_txc_row_data(txc_object, filename)
     except Exception as err:  # pylint: disable=broad-except
         log.warning(